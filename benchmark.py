@@ -0,0 +1,1427 @@
+"""Benchmark entry point: runs the app headless under the Qt offscreen platform
+with the actual shutdown call stubbed out (as in test_live.py) and reports
+timings as JSON, so regressions show up as numbers. Not part of the shipped app.
+
+Run with:
+    .venv\\Scripts\\python benchmark.py startup --runs 20
+    .venv\\Scripts\\python benchmark.py startup --no-preflight
+    .venv\\Scripts\\python benchmark.py idle-wakeups
+    .venv\\Scripts\\python benchmark.py press --disk-latency-ms 200
+    .venv\\Scripts\\python benchmark.py slow-dispatch
+    .venv\\Scripts\\python benchmark.py dispatch --backend api --real
+    .venv\\Scripts\\python benchmark.py glow-refresh
+    .venv\\Scripts\\python benchmark.py filter-calls
+    .venv\\Scripts\\python benchmark.py hotpaths --output baseline.json
+    .venv\\Scripts\\python benchmark.py resident
+    .venv\\Scripts\\python benchmark.py glow-keyframes
+    .venv\\Scripts\\python benchmark.py scanline-texture
+    .venv\\Scripts\\python benchmark.py drift-repaints
+    .venv\\Scripts\\python benchmark.py single-canvas
+    .venv\\Scripts\\python benchmark.py key-latency
+    .venv\\Scripts\\python benchmark.py quality-governor
+    .venv\\Scripts\\python benchmark.py cli
+    .venv\\Scripts\\python benchmark.py handoff
+    .venv\\Scripts\\python benchmark.py hotpaths --compare baseline.json
+
+Check-style commands (idle-wakeups, slow-dispatch, resident, glow-keyframes, scanline-texture,
+drift-repaints, single-canvas, key-latency, quality-governor, cli, handoff, hotpaths --compare) exit non-zero when the behaviour they
+guard is broken.
+"""
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+STARTUP_PHASES = ('interpreter', 'import', 'qapplication', 'load_bundled_fonts', 'init_ui',
+                  'load_pending_epoch', 'app_init', 'show_event', 'first_paint', 'first_frame')
+# StartupPreflight's tasks, on worker threads alongside the phases above
+PREFLIGHT_PHASES = ('read fonts', 'decode icon', 'load_pending_epoch', 'scanline texture')
+PUMP_TIMER = 'benchmark-pump'
+APPLICATION = None  # The in-process benchmarks' QApplication, once made
+HOTPATH_SCALES = (1.0, 1.25, 1.5, 2.0)
+HOTPATH_WARMUP_CALLS = 20
+HANDOFF_CHILD_LIFETIME_MS = 120_000  # The handoff check's running instance quits on its own after this
+
+
+def fake_execute_shutdown_command(seconds, epoch):
+    print(f"[BENCHMARK] Would have run: shutdown /s /t {seconds}  -- not actually run", file=sys.stderr)
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile; exact for the small run counts used here"""
+    ordered = sorted(samples)
+    return ordered[max(1, math.ceil(len(ordered) * fraction)) - 1]
+
+
+def summarise(samples):
+    return {'median_ms': round(percentile(samples, 0.5), 3),
+            'p95_ms': round(percentile(samples, 0.95), 3)}
+
+
+def offscreen_environment():
+    env = dict(os.environ)
+    env['QT_QPA_PLATFORM'] = 'offscreen'
+    return env
+
+
+def launch_in_process(single_canvas=False, governed=False):
+    """The app in this very process, headless, shutdown stubbed and shown.
+    Unless governed, the quality governor never starts, so every benchmark
+    runs at full quality however loaded the machine is"""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    import main as m
+    from PyQt6.QtGui import QIcon
+
+    app = application()
+    app.setWindowIcon(QIcon(m.resource_path('assets', 'icon.png')))
+    m.load_bundled_fonts()
+    window = m.LifeControlButtonApp()
+    window.execute_shutdown_command = fake_execute_shutdown_command
+    if not governed:
+        window.quality_governor.start = lambda: None
+    if single_canvas:
+        window.use_single_canvas()
+    window.show()
+    pump(300)
+    return m, app, window
+
+
+def application():
+    """This process's QApplication, made on first use and kept here: one that
+    nothing references is deleted"""
+    global APPLICATION
+    from PyQt6.QtWidgets import QApplication
+    APPLICATION = QApplication.instance() or QApplication(sys.argv[:1])
+    return APPLICATION
+
+
+def pump(ms):
+    """Run the event loop for a while, timers and all, as app.exec() would"""
+    from PyQt6.QtCore import QEventLoop, QTimer
+    loop = QEventLoop()
+    timer = QTimer(loop, singleShot=True, objectName=PUMP_TIMER)
+    timer.timeout.connect(loop.quit)
+    timer.start(ms)
+    loop.exec()
+
+
+class EventCounter:
+    """Counts events of the given types process-wide, per receiver class"""
+
+    def __init__(self, app, *event_types):
+        from PyQt6.QtCore import QObject
+
+        counter = self
+
+        class Filter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() in event_types and obj.objectName() != PUMP_TIMER:
+                    name = type(obj).__name__
+                    counter.counts[name] = counter.counts.get(name, 0) + 1
+                return False
+
+        self.counts = {}
+        self.filter = Filter()
+        app.installEventFilter(self.filter)
+
+    def total(self):
+        return sum(self.counts.values())
+
+    def reset(self):
+        self.counts.clear()
+
+
+def cloak(window, cloaked):
+    """Cloak the window the way DWM does for one on another virtual desktop"""
+    import ctypes
+    from ctypes import wintypes
+    DWMWA_CLOAK = 13
+    ctypes.WinDLL('dwmapi').DwmSetWindowAttribute(wintypes.HWND(int(window.winId())), DWMWA_CLOAK,
+                                                  ctypes.byref(wintypes.BOOL(cloaked)), ctypes.sizeof(wintypes.BOOL))
+
+
+def run_idle_wakeups(args):
+    """Timer wakeups while the window is visible, hidden, minimised and (on
+    the real Windows platform, QT_QPA_PLATFORM=windows) cloaked, with a
+    countdown running, plus how far the card pulse drifted out of phase
+    across each stretch out of sight. All but visible must be zero"""
+    from PyQt6.QtCore import QEvent
+    m, app, window = launch_in_process()
+    window.enter_countdown_mode(time.time() + 3600)
+    counter = EventCounter(app, QEvent.Type.Timer)
+    pump(args.seconds * 1000)
+    report = {'benchmark': 'idle-wakeups', 'visible_wakeups': counter.total()}
+
+    states = [('hidden', window.hide, window.show),
+              ('minimized', window.showMinimized, window.showNormal)]
+    if app.platformName() == 'windows':
+        states.append(('cloaked', lambda: cloak(window, True), lambda: cloak(window, False)))
+    for state, hide, show in states:
+        phase = window.pulse_animation.currentTime()
+        hide()
+        pump(100)  # Let the hide settle before counting
+        counter.reset()
+        pump(args.seconds * 1000)
+        report[f'{state}_wakeups'] = dict(counter.counts)
+        show()
+        pump(50)
+        report[f'{state}_phase_drift_ms'] = window.pulse_animation.currentTime() - phase
+
+    report['passed'] = not any(report[f'{state}_wakeups'] for state, _, _ in states) \
+        and window.pulse_animation.state() == window.pulse_animation.State.Running
+    return report
+
+
+def legacy_save_scheduled_epoch(schedule, epoch):
+    """The schedule note as it was written before the state store: in place,
+    on the UI thread"""
+    os.makedirs(os.path.dirname(schedule.schedule_state_path()), exist_ok=True)
+    with open(schedule.schedule_state_path(), 'w', encoding='ascii') as state_file:
+        state_file.write(str(int(epoch)))
+
+
+def run_press(args):
+    """UI-thread time per press: the press handler, and noting the schedule
+    when written in place (as before the state store) or handed to the
+    store's writer. --disk-latency-ms stands in for a slow disk or a scanner
+    holding the file, on both paths"""
+    os.environ['LOCALAPPDATA'] = tempfile.mkdtemp(prefix='lcb-benchmark-')
+    m, app, window = launch_in_process()
+    import shutdown_schedule as schedule
+    latency = args.disk_latency_ms / 1000
+
+    write_atomically = schedule.write_file_atomically
+
+    def slow_write_atomically(path, text):
+        time.sleep(latency)
+        write_atomically(path, text)
+    schedule.write_file_atomically = slow_write_atomically
+
+    def inline(epoch):
+        time.sleep(latency)
+        legacy_save_scheduled_epoch(schedule, epoch)
+
+    report = {'benchmark': 'press', 'presses': args.presses, 'disk_latency_ms': args.disk_latency_ms}
+    for variant, save in (('inline', inline), ('store', schedule.save_scheduled_epoch)):
+        handler, noting = [], []
+        for _ in range(args.presses):
+            start = time.perf_counter()
+            window.dispatch_shutdown()
+            handler.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            save(time.time() + 60)
+            noting.append((time.perf_counter() - start) * 1000)
+            pump(20)
+        schedule.SCHEDULE_STATE.flush()
+        report[variant] = {'press_handler': summarise(handler), 'schedule_note': summarise(noting)}
+    return report
+
+
+def run_slow_dispatch(args):
+    """Press against a shutdown backend stubbed to take --delay-ms: the card
+    must keep painting while it runs, the window must wait for it before
+    closing, and a failing backend must bring back the idle button with the
+    error dialog (recorded here rather than shown)"""
+    from PyQt6.QtCore import QEvent
+    from shutdown_schedule import ShutdownError
+    m, app, window = launch_in_process()
+    delay = args.delay_ms / 1000
+    errors = []
+    m.QMessageBox.critical = lambda parent, title, text: errors.append(text)
+
+    def slow_success(seconds, epoch):
+        time.sleep(delay)
+
+    def slow_failure(seconds, epoch):
+        time.sleep(delay)
+        raise ShutdownError("Access is denied.(5)")
+
+    counter = EventCounter(app, QEvent.Type.Paint)
+    report = {'benchmark': 'slow-dispatch', 'delay_ms': args.delay_ms}
+
+    window.execute_shutdown_command = slow_failure
+    start = time.perf_counter()
+    window.dispatch_shutdown()
+    report['press_handler_ms'] = round((time.perf_counter() - start) * 1000, 3)
+    pump(args.delay_ms + 200)
+    report['failure'] = {'scanline_paints': counter.counts.get('ScanlineOverlay', 0),
+                         'error_shown': bool(errors),
+                         'button_restored': window.control_button.isEnabled()
+                         and window.control_button.text() == "GET LIFE CONTROL"}
+
+    counter.reset()
+    window.execute_shutdown_command = slow_success
+    window.dispatch_shutdown()
+    pump(args.delay_ms)
+    report['success'] = {'scanline_paints': counter.counts.get('ScanlineOverlay', 0),
+                         'open_while_dispatching': window.isVisible()}
+    pump(m.EXIT_DELAY_MS)
+    report['success']['closed_after'] = not window.isVisible()
+
+    # Even a slow machine paints the surge well over ten times a second
+    enough_paints = args.delay_ms / 100
+    report['passed'] = report['press_handler_ms'] < args.delay_ms / 2 \
+        and report['failure']['scanline_paints'] >= enough_paints and report['failure']['error_shown'] \
+        and report['failure']['button_restored'] and report['success']['scanline_paints'] >= enough_paints \
+        and report['success']['open_while_dispatching'] and report['success']['closed_after']
+    return report
+
+
+def run_dispatch(args):
+    """Time one schedule() call per run on the chosen shutdown backend. The
+    api and command backends really schedule a shutdown (an hour out) and
+    abort it straight after, so they only run with --real"""
+    import shutdown_schedule
+    if args.backend != 'record' and not args.real:
+        sys.exit(f"The {args.backend} backend schedules a real shutdown; pass --real to allow it")
+    backend = shutdown_schedule.SHUTDOWN_BACKENDS[args.backend]()
+    samples = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        backend.schedule(3600)
+        samples.append((time.perf_counter() - start) * 1000)
+        backend.abort()
+    return {'benchmark': 'dispatch', 'backend': args.backend, 'runs': args.runs, 'schedule': summarise(samples)}
+
+
+def run_glow_refresh(args):
+    """Cost of refresh_display_glow(flare=True), the call every keypress and
+    section switch makes, with the text heat set through palettes and, as
+    before them, through per-call style sheets. The section alternates so
+    every call really changes colours"""
+    from PyQt6.QtWidgets import QTimeEdit
+    m, app, window = launch_in_process()
+    window.time_edit.setFocus()
+    pump(100)
+    palette_heat = m.LifeControlButtonApp.set_label_heat
+
+    def stylesheet_heat(self, label, colour):
+        label.setStyleSheet(f"color: {colour}; background: transparent;")
+
+    report = {'benchmark': 'glow-refresh', 'calls': args.calls}
+    # Palettes first: once a label has a style sheet, it overrides any palette
+    for variant, set_label_heat in (('palette', palette_heat), ('stylesheet', stylesheet_heat)):
+        m.LifeControlButtonApp.set_label_heat = set_label_heat
+        samples = []
+        for call in range(args.calls):
+            window.time_edit.setSelectedSection(QTimeEdit.Section.HourSection if call % 2
+                                                else QTimeEdit.Section.MinuteSection)
+            start = time.perf_counter()
+            window.refresh_display_glow(flare=True)
+            samples.append((time.perf_counter() - start) * 1000)
+            app.processEvents()
+        report[variant] = summarise(samples)
+    m.LifeControlButtonApp.set_label_heat = palette_heat
+    return report
+
+
+def run_filter_calls(args):
+    """Python eventFilter calls a second with the key filter scoped to the
+    focusable widgets, and with it also installed application-wide as it
+    used to be, over idle animation plus a burst of typing"""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtTest import QTest
+    import main as m
+    calls = [0]
+    event_filter = m.LifeControlButtonApp.eventFilter
+
+    def counting_filter(self, obj, event):
+        calls[0] += 1
+        return event_filter(self, obj, event)
+    m.LifeControlButtonApp.eventFilter = counting_filter
+
+    m, app, window = launch_in_process()
+    window.time_edit.setFocus()
+    report = {'benchmark': 'filter-calls', 'seconds': args.seconds}
+    for variant in ('scoped', 'application'):
+        if variant == 'application':
+            app.installEventFilter(window)
+        calls[0] = 0
+        start = time.perf_counter()
+        pump(args.seconds * 1000)
+        for digit in '2130' * 5:
+            QTest.keyClick(window.time_edit, Qt.Key(ord(digit)))
+            pump(20)
+        report[variant] = {'calls_per_s': round(calls[0] / (time.perf_counter() - start), 1)}
+    app.removeEventFilter(window)
+    report['removed_per_s'] = round(report['application']['calls_per_s'] - report['scoped']['calls_per_s'], 1)
+    return report
+
+
+def hotpath_cases(m, app, window):
+    """(name, call) pairs, each call taking the iteration number. Grouped by
+    the input mode they need, switching to the duration input half way"""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QColor, QPixmap
+
+    overlay = window.scanline_overlay
+    dpr = overlay.devicePixelRatioF()
+    # A bare paintEvent needs an active paint device; render() drives it into
+    # an offscreen pixmap at the screen's scale, without the window's backing store
+    canvas = QPixmap(round(overlay.width() * dpr), round(overlay.height() * dpr))
+    canvas.setDevicePixelRatio(dpr)
+    canvas.fill(Qt.GlobalColor.transparent)
+    idle_dots = QColor(0, 0, 0, m.SCANLINE_DOT_ALPHA)
+    animator = window.hour_glow
+    animator.frames = m.glow_keyframes(m.TIME_GLOW_FLARE, m.TIME_GLOW_BASE, m.ember_curve,
+                                       m.FOCUS_TRANSITION_MS, animator.blur_quantum())
+    spin = window.duration_spinbox
+
+    def enter_duration_mode():
+        window.radio_after_time.setChecked(True)
+        pump(50)
+        spin.setValue(90)
+
+    def refresh_glow(i):
+        spin.minutes_section_active = bool(i % 2)  # Really change colours every call
+        window.refresh_display_glow(flare=True)
+
+    return [
+        ('ScanlineOverlay.paintEvent', lambda i: overlay.render(canvas)),
+        ('ScanlineOverlay.build_tile', lambda i: overlay.build_tile(idle_dots)),
+        ('GlowAnimator.apply_frame', lambda i: animator.apply_frame(i * 16 % (m.FOCUS_TRANSITION_MS + 1))),
+        ('GlowAnimator.snapped_blur', lambda i: animator.snapped_blur(i % 40 * 0.37)),
+        ('layout_time_overlay', lambda i: window.layout_time_overlay()),
+        (None, enter_duration_mode),
+        ('DurationSpinBox.stepBy', lambda i: spin.stepBy(1 if i % 2 else -1)),
+        ('DurationSpinBox.apply_typed_digit', lambda i: spin.apply_typed_digit(i % 10)),
+        ('DurationSpinBox.select_active_section', lambda i: spin.select_active_section()),
+        ('refresh_display_glow', refresh_glow),
+        ('layout_duration_overlay', lambda i: window.layout_duration_overlay()),
+    ]
+
+
+def hotpaths_child(calls):
+    """Time each hot path in this process at whatever QT_SCALE_FACTOR the
+    parent set, printing per-call microseconds as a single JSON line. Events
+    the calls post (repaints, glow updates) are processed between batches,
+    outside the timed region"""
+    m, app, window = launch_in_process()
+    results = {'dpr': window.devicePixelRatioF()}
+    for name, call in hotpath_cases(m, app, window):
+        if name is None:
+            call()
+            continue
+        samples = []
+        for i in range(HOTPATH_WARMUP_CALLS + calls):
+            start = time.perf_counter()
+            call(i)
+            elapsed = (time.perf_counter() - start) * 1e6
+            if i >= HOTPATH_WARMUP_CALLS:
+                samples.append(elapsed)
+            if i % 50 == 49:
+                app.processEvents()
+        app.processEvents()
+        results[name] = {'median_us': round(percentile(samples, 0.5), 2),
+                         'p95_us': round(percentile(samples, 0.95), 2)}
+    print(json.dumps(results))
+
+
+def compare_hotpaths(report, baseline, tolerance):
+    """Median ratio against the baseline for every (scale, hot path) both
+    runs have; above 1 + tolerance counts as a regression"""
+    comparison, regressions = {}, []
+    for scale, cases in report['scales'].items():
+        for name, result in cases.items():
+            before = baseline.get('scales', {}).get(scale, {}).get(name)
+            if name == 'dpr' or not before or not before['median_us']:
+                continue
+            ratio = round(result['median_us'] / before['median_us'], 3)
+            comparison.setdefault(scale, {})[name] = {'baseline_median_us': before['median_us'],
+                                                      'median_us': result['median_us'], 'ratio': ratio}
+            if ratio > 1 + tolerance:
+                regressions.append(f"{name} @ {scale}")
+    return comparison, regressions
+
+
+def run_per_scale(scales, *command):
+    """Run a child subcommand once per display scale (QT_SCALE_FACTOR is only
+    read at QApplication startup), collecting the JSON line each prints"""
+    results = {}
+    for scale in scales:
+        env = offscreen_environment()
+        env['QT_SCALE_FACTOR'] = str(scale)
+        result = subprocess.run([sys.executable, os.path.abspath(__file__), *command],
+                                env=env, capture_output=True, text=True)
+        if result.returncode != 0:
+            sys.exit(f"Launch failed:\n{result.stderr.strip()}")
+        results[str(scale)] = json.loads(result.stdout.strip().splitlines()[-1])
+    return results
+
+
+def run_hotpaths(args):
+    """Per-call cost of the rendering and input hot paths, one child process
+    per display scale"""
+    report = {'benchmark': 'hotpaths', 'calls': args.calls,
+              'scales': run_per_scale(args.scales, 'hotpaths-child', str(args.calls))}
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline.get('benchmark') != 'hotpaths':
+            sys.exit(f"{args.compare} is not a hotpaths report")
+        report['comparison'], report['regressions'] = compare_hotpaths(report, baseline, args.tolerance)
+        report['passed'] = not report['regressions']
+    return report
+
+
+def run_resident(args):
+    """Show latency from resident standby: close (which only hides), then
+    time come_forward() to the window's first paint, idle and again after a
+    press. Checks the process stays up, no timer fires on standby and a
+    shown window counts down to the shutdown it scheduled"""
+    from PyQt6.QtCore import QEvent, QObject
+    from shutdown_schedule import RecordingBackend
+    m, app, window = launch_in_process()
+    window.resident = True
+    app.setQuitOnLastWindowClosed(False)
+    window.shutdown_backend = RecordingBackend()
+    painted = []
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint and not painted:
+                painted.append(time.perf_counter())
+            return False
+    paint_watch = FirstPaint()
+    window.installEventFilter(paint_watch)
+
+    def show_latencies():
+        samples, standby_wakeups = [], {}
+        for _ in range(args.shows):
+            window.close()
+            pump(600)  # Let the hide settle, and a focus retry already queued go off
+            counter = EventCounter(app, QEvent.Type.Timer)
+            pump(100)
+            for name, count in counter.counts.items():
+                standby_wakeups[name] = standby_wakeups.get(name, 0) + count
+            app.removeEventFilter(counter.filter)
+            painted.clear()
+            start = time.perf_counter()
+            window.come_forward()
+            while not painted:
+                app.processEvents()
+            samples.append((painted[0] - start) * 1000)
+            pump(20)
+        return samples, standby_wakeups
+
+    report = {'benchmark': 'resident', 'shows': args.shows}
+    samples, report['idle_standby_wakeups'] = show_latencies()
+    report['idle_show'] = summarise(samples)
+
+    window.dispatch_shutdown()
+    pump(m.EXIT_DELAY_MS + 200)
+    report['hidden_after_press'] = not window.isVisible()
+    samples, report['countdown_standby_wakeups'] = show_latencies()
+    report['countdown_show'] = summarise(samples)
+    report['countdown_shown'] = window.control_button.text().startswith("SHUTDOWN IN")
+
+    report['passed'] = report['hidden_after_press'] and report['countdown_shown'] \
+        and not report['idle_standby_wakeups'] and not report['countdown_standby_wakeups']
+    return report
+
+
+def legacy_glow_frames(m, start_state, target_state, curve, duration_ms, dpr):
+    """A glow transition's frame at every millisecond as GlowAnimator worked
+    it out before the keyframe tables: the animation eases its 0..1 value
+    through the curve, then blur and alpha are interpolated and snapped"""
+    from PyQt6.QtCore import QVariantAnimation
+    animation = QVariantAnimation()
+    animation.setStartValue(0.0)
+    animation.setEndValue(1.0)
+    animation.setDuration(duration_ms)
+    animation.setEasingCurve(curve())
+    quantum = next((q for q in (1, 2, 4, 8) if dpr * q == round(dpr * q)), 4)
+    frames = []
+    for ms in range(duration_ms + 1):
+        animation.setCurrentTime(ms)
+        t = animation.currentValue()
+        blur = start_state[0] + (target_state[0] - start_state[0]) * t
+        alpha = start_state[1] + (target_state[1] - start_state[1]) * t
+        frames.append((round(max(0.0, blur) / quantum) * quantum, max(0, min(255, round(alpha)))))
+    return frames
+
+
+def run_glow_keyframes(args):
+    """Check the keyframe tables reproduce the frames GlowAnimator computed
+    on every tick before them, for every transition between the *_GLOW_*
+    states of a family, both curves, every duration in use and each
+    display scale; and time a frame both ways"""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    import main as m
+    from PyQt6.QtWidgets import QGraphicsDropShadowEffect
+    application()
+
+    families = {}
+    for name, value in vars(m).items():
+        if '_GLOW_' in name and isinstance(value, tuple):
+            families.setdefault(name.split('_GLOW_')[0], []).append(value)
+    durations = (m.FLARE_TRANSITION_MS, m.SECTION_FADE_MS, m.FOCUS_TRANSITION_MS, m.EXIT_DELAY_MS)
+    report = {'benchmark': 'glow-keyframes', 'transitions': 0, 'frames': 0, 'mismatches': []}
+    for states in families.values():
+        for start_state in states:
+            for target_state in states:
+                for curve in (m.ember_curve, m.punch_curve):
+                    for duration_ms in durations:
+                        for dpr in HOTPATH_SCALES:
+                            expected = legacy_glow_frames(m, start_state, target_state, curve, duration_ms, dpr)
+                            actual = m.glow_keyframes(start_state, target_state, curve, duration_ms,
+                                                      m.blur_quantum(dpr))
+                            report['transitions'] += 1
+                            report['frames'] += len(expected)
+                            if list(actual) != expected:
+                                report['mismatches'].append(f"{start_state} -> {target_state}, {curve.__name__}, "
+                                                            f"{duration_ms} ms @ {dpr}")
+
+    # One tick of a focus transition, the old way and by lookup
+    effect = QGraphicsDropShadowEffect()
+    animator = m.GlowAnimator(effect)
+    animator.transition_to(*m.TIME_GLOW_HOT, m.FOCUS_TRANSITION_MS)
+    legacy = m.GlowAnimator(QGraphicsDropShadowEffect())
+    legacy_animation = legacy.animation
+    legacy_animation.valueChanged.disconnect()
+    legacy_animation.setEasingCurve(m.ember_curve())
+    legacy_animation.setEndValue(1.0)
+    legacy_animation.setDuration(m.FOCUS_TRANSITION_MS)
+
+    def legacy_apply(t):
+        blur = legacy.start_state[0] + (legacy.target_state[0] - legacy.start_state[0]) * t
+        alpha = legacy.start_state[1] + (legacy.target_state[1] - legacy.start_state[1]) * t
+        legacy.effect.setBlurRadius(legacy.snapped_blur(max(0.0, blur)))
+        legacy.effect.setColor(m.QColor(251, 54, 64, max(0, min(255, round(alpha)))))
+    legacy.target_state = m.TIME_GLOW_HOT
+    legacy_animation.valueChanged.connect(legacy_apply)
+
+    # Both ticks as FrameAnimation.advance makes them: set the time, and the
+    # valueChanged handler does the rest
+    for variant, animation in (('computed', legacy_animation), ('table', animator.animation)):
+        samples = []
+        for call in range(args.calls):
+            start = time.perf_counter()
+            animation.setCurrentTime(call * 16 % (m.FOCUS_TRANSITION_MS + 1))
+            samples.append((time.perf_counter() - start) * 1e6)
+        report[f'{variant}_frame_us'] = {'median_us': round(percentile(samples, 0.5), 2),
+                                         'p95_us': round(percentile(samples, 0.95), 2)}
+    animator.animation.stop()
+    report['passed'] = not report['mismatches']
+    return report
+
+
+def legacy_scanline_paint(self, event):
+    """ScanlineOverlay.paintEvent as it was before the card texture: clip to
+    the rounded card and tile the dot across it, every frame"""
+    from PyQt6.QtCore import QPointF, QRectF
+    from PyQt6.QtGui import QPainter, QPainterPath
+    import main as m
+    painter = QPainter(self)
+    clip = QPainterPath()
+    clip.addRoundedRect(QRectF(self.rect()), m.CARD_CORNER_RADIUS, m.CARD_CORNER_RADIUS)
+    painter.setClipPath(clip)
+    dpr = self.devicePixelRatioF()
+    painter.scale(1 / dpr, 1 / dpr)
+    pitch = self.tile.width()
+    painter.drawTiledPixmap(QRectF(0, 0, self.width() * dpr, self.height() * dpr),
+                            self.tile, QPointF(0, (pitch - self.drift_offset) % pitch))
+
+
+def scanline_texture_child(calls):
+    """At this process's display scale, compare the overlay painted from the
+    card texture with the old clip-and-tile paint at every drift offset of
+    the idle, blip and surge colours, then time a paint both ways"""
+    from PyQt6.QtGui import QColor, QPixmap
+    m, app, window = launch_in_process()
+    overlay = window.scanline_overlay
+    overlay.drift_animation.stop()
+    texture_paint = m.ScanlineOverlay.paintEvent
+    dpr = overlay.devicePixelRatioF()
+    canvas = QPixmap(round(overlay.width() * dpr), round(overlay.height() * dpr))
+    canvas.setDevicePixelRatio(dpr)
+
+    def painted(paint_event):
+        m.ScanlineOverlay.paintEvent = paint_event
+        return overlay.grab().toImage()
+
+    results = {'dpr': dpr, 'offsets': 0, 'mismatches': []}
+    for colour in (QColor(0, 0, 0, m.SCANLINE_DOT_ALPHA), QColor(251, 54, 64, m.BLIP_DOT_ALPHA),
+                   QColor(251, 54, 64, 200)):
+        overlay.tile = overlay.build_tile(colour)
+        for offset in range(overlay.tile.width()):
+            overlay.drift_offset = offset
+            results['offsets'] += 1
+            if painted(texture_paint) != painted(legacy_scanline_paint):
+                results['mismatches'].append(f"{colour.name(QColor.NameFormat.HexArgb)} at offset {offset}")
+
+    overlay.tile = overlay.build_tile(QColor(0, 0, 0, m.SCANLINE_DOT_ALPHA))
+    for variant, paint_event in (('clip_and_tile', legacy_scanline_paint), ('texture', texture_paint)):
+        m.ScanlineOverlay.paintEvent = paint_event
+        samples = []
+        for call in range(calls):
+            overlay.drift_offset = call % overlay.tile.width()
+            canvas.fill()
+            start = time.perf_counter()
+            overlay.render(canvas)
+            samples.append((time.perf_counter() - start) * 1e6)
+        results[f'{variant}_paint_us'] = {'median_us': round(percentile(samples, 0.5), 2),
+                                          'p95_us': round(percentile(samples, 0.95), 2)}
+    m.ScanlineOverlay.paintEvent = texture_paint
+    print(json.dumps(results))
+
+
+def run_scanline_texture(args):
+    """Check the pre-rendered card texture paints exactly what clipping and
+    tiling did, at each display scale, and time both"""
+    report = {'benchmark': 'scanline-texture', 'calls': args.calls,
+              'scales': run_per_scale(args.scales, 'scanline-texture-child', str(args.calls))}
+    report['passed'] = not any(scale['mismatches'] for scale in report['scales'].values())
+    return report
+
+
+def run_drift_repaints(args):
+    """Paints per widget for each scanline drift step, and the step's frame
+    time, with glowing widgets' renderings kept (as now) and re-rendered on
+    every draw (as before). Then checks a kept rendering never goes stale:
+    after each of a series of input and state changes, the window must
+    grab pixel-identical with every kept rendering dropped"""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtTest import QTest
+    m, app, window = launch_in_process()
+    overlay = window.scanline_overlay
+    window.pulse_animation.stop()
+    overlay.drift_animation.stop()
+    pump(m.FOCUS_TRANSITION_MS)  # Let the opening glow transitions settle
+    profiler = m.FrameProfiler(None, app)
+    app.installEventFilter(profiler)
+
+    def drop_kept_renderings():
+        for effect in window.findChildren(m.CachedGlowEffect):
+            effect.source_key = None
+
+    kept_draw = m.CachedGlowEffect.draw
+
+    def rerendering_draw(self, painter):
+        self.source_key = None
+        kept_draw(self, painter)
+
+    report = {'benchmark': 'drift-repaints', 'steps': args.steps}
+    for variant, draw in (('kept', kept_draw), ('rerendered', rerendering_draw)):
+        m.CachedGlowEffect.draw = draw
+        app.processEvents()
+        profiler.repaints.clear()
+        samples = []
+        for _ in range(args.steps):
+            overlay.drift_offset = (overlay.drift_offset + 1) % overlay.tile.width()
+            overlay.update()
+            start = time.perf_counter()
+            app.processEvents()  # The step's frame
+            samples.append((time.perf_counter() - start) * 1000)
+        names = m.widget_names()
+        paints = {}
+        for widget, count in profiler.repaints.items():
+            name = m.widget_name(widget, names)
+            paints[name] = paints.get(name, 0) + count
+        report[variant] = {'frame': summarise(samples),
+                           'paints_per_step': {name: round(count / args.steps, 2)
+                                               for name, count in sorted(paints.items())}}
+    m.CachedGlowEffect.draw = kept_draw
+    app.removeEventFilter(profiler)
+
+    changes = [('type time', lambda: [QTest.keyClick(window.time_edit, Qt.Key(ord(digit))) for digit in '2245']),
+               ('next section', lambda: QTest.keyClick(window.time_edit, Qt.Key.Key_Right)),
+               ('focus button', window.control_button.setFocus),
+               ('duration mode', lambda: window.radio_after_time.setChecked(True)),
+               ('type duration', lambda: [QTest.keyClick(window.duration_spinbox, Qt.Key(ord(digit)))
+                                          for digit in '130']),
+               ('step duration', lambda: QTest.keyClick(window.duration_spinbox, Qt.Key.Key_Up)),
+               ('time mode', lambda: window.radio_at_time.setChecked(True)),
+               ('countdown', lambda: window.enter_countdown_mode(time.time() + 3600)),
+               ('countdown tick', window.update_countdown),
+               ('leave countdown', window.leave_countdown_mode)]
+    report['stale'] = []
+    window.grab()
+    for name, change in changes:
+        change()
+        pump(m.FOCUS_TRANSITION_MS // 2)
+        kept = window.grab().toImage()
+        drop_kept_renderings()
+        if window.grab().toImage() != kept:
+            report['stale'].append(name)
+    report['passed'] = not report['stale'] and not any(
+        name in report['kept']['paints_per_step']
+        for name in ('hour_label', 'colon_label', 'minute_label', 'control_button'))
+    return report
+
+
+def single_canvas_child(renderer, frames, directory):
+    """With one renderer at this process's display scale: grab the window in
+    a series of frozen states into the directory, then time frames with the
+    drift and the pulse moving, and with a glow transition on top"""
+    from PyQt6.QtCore import Qt, QTime
+    from PyQt6.QtTest import QTest
+    m, app, window = launch_in_process(single_canvas=renderer == 'canvas')
+    # Both renderers must grab the same theme, so quality is frozen at full
+    # (launch_in_process never lets the governor start) and each grab's
+    # level is reported for the parent to check
+    window.quality_governor.set_level(0)
+    qualities = set()
+    overlay = window.scanline_overlay
+    window.pulse_animation.stop()
+    overlay.drift_animation.stop()
+    overlay.drift_offset = 0
+    window.card_halo.setColor(m.ember_colour(m.CARD_PULSE_ALPHA_MIN))
+    window.time_edit.setTime(QTime(22, 0))
+
+    def countdown():
+        # A fixed clock time, not an hour from now: the two renderers run a
+        # minute apart at times, and the time display would tick between them
+        today = time.localtime()
+        window.enter_countdown_mode(time.mktime((today.tm_year, today.tm_mon, today.tm_mday + 1,
+                                                 23, 15, 0, 0, 0, -1)))
+        window.countdown_timer.stop()
+        window.control_button.setText("SHUTDOWN IN 01:00:00")
+
+    states = [('idle', lambda: None),
+              ('minute section', lambda: QTest.keyClick(window.time_edit, Qt.Key.Key_Right)),
+              ('duration mode', lambda: QTest.mouseClick(window.radio_after_time, Qt.MouseButton.LeftButton)),
+              ('typed duration', lambda: [QTest.keyClick(window.duration_spinbox, Qt.Key(ord(digit)))
+                                          for digit in '130']),
+              ('button focus', window.control_button.setFocus),
+              ('countdown', countdown)]
+    for name, change in states:
+        change()
+        pump(m.FOCUS_TRANSITION_MS + 200)  # Glow transitions run to the end
+        qualities.add(m.QUALITY_LEVELS[window.quality_governor.level])
+        window.grab().save(os.path.join(directory, f"{renderer}-{name}.png"))
+
+    results = {'dpr': window.devicePixelRatioF(), 'quality': sorted(qualities)}
+    for series, glowing in (('drift_frame', False), ('glow_frame', True)):
+        samples = []
+        for frame in range(frames):
+            overlay.drift_offset = frame % overlay.tile.width()
+            overlay.update()
+            window.card_halo.setColor(m.ember_colour(m.CARD_PULSE_ALPHA_MIN + frame % 36))
+            if glowing:
+                window.control_button_glow.effect.setColor(m.ember_colour(120 + frame % 100))
+            start = time.perf_counter()
+            app.processEvents()  # The frame
+            samples.append((time.perf_counter() - start) * 1000)
+        results[series] = summarise(samples)
+    print(json.dumps(results))
+
+
+def compare_images(first_path, second_path):
+    """Pixels that differ between two same-sized images, and by how much at most"""
+    from PyQt6.QtGui import QImage
+    first, second = QImage(first_path), QImage(second_path)
+    if first.size() != second.size():
+        return {'size': [first.size().width(), first.size().height(), second.size().width(), second.size().height()]}
+    differing, largest = 0, 0
+    for y in range(first.height()):
+        for x in range(first.width()):
+            a, b = first.pixel(x, y), second.pixel(x, y)
+            if a != b:
+                differing += 1
+                largest = max(largest, *(abs((a >> shift & 0xFF) - (b >> shift & 0xFF)) for shift in (0, 8, 16, 24)))
+    return {'pixels': differing, 'max_channel_diff': largest}
+
+
+def run_single_canvas(args):
+    """The single-canvas renderer (--single-canvas) against the widget tree
+    at each display scale: pixel differences in each frozen state, all
+    grabbed at full quality, and the frame cost of both"""
+    report = {'benchmark': 'single-canvas', 'frames': args.frames, 'scales': {}}
+    with tempfile.TemporaryDirectory() as directory:
+        for scale in args.scales:
+            result = report['scales'][str(scale)] = {}
+            for renderer in ('widgets', 'canvas'):
+                child = run_per_scale([scale], 'single-canvas-child', renderer, str(args.frames), directory)
+                result['dpr'] = child[str(scale)]['dpr']
+                result.setdefault('quality', {})[renderer] = child[str(scale)]['quality']
+                for series in ('drift_frame', 'glow_frame'):
+                    result.setdefault(series, {})[renderer] = child[str(scale)][series]
+            result['differences'] = {}
+            for name in sorted(os.listdir(directory)):
+                if name.startswith('widgets-'):
+                    canvas_path = os.path.join(directory, 'canvas-' + name[len('widgets-'):])
+                    difference = compare_images(os.path.join(directory, name), canvas_path)
+                    if difference.get('pixels', 1):
+                        result['differences'][name[len('widgets-'):-len('.png')]] = difference
+    report['passed'] = not any(scale['differences'] or any(quality != ['full'] for quality in scale['quality'].values())
+                               for scale in report['scales'].values())
+    return report
+
+
+def startup_child(spawned_at, preflight=True):
+    """One cold launch, mirroring main.py's __main__ block. Each phase is
+    recorded as (start, end) in ms since this interpreter started running
+    code, and printed as a single JSON line for the parent to collect; the
+    startup preflight's tasks under 'preflight', or not at all with
+    preflight False"""
+    origin = time.perf_counter()
+    phases = {'interpreter': (-(time.time() - spawned_at) * 1000, 0.0)}
+
+    def now():
+        return (time.perf_counter() - origin) * 1000
+
+    def timed(name, function):
+        def wrapper(*args, **kwargs):
+            start = now()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                phases.setdefault(name, (start, now()))
+        return wrapper
+
+    start = now()
+    import main as m
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtGui import QColor
+    from PyQt6.QtWidgets import QApplication
+    phases['import'] = (start, now())
+
+    m.load_pending_epoch = timed('load_pending_epoch', m.load_pending_epoch)
+    if preflight:
+        m.PREFLIGHT = m.StartupPreflight()
+
+    class BenchmarkedApp(m.LifeControlButtonApp):
+        __init__ = timed('app_init', m.LifeControlButtonApp.__init__)
+        init_ui = timed('init_ui', m.LifeControlButtonApp.init_ui)
+        showEvent = timed('show_event', m.LifeControlButtonApp.showEvent)
+
+        def paintEvent(self, event):
+            if 'first_paint' not in phases:
+                phases['first_paint'] = (shown_at, now())
+                # Children paint and the backing store flushes before queued
+                # calls run, so this lands once the first frame is complete
+                QTimer.singleShot(0, finish)
+            super().paintEvent(event)
+
+    def finish():
+        phases['first_frame'] = (0.0, now())
+        app.quit()
+
+    start = now()
+    app = QApplication(sys.argv[:1])
+    phases['qapplication'] = (start, now())
+
+    timed('load_bundled_fonts', m.load_bundled_fonts)()
+    app.setWindowIcon(m.app_icon())
+
+    main_window = BenchmarkedApp()
+    main_window.execute_shutdown_command = fake_execute_shutdown_command
+    if preflight:
+        m.PREFLIGHT.prepare_scanlines(QColor(0, 0, 0, m.SCANLINE_DOT_ALPHA).rgba(),
+                                      app.primaryScreen().devicePixelRatio(),
+                                      main_window.card.width(), main_window.card.height())
+    main_window.center_window_on_primary_monitor()
+    shown_at = now()
+    main_window.show()
+    main_window.claim_initial_focus()
+    app.exec()
+    if preflight:
+        phases['preflight'] = {name: ((start - origin) * 1000, (end - origin) * 1000)
+                               for name, (start, end) in m.PREFLIGHT.timings.items()}
+    print(json.dumps(phases))
+
+
+def run_startup(args):
+    runs = []
+    for _ in range(args.runs):
+        spawned_at = time.time()
+        command = [sys.executable, os.path.abspath(__file__), 'startup-child', repr(spawned_at)]
+        if args.no_preflight:
+            command.append('--no-preflight')
+        result = subprocess.run(command, env=offscreen_environment(), capture_output=True, text=True)
+        if result.returncode != 0:
+            sys.exit(f"Launch failed:\n{result.stderr.strip()}")
+        runs.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    report = {'benchmark': 'startup', 'runs': args.runs, 'phases': {}}
+    for phase in STARTUP_PHASES:
+        durations = [run[phase][1] - run[phase][0] for run in runs if phase in run]
+        if not durations:
+            continue
+        report['phases'][phase] = summarise(durations)
+        report['phases'][phase]['end_median_ms'] = round(percentile([run[phase][1] for run in runs], 0.5), 3)
+    # Start and end on the main thread's clock, to line up against the phases
+    tasks = [run['preflight'] for run in runs if 'preflight' in run]
+    for task in PREFLIGHT_PHASES:
+        spans = [run[task] for run in tasks if task in run]
+        if spans:
+            report.setdefault('preflight', {})[task] = {
+                **summarise([end - start for start, end in spans]),
+                'start_median_ms': round(percentile([start for start, _ in spans], 0.5), 3),
+                'end_median_ms': round(percentile([end for _, end in spans], 0.5), 3)}
+    return report
+
+
+def run_key_latency(args):
+    """Keypress-to-frame latency, as --profile-frames records it, and the
+    part of it spent handling the key, for digit entry, up/down steps and
+    left/right section switches in both inputs: with the overlay labels
+    retexted in place and one input's glow refreshed (as now) and with every
+    key relaying the overlays and refreshing both inputs' glow (as before).
+    Checks every press leaves the window pixel-identical to a full relayout"""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtTest import QTest
+    from PyQt6.QtWidgets import QApplication
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    import main as m
+    app = QApplication(sys.argv[:1])
+    profiler = m.FrameProfiler(None)
+    profiler.install(app)  # Before the window is built, as the flag does
+    m, app, window = launch_in_process()
+    window.pulse_animation.stop()
+    window.scanline_overlay.drift_animation.stop()
+    pump(m.FOCUS_TRANSITION_MS)
+
+    fast_retext = m.LifeControlButtonApp.retext_overlay
+    fast_time_glow = m.LifeControlButtonApp.refresh_time_glow
+    fast_duration_glow = m.LifeControlButtonApp.refresh_duration_glow
+    retexted = []
+
+    def counted_retext(self, font, sections):
+        retexted.append(fast_retext(self, font, sections))
+        return retexted[-1]
+
+    def legacy_glow(self, flare=False):
+        fast_time_glow(self, flare)
+        fast_duration_glow(self, flare)
+
+    def time_mode():
+        window.radio_at_time.setChecked(True)
+        window.time_edit.setFocus()
+        return window.time_edit
+
+    def duration_mode():
+        window.radio_after_time.setChecked(True)
+        window.duration_spinbox.setValue(130)
+        window.duration_spinbox.setFocus()
+        return window.duration_spinbox
+
+    def keys(*names):
+        return [Qt.Key(ord(name)) if len(name) == 1 else getattr(Qt.Key, f'Key_{name}') for name in names]
+
+    cases = [('time digits', time_mode, keys(*'2130')),
+             ('time up/down', time_mode, keys('Up', 'Up', 'Down')),
+             ('time left/right', time_mode, keys('Right', 'Left')),
+             ('duration digits', duration_mode, keys(*'1302')),
+             ('duration up/down', duration_mode, keys('Up', 'Down', 'Down')),
+             ('duration left/right', duration_mode, keys('Left', 'Right'))]
+    report = {'benchmark': 'key-latency', 'presses': args.presses, 'mismatched': []}
+    for variant in ('fast', 'legacy'):
+        if variant == 'fast':
+            m.LifeControlButtonApp.retext_overlay = counted_retext
+        else:
+            m.LifeControlButtonApp.retext_overlay = lambda self, font, sections: False
+            m.LifeControlButtonApp.refresh_time_glow = legacy_glow
+            m.LifeControlButtonApp.refresh_duration_glow = legacy_glow
+        results = report[variant] = {}
+        for name, enter_mode, case_keys in cases:
+            target = enter_mode()
+            pump(m.FOCUS_TRANSITION_MS)
+            profiler.samples.pop('key_to_paint_ms', None)
+            retexted.clear()
+            handling = []
+            for press in range(args.presses):
+                start = time.perf_counter()
+                QTest.keyClick(target, case_keys[press % len(case_keys)])
+                handling.append((time.perf_counter() - start) * 1000)
+                while profiler.key_pressed_at is not None:
+                    app.processEvents()  # Until the frame showing the press
+                pump(args.gap_ms)
+                if press % 10 == 0:
+                    shown = window.grab().toImage()
+                    window.overlay_layout_pending = True
+                    window.layout_overlays()
+                    if window.grab().toImage() != shown and (variant, name) not in report['mismatched']:
+                        report['mismatched'].append((variant, name))
+            results[name] = {'handling': summarise(handling),
+                             'key_to_paint': summarise(profiler.samples.get('key_to_paint_ms', []))}
+            if variant == 'fast' and retexted:
+                results[name]['retexted'] = round(sum(retexted) / len(retexted), 2)
+    m.LifeControlButtonApp.retext_overlay = fast_retext
+    m.LifeControlButtonApp.refresh_time_glow = fast_time_glow
+    m.LifeControlButtonApp.refresh_duration_glow = fast_duration_glow
+    report['passed'] = not report['mismatched']
+    return report
+
+
+def run_quality_governor(args):
+    """Frame load (the share of a core the window's frames take, as the
+    governor weighs it) and process CPU at each quality level, idle. Then
+    the governor itself, on short windows: as measured, and with every frame
+    costing --slowdown times as much, as on a weak laptop. Checks each level
+    costs no more than the one above it, the governor leaves this machine at
+    full quality, steps the slow one down under budget, and a blip or
+    surge never restarts a drift the governor stopped"""
+    m, app, window = launch_in_process(governed=True)
+    governor = window.quality_governor
+    governor.stop()
+    pump(m.FOCUS_TRANSITION_MS)
+    report = {'benchmark': 'quality-governor', 'seconds': args.seconds, 'levels': {}}
+    for level, name in enumerate(m.QUALITY_LEVELS):
+        governor.set_level(level)
+        pump(500)  # Let the switch settle
+        governor.start()
+        cpu, start = time.process_time(), time.perf_counter()
+        pump(args.seconds * 1000)
+        wall = time.perf_counter() - start
+        report['levels'][name] = {'frame_load': round(governor.cost_ms / (wall * 1000), 4),
+                                  'cpu': round((time.process_time() - cpu) / wall, 4)}
+        governor.stop()
+    loads = [level['frame_load'] for level in report['levels'].values()]
+
+    window.scanline_overlay.blip()
+    window.scanline_overlay.end_blip()
+    window.scanline_overlay.surge(100)
+    window.scanline_overlay.calm()
+    report['drift_held'] = not window.scanline_overlay.drift_animation.state() == \
+        m.QAbstractAnimation.State.Running
+
+    record = m.QualityGovernor.record
+    for variant, slowdown in (('measured', 1.0), ('slowed', args.slowdown)):
+        governor.set_level(0)
+        m.QualityGovernor.record = lambda self, cost_ms: record(self, cost_ms * slowdown)
+        governor.seconds_at_level = [0.0] * len(m.QUALITY_LEVELS)
+        governor.recover_windows = [m.GOVERNOR_RECOVER_WINDOWS] * len(m.QUALITY_LEVELS)
+        governor.timer.setInterval(args.window_ms)
+        governor.start()
+        pump(args.seconds * 4000)
+        governor.stop()
+        report[variant] = governor.report()
+    m.QualityGovernor.record = record
+    governor.timer.setInterval(m.GOVERNOR_WINDOW_MS)
+
+    settled = m.QUALITY_LEVELS.index(report['slowed']['level'])
+    report['passed'] = all(lower <= higher * 1.1 + 0.002 for higher, lower in zip(loads, loads[1:])) \
+        and report['drift_held'] and report['measured']['level'] == 'full' \
+        and settled > 0 and loads[settled] * args.slowdown <= m.GOVERNOR_BUDGET
+    return report
+
+
+def run_cli(args):
+    """Wall time of the headless flags, spawn to exit, against a GUI launch
+    to its first frame (as `startup` runs it). Every run gets an empty state
+    directory, and schedules on the recording backend. Checks none of them
+    imports PyQt6, --status reports nothing pending, a schedule prints the
+    epoch it left in the note, --status then reports that epoch and a second
+    schedule is refused"""
+    from shutdown_schedule import decode_schedule_state
+    main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+    variants = {'status': ['--status'],
+                'schedule-in': ['--schedule-in=90', '--shutdown-backend=record'],
+                'schedule-at': [f'--schedule-at={time.strftime("%H:%M", time.localtime(time.time() + 3600))}',
+                                '--shutdown-backend=record'],
+                'gui': None}
+    report = {'benchmark': 'cli', 'runs': args.runs, 'wall_ms': {}, 'problems': []}
+    for variant, flags in variants.items():
+        if flags is None:
+            command = [sys.executable, os.path.abspath(__file__), 'startup-child', repr(time.time())]
+        else:
+            command = [sys.executable, main_path, *flags]
+        samples = []
+        for run in range(args.runs + (flags is not None)):
+            env = offscreen_environment()
+            env['LOCALAPPDATA'] = tempfile.mkdtemp(prefix='lcb-benchmark-')
+            checking = flags is not None and run == 0  # Untimed, as import tracing slows it down
+            start = time.perf_counter()
+            result = subprocess.run([command[0], '-X', 'importtime', *command[1:]] if checking else command,
+                                    env=env, capture_output=True, text=True)
+            if not checking:
+                samples.append((time.perf_counter() - start) * 1000)
+            if result.returncode != 0:
+                sys.exit(f"{variant} failed:\n{result.stderr.strip()}")
+            if not checking:
+                continue
+            if 'PyQt6' in result.stderr:
+                report['problems'].append(f"{variant} imported PyQt6")
+            status = json.loads(result.stdout)
+            if variant == 'status':
+                if status['epoch'] is not None:
+                    report['problems'].append(f"status reported {status}")
+                continue
+            state_path = os.path.join(env['LOCALAPPDATA'], 'LifeControlButton', 'scheduled_shutdown.txt')
+            with open(state_path, encoding='ascii') as state_file:
+                epoch, _ = decode_schedule_state(state_file.read(), 0)
+            if epoch != status['epoch']:
+                report['problems'].append(f"{variant} printed {status['epoch']}, noted {epoch}")
+            # Read back through the pending check, and a second schedule turned away
+            status = subprocess.run([sys.executable, main_path, '--status'], env=env, capture_output=True, text=True)
+            if status.returncode != 0 or json.loads(status.stdout)['epoch'] != epoch:
+                report['problems'].append(f"--status after {variant}: {(status.stdout or status.stderr).strip()}")
+            if subprocess.run(command, env=env, capture_output=True).returncode != 1:
+                report['problems'].append(f"{variant} scheduled over a pending shutdown")
+        report['wall_ms'][variant] = summarise(samples)
+    gui = report['wall_ms']['gui']['median_ms']
+    report['gui_over_status'] = round(gui / report['wall_ms']['status']['median_ms'], 2)
+    report['passed'] = not report['problems']
+    return report
+
+
+def handoff_child():
+    """The running instance for `handoff`, as main.py's __main__ sets it up:
+    claims the single-instance channel, then shows the window minimised.
+    Prints a JSON line once listening, and one per activation: when it
+    came forward, whether it raised the window (not needed when it is
+    already the active one) and how the window ended up; then minimises
+    again for the next launch"""
+    import single_instance
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QMainWindow
+    listener = single_instance.claim()
+    if listener is None or listener is single_instance.HANDED_OFF:
+        sys.exit("Could not claim the single-instance channel")
+    m, app, window = launch_in_process()
+    raised = []
+
+    def raise_():
+        raised.append(time.time())
+        QMainWindow.raise_(window)
+    window.raise_ = raise_
+
+    def come_forward():
+        window.come_forward()
+        print(json.dumps({'came_forward_at': time.time(), 'raised': bool(raised), 'active': window.isActiveWindow(),
+                          'visible': window.isVisible(), 'minimized': window.isMinimized()}), flush=True)
+        raised.clear()
+        window.showMinimized()
+
+    server = m.InstanceServer(listener, app)
+    server.activation_requested.connect(come_forward)
+    app.aboutToQuit.connect(server.close)
+    server.start()
+    window.showMinimized()
+    pump(100)
+    QTimer.singleShot(HANDOFF_CHILD_LIFETIME_MS, app.quit)
+    print(json.dumps({'listening': True}), flush=True)
+    app.exec()
+
+
+def handoff_race_child(start_at, hold_ms):
+    """One of two launches racing for the single-instance channel: waits for
+    the agreed moment, claims, and if it became the instance, listens for
+    hold_ms. Prints how it came out and how many activations it received"""
+    import threading
+    import single_instance
+    time.sleep(max(0.0, start_at - time.time()))
+    listener = single_instance.claim()
+    if listener is single_instance.HANDED_OFF or listener is None:
+        print(json.dumps({'outcome': 'handed off' if listener else 'unguarded', 'activations': 0}))
+        return
+    messages = []
+
+    def listen():
+        while True:
+            try:
+                messages.append(listener.accept())
+            except OSError:
+                return  # Closed
+    threading.Thread(target=listen, daemon=True).start()
+    time.sleep(hold_ms / 1000)
+    listener.close()
+    print(json.dumps({'outcome': 'claimed', 'activations': messages.count(single_instance.ACTIVATE_MESSAGE)}))
+
+
+def run_handoff_races(races):
+    """Pairs of launches started at the same instant on a fresh channel:
+    exactly one must become the instance, and the other hand off to it.
+    The problems found, one per race that went wrong"""
+    problems = []
+    for _ in range(races):
+        env = dict(os.environ, XDG_RUNTIME_DIR=tempfile.mkdtemp(prefix='lcb-benchmark-'), USERNAME='lcb-benchmark')
+        start_at = time.time() + 0.5  # Past both interpreters' startup
+        launches = [subprocess.Popen([sys.executable, os.path.abspath(__file__), 'handoff-race-child',
+                                      repr(start_at), '500'], env=env, stdout=subprocess.PIPE, text=True)
+                    for _ in range(2)]
+        results = [json.loads(launch.communicate()[0]) for launch in launches]
+        outcomes = sorted(result['outcome'] for result in results)
+        activations = sum(result['activations'] for result in results)
+        if outcomes != ['claimed', 'handed off'] or activations != 1:
+            problems.append(f"race: {outcomes}, {activations} activations")
+    return problems
+
+
+def run_handoff(args):
+    """A second launch of main.py against a running instance, on a private
+    channel (its own runtime directory and user name): wall time from spawn
+    to exit, and to the first instance bringing its window up. Checks every
+    second launch exits cleanly without importing PyQt6, and the first
+    instance brings its minimised window back up, raised or active, each
+    time. Then --races pairs of launches race for a fresh channel"""
+    import queue
+    import threading
+    env = offscreen_environment()
+    env['XDG_RUNTIME_DIR'] = tempfile.mkdtemp(prefix='lcb-benchmark-')
+    env['USERNAME'] = 'lcb-benchmark'
+    main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+    first = subprocess.Popen([sys.executable, os.path.abspath(__file__), 'handoff-child'],
+                             env=env, stdout=subprocess.PIPE, text=True)
+    lines = queue.Queue()
+    threading.Thread(target=lambda: [lines.put(json.loads(line)) for line in first.stdout], daemon=True).start()
+    report = {'benchmark': 'handoff', 'runs': args.runs, 'problems': []}
+    try:
+        lines.get(timeout=30)  # Listening
+        exits, raises = [], []
+        for run in range(args.runs + 1):
+            checking = run == 0  # Untimed, as import tracing slows it down
+            command = [sys.executable, *(['-X', 'importtime'] if checking else []), main_path]
+            spawned_at, start = time.time(), time.perf_counter()
+            try:
+                second = subprocess.run(command, env=env, capture_output=True, text=True, timeout=10)
+            except subprocess.TimeoutExpired:
+                report['problems'].append("the second launch did not hand off, it stayed up")
+                break
+            exited = (time.perf_counter() - start) * 1000
+            try:
+                activation = lines.get(timeout=5)
+            except queue.Empty:
+                report['problems'].append("the running instance never came forward")
+                break
+            if second.returncode != 0:
+                report['problems'].append(f"the second launch exited with {second.returncode}")
+            if checking and 'PyQt6' in second.stderr:
+                report['problems'].append("the second launch imported PyQt6")
+            if not (activation['raised'] or activation['active']) or not activation['visible'] \
+                    or activation['minimized']:
+                report['problems'].append(f"the window did not come forward: {activation}")
+            elif not checking:
+                exits.append(exited)
+                raises.append((activation['came_forward_at'] - spawned_at) * 1000)
+        if exits:
+            report['second_launch_exit'] = summarise(exits)
+            report['window_forward'] = summarise(raises)
+    finally:
+        first.terminate()
+        first.wait()
+    report['races'] = args.races
+    report['problems'] += run_handoff_races(args.races)
+    report['passed'] = not report['problems']
+    return report
+
+
+def write_report(report, output):
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, 'w', encoding='utf-8') as report_file:
+            report_file.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    reporting = argparse.ArgumentParser(add_help=False)
+    reporting.add_argument('--output', help="write the JSON report here instead of stdout")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    startup = commands.add_parser('startup', parents=[reporting], help="cold launches to the first painted frame")
+    startup.add_argument('--runs', type=int, default=10)
+    startup.add_argument('--no-preflight', action='store_true', help="everything on the UI thread, as before")
+    startup_child_parser = commands.add_parser('startup-child')
+    startup_child_parser.add_argument('spawned_at', type=float)
+    startup_child_parser.add_argument('--no-preflight', action='store_true')
+    idle = commands.add_parser('idle-wakeups', parents=[reporting],
+                               help="check no timer fires while the window cannot be seen")
+    idle.add_argument('--seconds', type=int, default=2)
+    press = commands.add_parser('press', parents=[reporting], help="UI-thread time per press, note inline vs stored")
+    press.add_argument('--presses', type=int, default=20)
+    press.add_argument('--disk-latency-ms', type=float, default=0.0)
+    slow = commands.add_parser('slow-dispatch', parents=[reporting],
+                               help="check the UI keeps painting while a slow shutdown backend runs")
+    slow.add_argument('--delay-ms', type=int, default=1000)
+    dispatch = commands.add_parser('dispatch', parents=[reporting], help="latency of scheduling per shutdown backend")
+    dispatch.add_argument('--backend', choices=('api', 'command', 'record'), default='record')
+    dispatch.add_argument('--runs', type=int, default=10)
+    dispatch.add_argument('--real', action='store_true', help="allow backends that schedule a real shutdown")
+    glow_refresh = commands.add_parser('glow-refresh', parents=[reporting],
+                                       help="cost of a flaring glow refresh, style sheets vs palettes")
+    glow_refresh.add_argument('--calls', type=int, default=200)
+    filter_calls = commands.add_parser('filter-calls', parents=[reporting],
+                                       help="Python event filter calls a second, scoped vs application-wide")
+    filter_calls.add_argument('--seconds', type=int, default=3)
+    hotpaths = commands.add_parser('hotpaths', parents=[reporting],
+                                   help="per-call cost of the rendering and input hot paths at each display scale")
+    hotpaths.add_argument('--calls', type=int, default=500)
+    hotpaths.add_argument('--scales', type=float, nargs='+', default=HOTPATH_SCALES)
+    hotpaths.add_argument('--compare', metavar='BASELINE', help="an earlier hotpaths --output to compare against")
+    hotpaths.add_argument('--tolerance', type=float, default=0.25,
+                          help="slowdown ratio over 1 that counts as a regression (default 0.25)")
+    resident = commands.add_parser('resident', parents=[reporting],
+                                   help="show latency from resident standby, idle and counting down")
+    resident.add_argument('--shows', type=int, default=10)
+    glow_keyframes = commands.add_parser('glow-keyframes', parents=[reporting],
+                                         help="check the glow keyframe tables match the per-tick computation")
+    glow_keyframes.add_argument('--calls', type=int, default=2000)
+    scanline = commands.add_parser('scanline-texture', parents=[reporting],
+                                   help="check the card texture paints pixel-identical to clip-and-tile, and time both")
+    scanline.add_argument('--calls', type=int, default=300)
+    scanline.add_argument('--scales', type=float, nargs='+', default=HOTPATH_SCALES)
+    scanline_child_parser = commands.add_parser('scanline-texture-child')
+    scanline_child_parser.add_argument('calls', type=int)
+    drift = commands.add_parser('drift-repaints', parents=[reporting],
+                                help="paints per widget and frame time for each scanline drift step")
+    drift.add_argument('--steps', type=int, default=60)
+    single_canvas = commands.add_parser('single-canvas', parents=[reporting],
+                                        help="compare the single-canvas renderer with the widget tree, pixels and frame cost")
+    single_canvas.add_argument('--frames', type=int, default=120)
+    single_canvas.add_argument('--scales', type=float, nargs='+', default=HOTPATH_SCALES)
+    single_canvas_child_parser = commands.add_parser('single-canvas-child')
+    single_canvas_child_parser.add_argument('renderer', choices=('widgets', 'canvas'))
+    single_canvas_child_parser.add_argument('frames', type=int)
+    single_canvas_child_parser.add_argument('directory')
+    key_latency = commands.add_parser('key-latency', parents=[reporting],
+                                      help="keypress-to-frame latency per key path, retexting the overlays vs relaying them")
+    key_latency.add_argument('--presses', type=int, default=60)
+    key_latency.add_argument('--gap-ms', type=int, default=40, help="pause between presses")
+    governor = commands.add_parser('quality-governor', parents=[reporting],
+                                   help="frame load per quality level, and the governor on this and a slowed machine")
+    governor.add_argument('--seconds', type=int, default=3)
+    governor.add_argument('--slowdown', type=float, default=8.0, help="frame cost multiplier for the weak machine")
+    governor.add_argument('--window-ms', type=int, default=500, help="governor weighing window for the runs")
+    cli = commands.add_parser('cli', parents=[reporting],
+                              help="headless --status/--schedule-* wall time against a GUI launch")
+    cli.add_argument('--runs', type=int, default=10)
+    handoff = commands.add_parser('handoff', parents=[reporting],
+                                  help="a second launch handing off to the running window, and its exit latency")
+    handoff.add_argument('--runs', type=int, default=10)
+    handoff.add_argument('--races', type=int, default=20)
+    commands.add_parser('handoff-child')
+    handoff_race_child_parser = commands.add_parser('handoff-race-child')
+    handoff_race_child_parser.add_argument('start_at', type=float)
+    handoff_race_child_parser.add_argument('hold_ms', type=int)
+    hotpaths_child_parser = commands.add_parser('hotpaths-child')
+    hotpaths_child_parser.add_argument('calls', type=int)
+
+    args = parser.parse_args()
+    if args.command == 'startup-child':
+        startup_child(args.spawned_at, not args.no_preflight)
+        sys.exit()
+    if args.command == 'handoff-race-child':
+        handoff_race_child(args.start_at, args.hold_ms)
+        sys.exit()
+    if args.command == 'handoff-child':
+        handoff_child()
+        sys.exit()
+    if args.command == 'hotpaths-child':
+        hotpaths_child(args.calls)
+        sys.exit()
+    if args.command == 'scanline-texture-child':
+        scanline_texture_child(args.calls)
+        sys.exit()
+    if args.command == 'single-canvas-child':
+        single_canvas_child(args.renderer, args.frames, args.directory)
+        sys.exit()
+    report = {'startup': run_startup, 'idle-wakeups': run_idle_wakeups, 'press': run_press,
+              'slow-dispatch': run_slow_dispatch, 'dispatch': run_dispatch,
+              'glow-refresh': run_glow_refresh, 'filter-calls': run_filter_calls,
+              'hotpaths': run_hotpaths, 'resident': run_resident,
+              'glow-keyframes': run_glow_keyframes, 'scanline-texture': run_scanline_texture,
+              'drift-repaints': run_drift_repaints, 'single-canvas': run_single_canvas,
+              'key-latency': run_key_latency, 'quality-governor': run_quality_governor,
+              'cli': run_cli, 'handoff': run_handoff}[args.command](args)
+    write_report(report, args.output)
+    sys.exit(0 if report.get('passed', True) else 1)
@@ -1,24 +1,72 @@
+import sys
+import time
+
+import single_instance
+
+LAUNCHED_AT = time.perf_counter()  # Where a startup trace (--trace) begins
+
+# Scheduling from a script (--schedule-at, --schedule-in, --status) needs no
+# window, so it is done right here: neither Qt nor the running instance is touched
+if __name__ == "__main__" and {argument.partition('=')[0] for argument in sys.argv[1:]} & {
+        '--schedule-at', '--schedule-in', '--status'}:
+    import shutdown_schedule
+    sys.exit(shutdown_schedule.run_headless())
+
+# A window started with an unknown --shutdown-backend fails as the headless
+# flags do, before it can hand off or come up
+SHUTDOWN_BACKEND_NAME = None
+if __name__ == "__main__":
+    import shutdown_schedule
+    try:
+        SHUTDOWN_BACKEND_NAME = shutdown_schedule.shutdown_backend_flag()
+    except ValueError as error:
+        sys.exit(shutdown_schedule.invalid_arguments(error))
+
+# A second launch hands off to the running window right here, before paying
+# for the imports below (PyQt6 above all). The self-registration flags never
+# open a window, so they may run alongside one
+INSTANCE_LISTENER = None
+if __name__ == "__main__" and not {'--install-startup', '--uninstall-startup'} & set(sys.argv[1:]):
+    INSTANCE_LISTENER = single_instance.claim()
+    if INSTANCE_LISTENER is single_instance.HANDED_OFF:
+        sys.exit()
+
+import contextlib
 import ctypes
+import functools
+import json
+import math
 import os
 import re
 import subprocess
-import sys
 import tempfile
-import time
+import threading
 import winreg
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from xml.sax.saxutils import escape
 
-from PyQt6.QtCore import (QEasingCurve, QEvent, QPoint, QPointF, QRectF, Qt,
-                          QTime, QTimer, QVariantAnimation, pyqtSignal)
-from PyQt6.QtGui import (QColor, QFont, QFontDatabase, QFontMetrics, QIcon,
-                         QPainter, QPainterPath, QPixmap, QValidator)
-from PyQt6.QtWidgets import (QAbstractSpinBox, QApplication, QButtonGroup,
-                             QFrame, QGraphicsDropShadowEffect, QHBoxLayout,
-                             QLabel, QMainWindow, QMessageBox,
-                             QPushButton, QRadioButton, QSizePolicy, QSpinBox,
-                             QTimeEdit, QVBoxLayout, QWidget)
+from shutdown_schedule import (clear_scheduled_epoch, default_shutdown_backend, flag_value, load_pending_epoch,
+                               save_scheduled_epoch, seconds_until)
+
+from PyQt6 import sip
+from PyQt6.QtCore import (QAbstractAnimation, QByteArray, QEasingCurve, QElapsedTimer,
+                          QEvent, QObject, QPoint, QPointF, QRectF, Qt, QTime,
+                          QTimer, QVariantAnimation, pyqtSignal)
+from PyQt6.QtGui import (QBrush, QColor, QFont, QFontDatabase, QFontMetrics, QIcon, QImage,
+                         QFontMetricsF, QPainter, QPainterPath, QPalette, QPen, QPixmap, QRegion,
+                         QTransform, QValidator)
+from PyQt6.QtWidgets import (QAbstractButton, QAbstractSpinBox, QApplication,
+                             QButtonGroup, QFrame, QGraphicsDropShadowEffect,
+                             QGraphicsEffect, QGraphicsOpacityEffect,
+                             QGraphicsScene, QHBoxLayout, QLabel, QMainWindow,
+                             QMessageBox, QPushButton, QRadioButton, QSizePolicy,
+                             QSpinBox, QStyle, QStyleOption, QStyleOptionButton,
+                             QStyleOptionFrame, QTimeEdit, QVBoxLayout, QWidget)
 
 if sys.platform == 'win32':
+    import ctypes.wintypes
+
     # Hide console window
     kernel32 = ctypes.WinDLL('kernel32')
     user32 = ctypes.WinDLL('user32')
@@ -35,14 +83,16 @@ DURATION_GLOW_BASE, DURATION_GLOW_SELECTED, DURATION_GLOW_HOT, DURATION_GLOW_FLA
     (22, 137), (26, 190), (30, 255), (56, 255)
 BUTTON_GLOW_BASE, BUTTON_GLOW_FLASH, BUTTON_GLOW_HELD = (18, 70), (90, 255), (40, 200)
 CARD_GLOW_FLASH, CARD_GLOW_HELD = (70, 255), (55, 220)
+CARD_CORNER_RADIUS = 6
 
-# The card's idle pulse animates glow intensity only, never blurRadius. The
-# card's drop shadow composites the whole card through a pixmap padded by the
-# blur radius, and at fractional display scales (125%/150%/...) an animated
-# radius re-rounds that padding to device pixels differently frame to frame,
-# visibly jiggling the entire card by a pixel or two (Qt 6.10, Win11 at 150%)
+# The card's idle pulse animates halo intensity only, never its blur radius.
+# The halo's extent follows the blur radius, and at fractional display scales
+# (125%/150%/...) an animated radius re-rounds it to device pixels
+# differently frame to frame - as a drop shadow on the card it visibly
+# jiggled the entire card by a pixel or two (Qt 6.10, Win11 at 150%)
 CARD_PULSE_BLUR = 52
 CARD_PULSE_ALPHA_MIN, CARD_PULSE_ALPHA_MAX = 26, 62
+CARD_PULSE_FPS = 30  # The pulse alpha only moves in whole steps, ~18 a second
 
 # Text colour heats up with the glow tier — brighter text reads better than
 # any halo, especially on the smaller duration digits
@@ -52,33 +102,64 @@ GLOW_TEXT_HOT = "#FF7B81"
 GLOW_TEXT_FLARE = "#FFB9BC"
 FOCUS_TRANSITION_MS = 800
 FLARE_TRANSITION_MS = 80
+FRAME_MS = 16  # One tick of the shared animation clock
 SECTION_FADE_MS = 100  # The just-left section lets go of its glow almost instantly
+DISPLAY_GLYPHS = '0123456789: hmin'  # Every character the time and duration displays can show
+GLOW_CACHE_BUDGET = 32 * 1024 * 1024  # Bytes of pre-blurred glow pixmaps kept for reuse
 EXIT_DELAY_MS = 2250  # Time to soak in the button's flash before the app closes
+PENDING_DETECTION_WAIT_S = 2.0  # How long a press is held for an unfinished pending-shutdown check
+PROFILE_DEFAULT_PATH = 'frame-profile.json'  # Where --profile-frames writes without a path
+PROFILE_BUCKETS_MS = (1, 2, 4, 8, 16, 33, 50, 100)  # Histogram bucket upper bounds
+TRACE_DEFAULT_PATH = 'trace.json'  # Where --trace writes without a path
+PREFLIGHT_WORKERS = 3  # Startup preflight threads: fonts, icon, pending check
+# Keys that always change the display, so the next frame is the one showing the press
+LATENCY_KEYS = {*range(Qt.Key.Key_0.value, Qt.Key.Key_9.value + 1),
+                Qt.Key.Key_Up.value, Qt.Key.Key_Down.value, Qt.Key.Key_Left.value, Qt.Key.Key_Right.value}
 
 # Dotted scanline texture: dot grid pitch (px), dot size, opacity, drift speed (ms per pitch)
 SCANLINE_PITCH = 2
 SCANLINE_DOT_SIZE = 1
 SCANLINE_DOT_ALPHA = 80
 SCANLINE_DRIFT_MS = 700
+SCANLINE_DRIFT_SAMPLES = 4  # Drift frames per device-pixel step; steps land within a quarter step
+
+# Quality levels the governor steps down through when frames cost too much,
+# each giving up one more piece of the ember theme than the last
+QUALITY_LEVELS = ('full', 'slow drift', 'static halo', 'baked glows', 'no drift')
+QUALITY_SLOW_DRIFT, QUALITY_STATIC_HALO, QUALITY_BAKED_GLOWS, QUALITY_NO_DRIFT = 1, 2, 3, 4
+SLOW_DRIFT_FACTOR = 3  # How much longer a pitch of drift takes at 'slow drift' and below
+GOVERNOR_WINDOW_MS = 2000  # How much shown time each weighing of the frame cost covers
+GOVERNOR_BUDGET = 0.15  # Share of a core the frames may take before quality steps down
+GOVERNOR_HEADROOM = 0.4  # Share of the budget the frames must stay under to step back up
+GOVERNOR_RECOVER_WINDOWS = 3  # Windows of headroom before stepping up; doubles per failed try
+GOVERNOR_RECOVER_MAX_WINDOWS = 48
 
 # Faint press-feedback flicker, fired the instant the button is hit — quicker
 # and dimmer than the success surge so it reads as an acknowledgement, not a payoff
 BLIP_DOT_ALPHA = 100
 BLIP_DURATION_MS = 180
 
-BUTTON_STYLE_NORMAL = (
-    "QPushButton {background-color: transparent; color: #FB3640; border: 2px solid #FB3640; border-radius: 5px; padding: 16px;}"
-    "QPushButton:hover {background-color: #FB3640; color: #160A0E;}"
-    "QPushButton:focus {background-color: rgba(251, 54, 64, 15%); outline: none;}"
-    "QPushButton:pressed {background-color: rgba(251, 54, 64, 35%); color: #FB3640;}"
-)
-# Pure display while a shutdown is already pending: the ring dims to the card's
-# ring alpha so the button reads as information, not as something to press
-BUTTON_STYLE_COUNTDOWN = (
-    "QPushButton:disabled {background-color: transparent; color: #FB3640;"
-    " border: 2px solid rgba(251, 54, 64, 45%); border-radius: 5px; padding: 16px;}"
+# One style sheet for every button state, parsed once; set_button_mode()
+# flips between them through the `mode` property instead of swapping sheets
+BUTTON_STYLE = (
+    'QPushButton[mode="ready"] {background-color: transparent; color: #FB3640; border: 2px solid #FB3640;'
+    ' border-radius: 5px; padding: 16px;}'
+    'QPushButton[mode="ready"]:hover {background-color: #FB3640; color: #160A0E;}'
+    'QPushButton[mode="ready"]:focus {background-color: rgba(251, 54, 64, 15%); outline: none;}'
+    'QPushButton[mode="ready"]:pressed {background-color: rgba(251, 54, 64, 35%); color: #FB3640;}'
+    # Pure display while a shutdown is already pending: the ring dims to the card's
+    # ring alpha so the button reads as information, not as something to press
+    'QPushButton[mode="countdown"]:disabled {background-color: transparent; color: #FB3640;'
+    ' border: 2px solid rgba(251, 54, 64, 45%); border-radius: 5px; padding: 16px;}'
+    'QPushButton[mode="regained"], QPushButton[mode="regained"]:disabled {background-color: #FB3640;'
+    ' color: #160A0E; border: 2px solid #FB3640; border-radius: 5px; padding: 16px;}'
 )
 
+# Mode row text: the checked row reads at full strength, the other fades back
+# (#AARRGGBB: 35% and 45% alpha)
+MODE_MARK_CHECKED, MODE_MARK_UNCHECKED = "#FB3640", "#59F8FFE5"
+MODE_TEXT_CHECKED, MODE_TEXT_UNCHECKED = "#F8FFE5", "#73F8FFE5"
+
 
 def resource_path(*relative_parts):
     """Resolve a resource path relative to the script or the PyInstaller bundle"""
@@ -86,67 +167,6 @@ def resource_path(*relative_parts):
     return os.path.join(base_dir, *relative_parts)
 
 
-def schedule_state_path():
-    """File remembering when the scheduled shutdown will fire. Windows offers no
-    way to query a pending `shutdown /s /t`, so the app keeps its own note"""
-    base_dir = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
-    return os.path.join(base_dir, 'LifeControlButton', 'scheduled_shutdown.txt')
-
-
-def save_scheduled_epoch(epoch):
-    """Best effort only: a failed write must never get in the way of the shutdown"""
-    try:
-        os.makedirs(os.path.dirname(schedule_state_path()), exist_ok=True)
-        with open(schedule_state_path(), 'w', encoding='ascii') as state_file:
-            state_file.write(str(int(epoch)))
-    except OSError:
-        pass
-
-
-def clear_scheduled_epoch():
-    try:
-        os.remove(schedule_state_path())
-    except OSError:
-        pass
-
-
-def last_boot_epoch():
-    """When the current session booted, from the uptime tick counter"""
-    kernel32.GetTickCount64.restype = ctypes.c_uint64
-    return time.time() - kernel32.GetTickCount64() / 1000
-
-
-def last_shutdown_epoch():
-    """When the machine last shut down cleanly, from the registry. Catches
-    fast-startup shutdowns, whose hibernated kernel keeps the uptime counter
-    running across the power-off"""
-    try:
-        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
-                            r'SYSTEM\CurrentControlSet\Control\Windows') as windows_key:
-            filetime = int.from_bytes(winreg.QueryValueEx(windows_key, 'ShutdownTime')[0], 'little')
-    except OSError:
-        return 0.0
-    return filetime / 10_000_000 - 11_644_473_600  # 100 ns ticks since 1601 to Unix epoch
-
-
-def load_pending_epoch():
-    """The remembered shutdown moment, if it is still ahead of us; stale or
-    unreadable state is cleared and reported as no pending shutdown. A pending
-    `shutdown /s /t` dies with the session, so a note older than the last boot
-    or shutdown is stale even when its moment has not yet passed"""
-    try:
-        state_path = schedule_state_path()
-        with open(state_path, encoding='ascii') as state_file:
-            epoch = int(state_file.read().strip())
-        noted_at = os.path.getmtime(state_path)
-    except (OSError, ValueError):
-        return None
-    if epoch <= time.time() or noted_at < max(last_boot_epoch(), last_shutdown_epoch()):
-        clear_scheduled_epoch()
-        return None
-    return epoch
-
-
 STARTUP_RUN_KEY = r'Software\Microsoft\Windows\CurrentVersion\Run'
 STARTUP_TASK_NAME = 'LifeControlButton'
 
@@ -244,10 +264,28 @@ def uninstall_startup():
     return 0
 
 
+def read_bundled_fonts():
+    """The bundled Fira Mono faces' bytes; plain file reads, so the startup
+    preflight can do them before there is an application to register with"""
+    faces = []
+    for font_file in ('FiraMono-Regular.ttf', 'FiraMono-Medium.ttf', 'FiraMono-Bold.ttf'):
+        with open(resource_path('assets', 'fonts', font_file), 'rb') as face:
+            faces.append(face.read())
+    return faces
+
+
 def load_bundled_fonts():
     """Register the bundled Fira Mono faces so the design renders everywhere"""
-    for font_file in ('FiraMono-Regular.ttf', 'FiraMono-Medium.ttf', 'FiraMono-Bold.ttf'):
-        QFontDatabase.addApplicationFont(resource_path('assets', 'fonts', font_file))
+    faces = PREFLIGHT.result('fonts') if PREFLIGHT else read_bundled_fonts()
+    for face in faces:
+        QFontDatabase.addApplicationFontFromData(QByteArray(face))
+
+
+@functools.lru_cache(maxsize=None)
+def app_icon():
+    """The icon, decoded once for both the application and the window"""
+    image = PREFLIGHT.result('icon') if PREFLIGHT else QImage(resource_path('assets', 'icon.png'))
+    return QIcon(QPixmap.fromImage(image))
 
 
 def fira_mono(pixel_size, weight=QFont.Weight.Normal, letter_spacing=0.0):
@@ -260,10 +298,240 @@ def fira_mono(pixel_size, weight=QFont.Weight.Normal, letter_spacing=0.0):
     return font
 
 
+class TextMetrics:
+    """Memoised text advances for one font, in logical pixels at every
+    display scale (QFontMetricsF measures device-independently). The display
+    overlays only ever show digits, ':', ' h ' and ' min', so those glyphs
+    are measured once and any string of them is summed from the table
+    rather than shaped again; other text is measured once and remembered"""
+
+    _cache = {}
+
+    @classmethod
+    def of(cls, font):
+        key = font.key()
+        if key not in cls._cache:
+            cls._cache[key] = cls(font)
+        return cls._cache[key]
+
+    def __init__(self, font):
+        self.metrics = QFontMetricsF(font)
+        self.height = QFontMetrics(font).height()
+        self.glyphs = {glyph: self.metrics.horizontalAdvance(glyph) for glyph in DISPLAY_GLYPHS}
+        # Fira Mono: any two display texts of one length are one width
+        self.monospaced = len(set(self.glyphs.values())) == 1
+        self.advances = {}
+
+    def advance(self, text):
+        """Same as QFontMetrics.horizontalAdvance(text)"""
+        width = self.advances.get(text)
+        if width is None:
+            if all(glyph in self.glyphs for glyph in text):
+                width = round(sum(self.glyphs[glyph] for glyph in text))
+            else:
+                width = round(self.metrics.horizontalAdvance(text))
+            self.advances[text] = width
+        return width
+
+
+def fitting_pixel_size(text, width, smallest, largest, weight, letter_spacing):
+    """The largest Fira Mono pixel size (within bounds) at which text fits in
+    width. Monospace advances grow almost linearly with the size, so a single
+    measurement lands within a size or two and the rest is settled by hand"""
+    def advance(size):
+        return TextMetrics.of(fira_mono(size, weight, letter_spacing)).advance(text)
+
+    size = max(smallest, min(largest, int(smallest * width / advance(smallest))))
+    while size < largest and advance(size + 1) <= width:
+        size += 1
+    while size > smallest and advance(size) > width:
+        size -= 1
+    return size
+
+
+@functools.lru_cache(maxsize=None)
+def text_palette(colour):
+    """A palette setting only the text colour, built once per colour: cheap
+    to switch between, unlike a style sheet that is re-parsed on every set"""
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(colour))
+    palette.setColor(QPalette.ColorRole.ButtonText, QColor(colour))  # Labels inside a button draw with this
+    return palette
+
+
+@functools.lru_cache(maxsize=None)
+def blur_quantum(dpr):
+    """Smallest blur step that keeps a glow's padding on whole device pixels
+    at the given display scale (1 at 100%, 4 at 125%, 2 at 150%)"""
+    return next((q for q in (1, 2, 4, 8) if dpr * q == round(dpr * q)), 4)
+
+
+def glow_signature(widget):
+    """Everything a glow's shape depends on: the widget's alpha silhouette.
+    Colour never matters - a drop shadow only takes its source's alpha"""
+    signature = (type(widget).__name__, widget.width(), widget.height(), widget.font().key(),
+                 widget.styleSheet(), widget.isEnabled(), widget.palette().color(QPalette.ColorRole.WindowText).alpha())
+    # Style sheet states picked by property (BUTTON_STYLE)
+    signature += tuple((bytes(name), widget.property(bytes(name).decode())) for name in widget.dynamicPropertyNames())
+    if isinstance(widget, QLabel):
+        signature += (widget.text(),)
+    if isinstance(widget, QAbstractButton):
+        signature += (widget.text(), widget.isDown(), widget.isChecked(), widget.underMouse(), widget.hasFocus())
+    children = widget.findChildren(QLabel, options=Qt.FindChildOption.FindDirectChildrenOnly)
+    return signature + tuple(glow_signature(child) for child in children if child.isVisible())
+
+
+def render_state(widget):
+    """What a widget's rendering depends on beyond its silhouette
+    (glow_signature): the colours it and its children draw text in, and the
+    glows of effects nested inside it (the mode row marks)"""
+    state = []
+    for part in (widget, *widget.findChildren(QWidget)):
+        palette = part.palette()
+        effect = part.graphicsEffect() if part is not widget else None
+        state.append((part.isVisible(), palette.color(QPalette.ColorRole.WindowText).rgba(),
+                      palette.color(QPalette.ColorRole.ButtonText).rgba(),
+                      (effect.blurRadius(), effect.color().rgba()) if isinstance(effect, CachedGlowEffect) else None))
+    return tuple(state)
+
+
+def render_glow(source, blur):
+    """Blur a source pixmap's silhouette into an ember glow exactly as
+    QGraphicsDropShadowEffect would, by letting one do it offscreen. The
+    shadow is offset clear of the source and cut out on its own; both have
+    to be rendered, as the effect crops its source to the painted area"""
+    dpr = source.devicePixelRatioF()
+    reach = math.ceil(blur * dpr)
+    gap = source.width() + 2 * reach + 2  # Device pixels from source to shadow
+    scene = QGraphicsScene()
+    item = scene.addPixmap(source)
+    shadow = QGraphicsDropShadowEffect()
+    shadow.setBlurRadius(blur)
+    shadow.setColor(QColor(251, 54, 64))
+    shadow.setOffset(gap / dpr, 0)
+    item.setGraphicsEffect(shadow)
+
+    canvas = QPixmap(gap + source.width() + 2 * reach, source.height() + 2 * reach)
+    canvas.setDevicePixelRatio(dpr)
+    canvas.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(canvas)
+    area = QRectF(-reach / dpr, -reach / dpr, canvas.width() / dpr, canvas.height() / dpr)
+    scene.render(painter, QRectF(0, 0, area.width(), area.height()), area)
+    painter.end()
+    glow = canvas.copy(gap, 0, source.width() + 2 * reach, source.height() + 2 * reach)
+    glow.setDevicePixelRatio(dpr)
+    return glow
+
+
+class GlowCache:
+    """Pre-blurred glow pixmaps keyed by (silhouette, blur, device pixel
+    ratio), least recently used dropped first once over budget. Alpha is
+    not part of the key: a shadow colour's alpha scales the blurred mask
+    linearly, so it is applied as blit opacity and fades never re-blur"""
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.used = 0
+        self.glows = OrderedDict()
+
+    def get(self, key):
+        glow = self.glows.get(key)
+        if glow is not None:
+            self.glows.move_to_end(key)
+        return glow
+
+    def store(self, key, glow):
+        self.glows[key] = glow
+        self.used += glow.width() * glow.height() * 4
+        while self.used > self.budget and len(self.glows) > 1:
+            _, dropped = self.glows.popitem(last=False)
+            self.used -= dropped.width() * dropped.height() * 4
+        return glow
+
+
+GLOW_CACHE = GlowCache(GLOW_CACHE_BUDGET)
+
+
+class CachedGlowEffect(QGraphicsEffect):
+    """Stand-in for a glowing QGraphicsDropShadowEffect that blits a cached,
+    pre-blurred glow under the widget instead of re-blurring the widget on
+    every repaint. Same blurRadius/color interface, so GlowAnimator drives
+    either kind.
+
+    The widget's own rendering is kept as well, keyed by everything it
+    depends on: the scanline overlay lies on top of every glowing widget,
+    so each drift step repaints the whole card, and an unchanged widget is
+    then blitted again instead of being asked to paint itself"""
+
+    def __init__(self, widget):
+        super().__init__(widget)
+        self.blur = 0.0
+        self.glow_colour = QColor(251, 54, 64)
+        self.source = None
+        self.source_key = None
+
+    def blurRadius(self):
+        return self.blur
+
+    def setBlurRadius(self, blur):
+        if blur != self.blur:
+            self.blur = float(blur)
+            self.updateBoundingRect()
+
+    def color(self):
+        return QColor(self.glow_colour)
+
+    def setColor(self, colour):
+        if colour != self.glow_colour:
+            self.glow_colour = QColor(colour)
+            self.update()
+
+    def boundingRectFor(self, rect):
+        # Room for the blur after snapping it up by as much as half the
+        # coarsest quantum
+        reach = self.blur + 4
+        return rect.adjusted(-reach, -reach, reach, reach)
+
+    def draw(self, painter):
+        # Mirror QGraphicsDropShadowEffect's own drawing: a padded source
+        # pixmap in device coordinates under an identity world transform.
+        # drawSource() misplaces nested effects (the mode row marks), and
+        # logical pixmaps land a pixel off at 125%
+        signature = glow_signature(self.parent())
+        device = painter.deviceTransform()
+        source_key = (signature, render_state(self.parent()), self.blur, painter.device().devicePixelRatioF(),
+                      device.m11(), device.m22(), device.dx(), device.dy())
+        if source_key != self.source_key:
+            self.source = self.sourcePixmap(Qt.CoordinateSystem.DeviceCoordinates,
+                                            QGraphicsEffect.PixmapPadMode.PadToEffectiveBoundingRect)
+            self.source_key = source_key
+        source, offset = self.source
+        self.composite(painter, signature, source, offset)
+
+    def composite(self, painter, signature, source, offset):
+        """Blit the glow for a padded source pixmap, then the source over it"""
+        dpr = source.devicePixelRatioF()
+        quantum = blur_quantum(dpr)
+        blur = round(self.blur / quantum) * quantum
+        alpha = self.glow_colour.alpha()
+        transform = painter.worldTransform()
+        painter.setWorldTransform(QTransform())
+        if blur > 0 and alpha > 0:
+            key = (signature, source.width(), source.height(), blur, dpr)
+            glow = GLOW_CACHE.get(key) or GLOW_CACHE.store(key, render_glow(source, blur))
+            reach = math.ceil(blur * dpr) / dpr
+            opacity = painter.opacity()
+            painter.setOpacity(opacity * alpha / 255)
+            painter.drawPixmap(QPointF(offset.x() - reach, offset.y() - reach), glow)
+            painter.setOpacity(opacity)
+        painter.drawPixmap(offset, source)
+        painter.setWorldTransform(transform)
+
+
 def make_glow(widget, blur, alpha):
-    """Red ember glow behind a widget, standing in for CSS text/box shadows"""
-    effect = QGraphicsDropShadowEffect(widget)
-    effect.setOffset(0, 0)
+    """Red ember glow behind a widget, standing in for CSS text/box shadows.
+    Served pre-blurred from the glow cache"""
+    effect = CachedGlowEffect(widget)
     effect.setBlurRadius(blur)
     effect.setColor(QColor(251, 54, 64, alpha))
     widget.setGraphicsEffect(effect)
@@ -285,6 +553,436 @@ def punch_curve():
     return curve
 
 
+@functools.lru_cache(maxsize=256)
+def ember_colour(alpha):
+    """The glow's ember red at one alpha; a shared QColor per alpha, so an
+    animation frame allocates none"""
+    return QColor(251, 54, 64, alpha)
+
+
+@functools.lru_cache(maxsize=None)
+def eased_progress(curve, duration_ms):
+    """The curve's value at every whole millisecond of a transition - all
+    FrameAnimation ever asks for. `curve` is the factory (ember_curve), so
+    every animator sharing it shares the table"""
+    easing = curve()
+    return tuple(easing.valueForProgress(ms / duration_ms if duration_ms else 1.0)
+                 for ms in range(duration_ms + 1))
+
+
+def glow_frame(start_state, target_state, t, quantum):
+    """(blur, alpha) t of the way from one glow state to another"""
+    # The bezier dips below zero, so clamp what reaches the effect
+    blur = start_state[0] + (target_state[0] - start_state[0]) * t
+    alpha = start_state[1] + (target_state[1] - start_state[1]) * t
+    return round(max(0.0, blur) / quantum) * quantum, max(0, min(255, round(alpha)))
+
+
+@functools.lru_cache(maxsize=64)
+def glow_keyframes(start_state, target_state, curve, duration_ms, quantum):
+    """Every frame of a glow transition, indexed by elapsed milliseconds, so a
+    tick is a lookup rather than an easing, two interpolations and a snap.
+    Nearly all transitions run between the fixed *_GLOW_* states; one cut
+    short starts from wherever it got to and just gets a table of its own"""
+    return tuple(glow_frame(start_state, target_state, t, quantum) for t in eased_progress(curve, duration_ms))
+
+
+class CardHalo(QWidget):
+    """The card's ember halo, painted beneath the card. The card outline is
+    blurred once per blur radius and device pixel ratio into a small
+    nine-slice image and stretched around the card, so pulsing it repaints
+    a ring of pre-blurred pixels instead of compositing the whole card
+    through a drop shadow. Offers the drop shadow's blurRadius/color
+    interface, so GlowAnimator drives it like any other glow"""
+
+    def __init__(self, parent, card):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.card = card
+        self.blur = 0.0
+        self.halo_colour = QColor(251, 54, 64)
+
+    def blurRadius(self):
+        return self.blur
+
+    def setBlurRadius(self, blur):
+        if blur != self.blur:
+            reach = max(self.blur, blur)
+            self.blur = float(blur)
+            self.update(self.ring_region(reach))
+
+    def color(self):
+        return QColor(self.halo_colour)
+
+    def setColor(self, colour):
+        if colour != self.halo_colour:
+            self.halo_colour = QColor(colour)
+            self.update(self.ring_region(self.blur))
+
+    def ring_region(self, blur):
+        """Where the halo shows: around the card and in its rounded-off
+        corners. The opaque card interior never needs repainting for it"""
+        card = self.card.geometry()
+        reach = math.ceil(blur) + 4  # Snapping may round the blur up by half a quantum
+        radius = CARD_CORNER_RADIUS
+        return QRegion(card.adjusted(-reach, -reach, reach, reach)) \
+            .subtracted(QRegion(card.adjusted(radius, 0, -radius, 0))) \
+            .subtracted(QRegion(card.adjusted(0, radius, 0, -radius)))
+
+    def nine_slice(self, blur, dpr):
+        """The blurred outline of a card just big enough that its middle row
+        and column sit beyond the blur's reach of every corner, so those
+        single-pixel strips stretch into exact straight edges"""
+        key = ('card-halo', blur, dpr)
+        halo = GLOW_CACHE.get(key)
+        if halo is None:
+            side = 2 * (math.ceil(blur * dpr) + math.ceil(CARD_CORNER_RADIUS * dpr)) + 1
+            silhouette = QPixmap(side, side)
+            silhouette.setDevicePixelRatio(dpr)
+            silhouette.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(silhouette)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor('#160A0E'))
+            painter.drawRoundedRect(QRectF(0, 0, side / dpr, side / dpr), CARD_CORNER_RADIUS, CARD_CORNER_RADIUS)
+            painter.end()
+            halo = render_glow(silhouette, blur)
+            halo.setDevicePixelRatio(1.0)  # Drawn in device pixels
+            GLOW_CACHE.store(key, halo)
+        return halo
+
+    def paintEvent(self, event):
+        self.paint(QPainter(self))
+
+    def paint(self, painter):
+        """Draw the halo; the painter works in this widget's coordinates"""
+        dpr = self.devicePixelRatioF()
+        quantum = blur_quantum(dpr)
+        blur = round(self.blur / quantum) * quantum
+        if blur <= 0 or self.halo_colour.alpha() == 0:
+            return
+        halo = self.nine_slice(blur, dpr)
+        reach = math.ceil(blur * dpr)
+        edge = halo.width() // 2
+        card = self.card.geometry()
+        left, top = round(card.x() * dpr) - reach, round(card.y() * dpr) - reach
+        right, bottom = round((card.x() + card.width()) * dpr) + reach, round((card.y() + card.height()) * dpr) + reach
+        middle_width, middle_height = right - left - 2 * edge, bottom - top - 2 * edge
+
+        painter.setOpacity(self.halo_colour.alpha() / 255)
+        painter.scale(1 / dpr, 1 / dpr)
+        # Four corners, then the four one-pixel edge strips stretched between
+        # them; the card covers the middle
+        for x, source_x in ((left, 0), (right - edge, edge + 1)):
+            for y, source_y in ((top, 0), (bottom - edge, edge + 1)):
+                painter.drawPixmap(x, y, halo, source_x, source_y, edge, edge)
+        painter.drawPixmap(QRectF(left + edge, top, middle_width, edge), halo, QRectF(edge, 0, 1, edge))
+        painter.drawPixmap(QRectF(left + edge, bottom - edge, middle_width, edge), halo, QRectF(edge, edge + 1, 1, edge))
+        painter.drawPixmap(QRectF(left, top + edge, edge, middle_height), halo, QRectF(0, edge, edge, 1))
+        painter.drawPixmap(QRectF(right - edge, top + edge, edge, middle_height), halo, QRectF(edge + 1, edge, edge, 1))
+
+
+class FrameScheduler(QObject):
+    """One clock for every animation: a single precise timer ticks all
+    running FrameAnimations back to back, so their effect and property
+    changes land in the same event-loop pass and Qt paints the card at most
+    once per frame. The timer only runs while something is animating and
+    the clock is not suspended"""
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls(QApplication.instance())
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.clock = QElapsedTimer()
+        self.clock.start()
+        self.animations = []
+        self.suspended_at = None
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(FRAME_MS)
+        self.timer.timeout.connect(self.tick)
+
+    def now(self):
+        return self.clock.nsecsElapsed() / 1_000_000
+
+    def add(self, animation):
+        if animation not in self.animations:
+            self.animations.append(animation)
+        if not self.timer.isActive() and self.suspended_at is None:
+            self.timer.start()
+
+    def remove(self, animation):
+        if animation in self.animations:
+            self.animations.remove(animation)
+        if not self.animations:
+            self.timer.stop()
+
+    def suspend(self):
+        """Freeze every animation where it stands: no ticks, no wakeups"""
+        if self.suspended_at is None:
+            self.suspended_at = self.now()
+            self.timer.stop()
+
+    def resume(self):
+        """Carry on from the frozen frame, as if the suspended stretch of
+        time never happened, so loops pick up in phase"""
+        if self.suspended_at is None:
+            return
+        paused = self.now() - self.suspended_at
+        self.suspended_at = None
+        for animation in self.animations:
+            animation.started_at += paused
+            animation.ticked_at += paused
+        if self.animations:
+            self.timer.start()
+
+    def tick(self):
+        now = self.now()
+        # Callbacks may start or stop animations mid-tick; only advance the
+        # ones still registered by the time their turn comes
+        for animation in list(self.animations):
+            if sip.isdeleted(animation):
+                self.remove(animation)
+            elif animation in self.animations and not animation.advance(now):
+                self.remove(animation)
+
+
+class FrameAnimation(QVariantAnimation):
+    """A QVariantAnimation ticked by the shared FrameScheduler rather than by
+    Qt's own animation timer. max_fps caps how often it actually advances,
+    for animations whose visible output changes far less often than once a
+    frame"""
+
+    def __init__(self, parent=None, max_fps=None):
+        super().__init__(parent)
+        self.max_fps = max_fps
+        self.started_at = None
+        self.ticked_at = None
+
+    def start(self):
+        scheduler = FrameScheduler.instance()
+        self.started_at = scheduler.suspended_at or scheduler.now()
+        self.ticked_at = self.started_at
+        self.setCurrentTime(0)
+        scheduler.add(self)
+
+    def stop(self):
+        if self.started_at is not None:
+            self.started_at = None
+            FrameScheduler.instance().remove(self)
+
+    def state(self):
+        return QAbstractAnimation.State.Running if self.started_at is not None else QAbstractAnimation.State.Stopped
+
+    def advance(self, now):
+        """Catch up with the scheduler's clock; False once finished"""
+        elapsed = now - self.started_at
+        total = self.totalDuration()
+        finished = 0 <= total <= elapsed
+        if not finished and self.max_fps and now - self.ticked_at < 1000 / self.max_fps:
+            return True
+        self.ticked_at = now
+        self.setCurrentTime(total if finished else int(elapsed))
+        if finished:
+            self.started_at = None
+            self.finished.emit()
+        return not finished
+
+
+class QualityGovernor(QObject):
+    """Keeps the ember theme within a frame budget on weak machines. The
+    window reports what each of its frames cost to lay out, paint and flush;
+    every GOVERNOR_WINDOW_MS of shown time the share of a core that took is
+    weighed, all but the first after each show, which pays for warming the
+    caches. Over GOVERNOR_BUDGET, quality steps down a QUALITY_LEVELS
+    level; well under it for GOVERNOR_RECOVER_WINDOWS in a row, it steps
+    back up. A level that overruns again within as many windows waits twice
+    as long before it is tried again, so a machine on the edge does not flap"""
+
+    level_changed = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.clock = QElapsedTimer()
+        self.clock.start()
+        self.level = 0
+        self.level_since = 0.0
+        self.seconds_at_level = [0.0] * len(QUALITY_LEVELS)
+        self.cost_ms = 0.0
+        self.window_start = None
+        self.quiet_windows = 0
+        self.recover_windows = [GOVERNOR_RECOVER_WINDOWS] * len(QUALITY_LEVELS)
+        self.warming = False
+        self.trial_windows = 0  # Left of a step up's trial; an overrun in them sends it back
+        self.timer = QTimer(self)
+        self.timer.setInterval(GOVERNOR_WINDOW_MS)
+        self.timer.timeout.connect(self.weigh)
+
+    def now(self):
+        return self.clock.nsecsElapsed() / 1_000_000
+
+    def start(self):
+        """Weigh frames from now on: the window is in sight"""
+        if not self.timer.isActive():
+            self.cost_ms = 0.0
+            self.window_start = self.now()
+            self.warming = True
+            self.timer.start()
+
+    def stop(self):
+        """Out of sight: no frames to weigh, and no wakeups to weigh them"""
+        self.timer.stop()
+        self.window_start = None
+
+    def record(self, cost_ms):
+        if self.window_start is not None:
+            self.cost_ms += cost_ms
+
+    def weigh(self):
+        now = self.now()
+        load = self.cost_ms / max(1.0, now - self.window_start)
+        self.cost_ms = 0.0
+        self.window_start = now
+        if self.warming:
+            self.warming = False
+            return
+        if load > GOVERNOR_BUDGET:
+            self.quiet_windows = 0
+            if self.trial_windows:
+                self.trial_windows = 0
+                self.recover_windows[self.level] = min(2 * self.recover_windows[self.level],
+                                                       GOVERNOR_RECOVER_MAX_WINDOWS)
+            if self.level < len(QUALITY_LEVELS) - 1:
+                self.set_level(self.level + 1)
+            return
+        self.trial_windows = max(0, self.trial_windows - 1)
+        if load < GOVERNOR_BUDGET * GOVERNOR_HEADROOM and self.level > 0:
+            self.quiet_windows += 1
+            if self.quiet_windows >= self.recover_windows[self.level - 1]:
+                self.quiet_windows = 0
+                self.set_level(self.level - 1)
+                self.trial_windows = GOVERNOR_RECOVER_WINDOWS
+        else:
+            self.quiet_windows = 0
+
+    def set_level(self, level):
+        now = self.now()
+        self.seconds_at_level[self.level] += (now - self.level_since) / 1000
+        self.level, self.level_since = level, now
+        self.level_changed.emit(level)
+
+    def report(self):
+        """The level now and the seconds spent at each, for diagnostics"""
+        seconds = list(self.seconds_at_level)
+        seconds[self.level] += (self.now() - self.level_since) / 1000
+        return {'level': QUALITY_LEVELS[self.level],
+                'seconds_at_level': {name: round(spent, 3) for name, spent in zip(QUALITY_LEVELS, seconds)}}
+
+
+@functools.lru_cache(maxsize=16)
+def scanline_tile(rgba, dpr):
+    """A single-dot pixmap tiled across the card to make the scanline
+    texture, built in device pixels so it always lands on the pixel grid.
+    The dot's alpha is scaled to hold the designed average brightness:
+    rounding the dot and pitch to device pixels changes how much of the
+    card the dots cover (e.g. 2 px dots in a 3 px grid at 150%). Cached per
+    colour and scale, as a press and release swap between the same few"""
+    return QPixmap.fromImage(scanline_tile_image(rgba, dpr))
+
+
+def scanline_tile_image(rgba, dpr):
+    """scanline_tile as a QImage, which unlike a QPixmap may be painted off
+    the UI thread"""
+    color = QColor.fromRgba(rgba)
+    pitch = max(1, int(SCANLINE_PITCH * dpr + 0.5))
+    dot = max(1, int(SCANLINE_DOT_SIZE * dpr + 0.5))
+    designed_coverage = (SCANLINE_DOT_SIZE / SCANLINE_PITCH) ** 2
+    alpha = min(255, round(color.alpha() * designed_coverage / (dot / pitch) ** 2))
+    tile = QImage(pitch, pitch, QImage.Format.Format_ARGB32_Premultiplied)
+    tile.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(tile)
+    painter.fillRect(0, 0, dot, dot, QColor(color.red(), color.green(), color.blue(), alpha))
+    painter.end()
+    return tile
+
+
+def scanline_texture_image(rgba, dpr, width, height):
+    """The dots tiled over a card of this size in device pixels, one pitch
+    taller (ScanlineTexture); a QImage too, for the startup preflight"""
+    tile = scanline_tile_image(rgba, dpr)
+    texture = QImage(math.ceil(width * dpr), math.ceil(height * dpr) + tile.width(),
+                     QImage.Format.Format_ARGB32_Premultiplied)
+    texture.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(texture)
+    painter.fillRect(texture.rect(), QBrush(tile))
+    painter.end()
+    return texture
+
+
+class ScanlineTexture:
+    """The scanline dots pre-tiled over the whole card in device pixels, one
+    pitch taller than the card, so any drift offset is a straight copy of a
+    sub-rectangle. Only the rounded corners need the card's clip: the top
+    and bottom bands are clipped once per drift offset and kept, so a frame
+    neither rebuilds the clip path nor re-tiles the dot"""
+
+    def __init__(self, texture, width, height, dpr):
+        self.width, self.height, self.dpr = width, height, dpr
+        self.device_width = math.ceil(width * dpr)
+        self.device_height = math.ceil(height * dpr)
+        self.texture = texture  # scanline_texture_image
+        self.pitch = texture.height() - self.device_height
+        # Rows the corner rounding reaches into, plus one for the clip's rounding
+        self.band = min(math.ceil(CARD_CORNER_RADIUS * dpr) + 1, self.device_height // 2)
+        self.bands = {}
+
+    def clipped_bands(self, offset):
+        """The top and bottom bands at a drift offset, cut to the card's
+        rounded corners exactly as the clip path does on screen"""
+        if offset not in self.bands:
+            card = QPixmap(self.device_width, self.device_height)
+            card.setDevicePixelRatio(self.dpr)
+            card.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(card)
+            clip = QPainterPath()
+            clip.addRoundedRect(QRectF(0, 0, self.width, self.height), CARD_CORNER_RADIUS, CARD_CORNER_RADIUS)
+            painter.setClipPath(clip)
+            painter.scale(1 / self.dpr, 1 / self.dpr)
+            painter.drawPixmap(QPointF(0, -offset), self.texture)
+            painter.end()
+            top = card.copy(0, 0, self.device_width, self.band)
+            bottom = card.copy(0, self.device_height - self.band, self.device_width, self.band)
+            for band in (top, bottom):
+                band.setDevicePixelRatio(1.0)  # Drawn in device pixels, like the texture
+            self.bands[offset] = (top, bottom)
+        return self.bands[offset]
+
+    def paint(self, painter, offset):
+        """Draw the card's dots at a drift offset; the painter works in device pixels"""
+        top, bottom = self.clipped_bands(offset)
+        middle = self.device_height - 2 * self.band
+        painter.drawPixmap(QPointF(0, 0), top)
+        painter.drawPixmap(QRectF(0, self.band, self.device_width, middle), self.texture,
+                           QRectF(0, self.band + offset, self.device_width, middle))
+        painter.drawPixmap(QPointF(0, self.device_height - self.band), bottom)
+
+
+@functools.lru_cache(maxsize=3)
+def scanline_texture(rgba, dpr, width, height):
+    """Idle, blip and surge textures for the card, kept across presses"""
+    key = (rgba, dpr, width, height)
+    image = PREFLIGHT.scanlines(key) if PREFLIGHT else None
+    if image is None:
+        image = scanline_texture_image(*key)
+    return ScanlineTexture(QPixmap.fromImage(image), width, height, dpr)
+
+
 class ScanlineOverlay(QWidget):
     """Dotted CRT-style texture drifting slowly down the card"""
 
@@ -292,16 +990,46 @@ class ScanlineOverlay(QWidget):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         self.drift_offset = 0
+        self.drift_ms = SCANLINE_DRIFT_MS
+        self.drifting = True
+        self.flared = False  # A blip or surge holds the tile; the idle drift waits for calm() or end_blip()
         self.tile = self.build_tile(QColor(0, 0, 0, SCANLINE_DOT_ALPHA))
 
-        self.drift_animation = QVariantAnimation(self)
+        self.drift_animation = FrameAnimation(self, max_fps=self.drift_fps())
         self.drift_animation.setStartValue(0.0)
         self.drift_animation.setEndValue(float(SCANLINE_PITCH))
-        self.drift_animation.setDuration(SCANLINE_DRIFT_MS)
+        self.drift_animation.setDuration(self.drift_ms)
         self.drift_animation.setLoopCount(-1)
         self.drift_animation.valueChanged.connect(self.on_drift)
         self.drift_animation.start()
 
+    def drift_fps(self):
+        """Drift frames a second needed to place every device-pixel step
+        on time; anything faster only re-derives the same offset"""
+        steps_per_second = self.tile.width() * 1000 / self.drift_ms
+        return math.ceil(steps_per_second * SCANLINE_DRIFT_SAMPLES)
+
+    def set_drift(self, drift_ms, drifting):
+        """Slow the idle drift down (ms per pitch) or hold the dots still,
+        for the quality governor. A blip or surge runs either way: while one
+        holds the tile, the drift is only started or stopped once it settles"""
+        self.drift_ms = drift_ms
+        self.drift_animation.setDuration(drift_ms)
+        self.drift_animation.max_fps = self.drift_fps()
+        if drifting != self.drifting:
+            self.drifting = drifting
+            if self.flared:
+                return
+            if drifting:
+                self.drift_animation.start()
+            else:
+                self.drift_animation.stop()
+
+    def resume_drift(self):
+        self.flared = False
+        if self.drifting:
+            self.drift_animation.start()
+
     def on_drift(self, value):
         # Repaint only on whole-device-pixel steps so the drift stays cheap
         # and the texture never lands between pixels
@@ -312,50 +1040,38 @@ class ScanlineOverlay(QWidget):
             self.update()
 
     def paintEvent(self, event):
-        painter = QPainter(self)
-        clip = QPainterPath()
-        clip.addRoundedRect(QRectF(self.rect()), 6, 6)  # Match the card's corner radius
-        painter.setClipPath(clip)
+        self.paint(QPainter(self))
+
+    def paint(self, painter):
+        """Draw the dots; the painter works in this widget's coordinates"""
         dpr = self.devicePixelRatioF()
         if dpr != self.tile_dpr:
             self.tile = self.build_tile(self.tile_colour)  # Moved to a monitor with a new scale
-        # Tile in whole device pixels: at fractional display scales, tiling a
+            self.drift_animation.max_fps = self.drift_fps()
+        # Paint in whole device pixels: at fractional display scales, tiling a
         # logical-pixel pattern resamples the dots differently at each drift
         # offset, pulsing the whole texture bright/dim - the card visibly
         # flashed during the press blip and the exit surge at 150%
         painter.scale(1 / dpr, 1 / dpr)
         pitch = self.tile.width()
-        painter.drawTiledPixmap(QRectF(0, 0, self.width() * dpr, self.height() * dpr),
-                                self.tile, QPointF(0, (pitch - self.drift_offset) % pitch))
+        texture = scanline_texture(self.tile_colour.rgba(), dpr, self.width(), self.height())
+        texture.paint(painter, (pitch - self.drift_offset) % pitch)
 
     def build_tile(self, color):
-        """A single-dot pixmap tiled across the card to make the scanline
-        texture, built in device pixels so it always lands on the pixel grid.
-        The dot's alpha is scaled to hold the designed average brightness:
-        rounding the dot and pitch to device pixels changes how much of the
-        card the dots cover (e.g. 2 px dots in a 3 px grid at 150%)"""
-        dpr = self.devicePixelRatioF()
-        pitch = max(1, int(SCANLINE_PITCH * dpr + 0.5))
-        dot = max(1, int(SCANLINE_DOT_SIZE * dpr + 0.5))
-        designed_coverage = (SCANLINE_DOT_SIZE / SCANLINE_PITCH) ** 2
-        alpha = min(255, round(color.alpha() * designed_coverage / (dot / pitch) ** 2))
+        """The dot tile for a colour at the current scale (scanline_tile)"""
         self.tile_colour = QColor(color)
-        self.tile_dpr = dpr
-        tile = QPixmap(pitch, pitch)
-        tile.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(tile)
-        painter.fillRect(0, 0, dot, dot, QColor(color.red(), color.green(), color.blue(), alpha))
-        painter.end()
-        return tile
+        self.tile_dpr = self.devicePixelRatioF()
+        return scanline_tile(color.rgba(), self.tile_dpr)
 
     def surge(self, duration_ms):
         """Flare the dots ember-red and race the drift, like a power surge"""
+        self.flared = True
         self.drift_animation.stop()
         if hasattr(self, 'blip_animation'):
             self.blip_animation.stop()  # A press-blip in flight must not clobber the surge tile
         self.tile = self.build_tile(QColor(251, 54, 64, 200))
 
-        self.surge_animation = QVariantAnimation(self)
+        self.surge_animation = FrameAnimation(self)
         self.surge_animation.setStartValue(0.0)
         self.surge_animation.setEndValue(float(SCANLINE_PITCH) * 8)
         self.surge_animation.setDuration(duration_ms)
@@ -367,12 +1083,13 @@ class ScanlineOverlay(QWidget):
         """Flare the dots red the instant the button is pressed. Races briefly, then
         holds at the flared tile — it sustains for as long as the button stays down
         and only settles back once end_blip() is called on release"""
+        self.flared = True
         self.drift_animation.stop()
         if hasattr(self, 'blip_animation'):
             self.blip_animation.stop()
         self.tile = self.build_tile(QColor(251, 54, 64, BLIP_DOT_ALPHA))
 
-        self.blip_animation = QVariantAnimation(self)
+        self.blip_animation = FrameAnimation(self)
         self.blip_animation.setStartValue(0.0)
         self.blip_animation.setEndValue(float(SCANLINE_PITCH) * 3)
         self.blip_animation.setDuration(BLIP_DURATION_MS)
@@ -380,6 +1097,15 @@ class ScanlineOverlay(QWidget):
         self.blip_animation.valueChanged.connect(self.on_drift)
         self.blip_animation.start()
 
+    def calm(self):
+        """Drop any surge or blip in flight and go back to the idle drift"""
+        for animation in (getattr(self, 'surge_animation', None), getattr(self, 'blip_animation', None)):
+            if animation is not None:
+                animation.stop()
+        self.tile = self.build_tile(QColor(0, 0, 0, SCANLINE_DOT_ALPHA))
+        self.update()
+        self.resume_drift()
+
     def end_blip(self):
         """Restore the idle dim tile and resume the ordinary drift once the button
         is released — a no-op if the surge has already taken over the tile"""
@@ -387,21 +1113,209 @@ class ScanlineOverlay(QWidget):
             self.blip_animation.stop()
         self.tile = self.build_tile(QColor(0, 0, 0, SCANLINE_DOT_ALPHA))
         self.update()
-        self.drift_animation.start()
+        self.resume_drift()
+
+
+def paint_widget(painter, widget):
+    """Paint a widget's own look, without its children, the way its
+    paintEvent and Qt's background pass would: through its style, style
+    sheet included, so the result matches the widget painting itself"""
+    style = widget.style()
+    palette = widget.palette()
+    painter.save()
+    painter.setClipRect(QRectF(widget.rect()), Qt.ClipOperation.IntersectClip)
+    # What a QPainter opened on the widget would start out with
+    painter.setFont(widget.font())
+    painter.setPen(QPen(palette.brush(widget.foregroundRole()), 1))
+    painter.setBackground(palette.brush(widget.backgroundRole()))
+    if widget.testAttribute(Qt.WidgetAttribute.WA_StyledBackground):
+        option = QStyleOption()
+        option.initFrom(widget)
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_Widget, option, painter, widget)
+    if isinstance(widget, QAbstractButton):
+        option = QStyleOptionButton()
+        widget.initStyleOption(option)
+        element = QStyle.ControlElement.CE_RadioButton if isinstance(widget, QRadioButton) \
+            else QStyle.ControlElement.CE_PushButton
+        style.drawControl(element, option, painter, widget)
+    elif isinstance(widget, QFrame):
+        option = QStyleOptionFrame()
+        widget.initStyleOption(option)
+        style.drawControl(QStyle.ControlElement.CE_ShapedFrame, option, painter, widget)
+        if isinstance(widget, QLabel):
+            alignment = QStyle.visualAlignment(widget.layoutDirection(), widget.alignment())
+            style.drawItemText(painter, widget.contentsRect(), int(alignment), palette,
+                               widget.isEnabled(), widget.text(), widget.foregroundRole())
+    painter.restore()
+
+
+def looks(widget):
+    """Everything the widgets under a widget may change their look with
+    while the app runs, in one pass: where each sits, what it shows and
+    how, and its glow. Far cheaper than glow_signature and render_state
+    for every one of them, so it can be checked on every frame"""
+    state = []
+    for part in widget.findChildren(QWidget):
+        palette = part.palette()
+        effect = part.graphicsEffect()
+        text = part.text() if isinstance(part, (QLabel, QAbstractButton)) else None
+        pressable = (part.isDown(), part.isChecked()) if isinstance(part, QAbstractButton) else None
+        state.append((part.geometry(), part.isVisible(), part.isEnabled(), part.hasFocus(), part.underMouse(),
+                      text, pressable, tuple(part.property(bytes(name).decode()) for name in part.dynamicPropertyNames()),
+                      palette.color(QPalette.ColorRole.WindowText).rgba(),
+                      palette.color(QPalette.ColorRole.ButtonText).rgba(),
+                      (effect.isEnabled(), effect.blurRadius(), effect.color().rgba())
+                      if isinstance(effect, CachedGlowEffect) else None))
+    return state
+
+
+@functools.lru_cache(maxsize=4)
+def card_regions(width, height, dpr):
+    """The card's device pixels split into its opaque inside and the
+    antialiased rim around it, rounded corners and all"""
+    band = math.ceil(2 * dpr)
+    corner = math.ceil((CARD_CORNER_RADIUS + 2) * dpr)
+    inside = QRegion(band, corner, width - 2 * band, height - 2 * corner) \
+        .united(QRegion(corner, band, width - 2 * corner, height - 2 * band))
+    return inside, QRegion(0, 0, width, height).subtracted(inside)
+
+
+class CardCanvas(QWidget):
+    """Opt-in (--single-canvas) renderer painting the whole card - halo,
+    panel, text, glowing digits, mode rows, button and scanlines - in one
+    paintEvent. The widget tree stays as the model: it lays the card out,
+    takes focus, keys and clicks, and its style sheets, palettes and glow
+    effects still decide every look. A fully transparent opacity effect
+    keeps the tree from painting, yet its updates still dirty the window
+    where they happen, and the canvas on top repaints there.
+
+    Everything on the card but the scanlines is kept as one layer, redrawn
+    only when some widget's state changes, so a drift or pulse frame is
+    three blits: halo, layer, dots. Glowing widgets are drawn into kept
+    source pixmaps too, with their glows served from the glow cache, so a
+    glow transition redraws the layer from pixmaps rather than text"""
+
+    def __init__(self, parent, card, halo, overlay):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.card, self.halo, self.overlay = card, halo, overlay
+        self.sources = {}
+        self.layer = None
+        self.layer_key = None
+        for widget in (card, halo):
+            silence = QGraphicsOpacityEffect(widget)
+            silence.setOpacity(0.0)
+            widget.setGraphicsEffect(silence)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.save()
+        self.halo.paint(painter)
+        painter.restore()
+        dpr = self.devicePixelRatioF()
+        layer = self.card_layer(dpr)
+        inside, rim = card_regions(layer.width(), layer.height(), dpr)
+        painter.translate(QPointF(self.card.pos()))
+        # The layer only covers the card's opaque inside. Blended as a partly
+        # transparent layer, the antialiased rim would come out a shade off
+        # what the card paints straight over the halo, so the rim is painted
+        # straight too. Clipped in device pixels, so the two tile exactly
+        painter.save()
+        painter.scale(1 / dpr, 1 / dpr)
+        painter.setClipRegion(inside)
+        painter.scale(dpr, dpr)
+        painter.drawPixmap(QPointF(0, 0), layer)
+        painter.scale(1 / dpr, 1 / dpr)
+        painter.setClipRegion(rim)
+        painter.scale(dpr, dpr)
+        self.paint_tree(painter, self.card, within=rim)
+        painter.restore()
+        painter.translate(QPointF(self.overlay.pos()))
+        self.overlay.paint(painter)
+
+    def card_layer(self, dpr):
+        """The card and all on it but the scanlines, kept while none of it changes"""
+        key = (dpr, self.card.size(), self.card.styleSheet(), looks(self.card))
+        if key != self.layer_key:
+            self.layer = QPixmap(math.ceil(self.card.width() * dpr), math.ceil(self.card.height() * dpr))
+            self.layer.setDevicePixelRatio(dpr)
+            self.layer.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(self.layer)
+            self.paint_tree(painter, self.card)
+            painter.end()
+            self.layer_key = key
+        return self.layer
+
+    def paint_tree(self, painter, widget, within=None):
+        """The widget, then its children in stacking order, each clipped to
+        its parent as Qt clips them; the painter sits at the widget's origin.
+        Children whose glow cannot reach `within` (a region of the widget's
+        device pixels) are left out"""
+        paint_widget(painter, widget)
+        scale = QTransform.fromScale(self.devicePixelRatioF(), self.devicePixelRatioF())
+        for child in widget.children():
+            # The display inputs are invisible models; the overlay labels show
+            # them. The scanlines go over the layer (paintEvent)
+            if not isinstance(child, QWidget) or child.isHidden() or child is self.overlay \
+                    or isinstance(child, QAbstractSpinBox):
+                continue
+            effect = child.graphicsEffect()
+            glowing = isinstance(effect, CachedGlowEffect) and effect.isEnabled()
+            if within is not None:
+                reach = effect.boundingRectFor(QRectF(child.geometry())) if glowing else QRectF(child.geometry())
+                if not within.intersects(scale.mapRect(reach).toAlignedRect()):
+                    continue
+            painter.save()
+            painter.setClipRect(QRectF(widget.rect()), Qt.ClipOperation.IntersectClip)
+            painter.translate(QPointF(child.pos()))
+            if glowing:
+                self.paint_glowing(painter, child, effect)
+            else:
+                self.paint_tree(painter, child)
+            painter.restore()
+
+    def paint_glowing(self, painter, widget, effect):
+        """Draw a glowing widget as its CachedGlowEffect would, from a padded
+        source pixmap in device coordinates (QGraphicsEffect.sourcePixmap)"""
+        signature = glow_signature(widget)
+        transform = painter.worldTransform()
+        dpr = painter.device().devicePixelRatioF()
+        key = (signature, render_state(widget), effect.blurRadius(), dpr, transform.dx(), transform.dy())
+        kept = self.sources.get(widget)
+        if kept is None or kept[0] != key:
+            area = effect.boundingRectFor(transform.mapRect(QRectF(widget.rect()))).toAlignedRect()
+            source = QPixmap(area.size() * dpr)
+            source.setDevicePixelRatio(dpr)
+            source.fill(Qt.GlobalColor.transparent)
+            source_painter = QPainter(source)
+            source_painter.translate(transform.map(QPointF(0, 0)) - QPointF(area.topLeft()))
+            self.paint_tree(source_painter, widget)
+            source_painter.end()
+            kept = self.sources[widget] = (key, source, QPointF(area.topLeft()))
+        _, source, offset = kept
+        effect.composite(painter, signature, source, offset)
 
 
 class GlowAnimator:
     """Eases a glow effect between states along the ember bezier curve"""
 
-    def __init__(self, effect, curve=None):
+    baked = False  # Quality governor: jump straight to each new state, no frames between
+
+    def __init__(self, effect, curve=ember_curve):
         self.effect = effect
-        self.curve = curve or ember_curve()
+        self.curve = curve
         self.start_state = (effect.blurRadius(), effect.color().alpha())
         self.target_state = self.start_state
-        self.animation = QVariantAnimation(effect)
+        self.frames = None
+        # Runs linearly through the elapsed milliseconds; the curve is baked
+        # into the keyframes (glow_keyframes)
+        self.animation = FrameAnimation(effect)
         self.animation.setStartValue(0.0)
-        self.animation.setEndValue(1.0)
-        self.animation.valueChanged.connect(self.apply_progress)
+        self.animation.valueChanged.connect(self.apply_frame)
+
+    def blur_quantum(self):
+        widget = self.effect.parent()
+        return blur_quantum(widget.devicePixelRatioF() if isinstance(widget, QWidget) else 1.0)
 
     def snapped_blur(self, blur: float) -> float:
         """Quantise an animated blur radius so the drop shadow's padding stays
@@ -409,36 +1323,41 @@ class GlowAnimator:
         at fractional display scales (125%/150%/...) an off-grid padding
         re-rounds to device pixels differently as it animates, visibly
         jittering the widget by a pixel or two per frame (Qt 6.10)"""
-        widget = self.effect.parent()
-        dpr = widget.devicePixelRatioF() if isinstance(widget, QWidget) else 1.0
-        quantum = next((q for q in (1, 2, 4, 8) if dpr * q == round(dpr * q)), 4)
+        quantum = self.blur_quantum()
         return round(blur / quantum) * quantum
 
     def transition_to(self, blur: float, alpha: int, duration_ms: int, force: bool = False):
         target = (float(blur), int(alpha))
         current = (self.effect.blurRadius(), self.effect.color().alpha())
         if not force and target == self.target_state:
-            if self.animation.state() == QVariantAnimation.State.Running or current == target:
+            if self.animation.state() == QAbstractAnimation.State.Running or current == target:
                 return
         self.animation.stop()
         self.start_state = current
         self.target_state = target
+        if GlowAnimator.baked:
+            self.frames = glow_keyframes(current, target, self.curve, 0, self.blur_quantum())
+            self.apply_frame(0)
+            return
+        self.frames = glow_keyframes(current, target, self.curve, duration_ms, self.blur_quantum())
+        # Re-ranging the animation re-emits its value at the old time, which
+        # may lie past the end of the new keyframes; start() emits frame 0
+        self.animation.blockSignals(True)
         self.animation.setDuration(duration_ms)
-        self.animation.setEasingCurve(self.curve)
+        self.animation.setEndValue(float(duration_ms))
+        self.animation.blockSignals(False)
         self.animation.start()
 
     def flare_to(self, flare_state: tuple[float, int], settle_state: tuple[float, int], duration_ms: int):
         """Jump to the flare state, then settle back along the curve"""
         self.effect.setBlurRadius(self.snapped_blur(flare_state[0]))
-        self.effect.setColor(QColor(251, 54, 64, flare_state[1]))
+        self.effect.setColor(ember_colour(flare_state[1]))
         self.transition_to(*settle_state, duration_ms, force=True)
 
-    def apply_progress(self, t):
-        # The bezier dips below zero, so clamp what reaches the effect
-        blur = self.start_state[0] + (self.target_state[0] - self.start_state[0]) * t
-        alpha = self.start_state[1] + (self.target_state[1] - self.start_state[1]) * t
-        self.effect.setBlurRadius(self.snapped_blur(max(0.0, blur)))
-        self.effect.setColor(QColor(251, 54, 64, max(0, min(255, round(alpha)))))
+    def apply_frame(self, elapsed_ms):
+        blur, alpha = self.frames[round(elapsed_ms)]
+        self.effect.setBlurRadius(blur)
+        self.effect.setColor(ember_colour(alpha))
 
 
 def typed_digit(event):
@@ -478,6 +1397,13 @@ class DurationSpinBox(QSpinBox):
             return hours * 60 + mins
         return numbers[0]
 
+    def section_texts(self):
+        """The hour ('' under an hour) and minute parts of the shown value"""
+        text = self.textFromValue(self.value())
+        if ' h ' in text:
+            return text[:text.index(' h ') + 2], text[text.index(' h ') + 3:]
+        return '', text
+
     def validate(self, text, pos):
         if re.fullmatch(r'[\dhmin ]*', text):
             return QValidator.State.Acceptable, text, pos
@@ -563,14 +1489,191 @@ class DurationSpinBox(QSpinBox):
         self.lineEdit().setSelection(section.start(), section.end() - section.start())
 
 
+class StartupPreflight:
+    """Startup work that needs neither the UI thread nor the widgets, run on
+    a thread pool while QApplication and the window are being built: the
+    font files read, the icon decoded, the pending-shutdown note checked
+    against the boot and shutdown times, and the card's scanline texture
+    tiled once the window knows its size. Each result is joined where it is
+    first used, all before the first paint; the pending check alone is never
+    waited on (PendingScheduleDetector)"""
+
+    def __init__(self, tracer=None):
+        self.tracer = tracer
+        self.pool = ThreadPoolExecutor(max_workers=PREFLIGHT_WORKERS, thread_name_prefix='preflight')
+        self.timings = {}  # Task name: (start, end) in perf_counter seconds
+        self.futures = {'fonts': self.submit('read fonts', read_bundled_fonts),
+                        'icon': self.submit('decode icon', QImage, resource_path('assets', 'icon.png')),
+                        'pending': self.submit('load_pending_epoch', load_pending_epoch)}
+        self.scanline_key = None
+
+    def submit(self, name, function, *args):
+        def task():
+            start = time.perf_counter()
+            trace_start = self.tracer.now() if self.tracer else None
+            try:
+                return function(*args)
+            finally:
+                self.timings[name] = (start, time.perf_counter())
+                if self.tracer:
+                    self.tracer.complete(name, 'preflight', trace_start)
+        return self.pool.submit(task)
+
+    def prepare_scanlines(self, rgba, dpr, width, height):
+        """Tile the texture the card will first paint with (scanline_texture).
+        The last task: the pool lets its threads go once they are done"""
+        self.scanline_key = (rgba, dpr, width, height)
+        self.futures['scanlines'] = self.submit('scanline texture', scanline_texture_image, *self.scanline_key)
+        self.pool.shutdown(wait=False)
+
+    def result(self, name):
+        """A task's result, waiting for it if need be; each is handed out once"""
+        return self.futures.pop(name).result()
+
+    def claim(self, name):
+        """A task's future, for the caller to wait on or not; None once claimed"""
+        return self.futures.pop(name, None)
+
+    def scanlines(self, key):
+        """The preflighted texture if it is the one asked for, else None"""
+        if key != self.scanline_key or 'scanlines' not in self.futures:
+            return None
+        return self.result('scanlines')
+
+
+PREFLIGHT = None  # The StartupPreflight when __main__ started one
+
+
+class PendingScheduleDetector(QObject):
+    """Checks for an already pending shutdown on a worker thread, so the
+    window paints without waiting on the disk and the registry at a busy
+    logon. The answer comes back on the UI thread through `detected`"""
+
+    detected = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.started = False
+        self.done = threading.Event()
+        self.epoch = None
+
+    def start(self):
+        """Check (again: a resident window re-checks on every show). The
+        first check is the startup preflight's, most likely answered by now"""
+        self.started = True
+        self.done.clear()
+        preflight = PREFLIGHT.claim('pending') if PREFLIGHT else None
+        if preflight is None:
+            threading.Thread(target=self.run, name='pending-schedule', daemon=True).start()
+        elif preflight.done():
+            self.finish(preflight)  # In time for the first paint
+        else:
+            preflight.add_done_callback(self.finish)
+
+    def run(self):
+        try:
+            self.epoch = load_pending_epoch()
+        finally:
+            self.done.set()
+            self.detected.emit(self.epoch)
+
+    def finish(self, future):
+        # A check that failed found nothing, as when run dies on its thread
+        if future.exception() is None:
+            self.epoch = future.result()
+        self.done.set()
+        self.detected.emit(self.epoch)
+
+    def answered(self):
+        """Whether the latest check is in, or none was ever started"""
+        return not self.started or self.done.is_set()
+
+
+class InstanceServer(QObject):
+    """Listens on the single-instance channel on a worker thread. A later
+    launch asking for the window arrives on the UI thread through
+    `activation_requested`"""
+
+    activation_requested = pyqtSignal()
+
+    def __init__(self, listener, parent=None):
+        super().__init__(parent)
+        self.listener = listener
+        self.closed = False
+
+    def start(self):
+        threading.Thread(target=self.run, name='single-instance', daemon=True).start()
+
+    def run(self):
+        while not self.closed:
+            try:
+                message = self.listener.accept()
+            except OSError:
+                return  # Closed on the way out
+            if message == single_instance.ACTIVATE_MESSAGE:
+                self.activation_requested.emit()
+
+    def close(self):
+        """Let the next launch be the instance while this one winds down"""
+        self.closed = True
+        self.listener.close()
+
+
+class ShutdownDispatcher(QObject):
+    """Runs the shutdown command on a worker thread so the press feedback
+    never waits on it. The outcome comes back on the UI thread through
+    `finished`: None on success, else the exception that stopped it"""
+
+    finished = pyqtSignal(object)
+
+    def dispatch(self, command, seconds, epoch):
+        threading.Thread(target=self.run, args=(command, seconds, epoch), name='shutdown-dispatch',
+                         daemon=True).start()
+
+    def run(self, command, seconds, epoch):
+        try:
+            command(seconds, epoch)
+        except Exception as error:  # Reaches the error dialog instead of dying with the thread
+            self.finished.emit(error)
+        else:
+            self.finished.emit(None)
+
+
 class LifeControlButtonApp(QMainWindow):
     def __init__(self):
         super().__init__()
 
         # Set application icon
-        self.setWindowIcon(QIcon(resource_path('assets', 'icon.png')))
+        self.setWindowIcon(app_icon())
 
         self.overlays_ready = False
+        self.overlay_layout_pending = False
+        self.shutdown_epoch = None
+        self.session_locked = False
+        self.shutdown_scheduled = False
+        self.dispatched_epoch = None
+        # Resident (--resident): closing only hides the built window, for the
+        # next launch to bring back without paying for startup (come_forward)
+        self.resident = False
+        self.card_canvas = None  # --single-canvas (use_single_canvas)
+        self.shutdown_backend = default_shutdown_backend()
+        # Reopened while a shutdown is already pending: show the countdown instead
+        # of letting a doomed second schedule end in the error popup. Checked
+        # once the window is up (showEvent)
+        self.pending_detector = PendingScheduleDetector(self)
+        self.pending_detector.detected.connect(self.on_pending_detected)
+        # A press made before the check answered waits for it here, not on the UI thread
+        self.held_press_seconds = None
+        self.press_hold_timer = QTimer(self)
+        self.press_hold_timer.setSingleShot(True)
+        self.press_hold_timer.setInterval(int(PENDING_DETECTION_WAIT_S * 1000))
+        self.press_hold_timer.timeout.connect(self.release_held_press)
+        self.shutdown_dispatcher = ShutdownDispatcher(self)
+        self.shutdown_dispatcher.finished.connect(self.on_shutdown_dispatched)
+        self.exit_timer = QTimer(self)
+        self.exit_timer.setSingleShot(True)
+        self.exit_timer.setInterval(EXIT_DELAY_MS)
+        self.exit_timer.timeout.connect(self.close_once_scheduled)
         self.set_theme()
         self.init_ui()
 
@@ -578,16 +1681,16 @@ class LifeControlButtonApp(QMainWindow):
         self.adjustSize()
         self.setFixedSize(self.size())
 
-        # Catch Return/numpad-Enter application-wide (regardless of which widget has
-        # focus) via eventFilter rather than QShortcut, so press and release map onto
-        # the button's real down state instead of animateClick()'s fixed-timer release
-        QApplication.instance().installEventFilter(self)
-
-        # Reopened while a shutdown is already pending: show the countdown instead
-        # of letting a doomed second schedule end in the error popup
-        pending_epoch = load_pending_epoch()
-        if pending_epoch:
-            self.enter_countdown_mode(pending_epoch)
+        # Catch Return/numpad-Enter on every focusable widget (whichever has focus
+        # gets the key) via eventFilter rather than QShortcut, so press and release
+        # map onto the button's real down state instead of animateClick()'s
+        # fixed-timer release. Scoped to those widgets rather than the whole
+        # application, so paints and timer ticks never cross into Python - and
+        # Enter in the error dialog stays the dialog's own. The inputs and their
+        # line edits are among them, for section jumps, digits and focus glow
+        for widget in self.findChildren(QWidget):
+            if widget.focusPolicy() != Qt.FocusPolicy.NoFocus:
+                widget.installEventFilter(self)
 
     def set_theme(self):
         self.setWindowTitle("Life Control Button")
@@ -608,8 +1711,10 @@ class LifeControlButtonApp(QMainWindow):
         self.card.setStyleSheet(
             "#card {background-color: #160A0E; border: 1px solid rgba(251, 54, 64, 45%); border-radius: 6px;}"
         )
-        self.card_glow = make_glow(self.card, CARD_PULSE_BLUR, CARD_PULSE_ALPHA_MIN)
-        self.card_glow_animator = GlowAnimator(self.card_glow)
+        self.card_halo = CardHalo(central_widget, self.card)
+        self.card_halo.setBlurRadius(CARD_PULSE_BLUR)
+        self.card_halo.setColor(QColor(251, 54, 64, CARD_PULSE_ALPHA_MIN))
+        self.card_glow_animator = GlowAnimator(self.card_halo)
 
         card_layout = QVBoxLayout()
         card_layout.setContentsMargins(48, 52, 48, 52)
@@ -635,12 +1740,7 @@ class LifeControlButtonApp(QMainWindow):
         # Title, sized to span the full content width so it reads as centred
         title_label = QLabel("Liberation, not limitation")
         content_width = 460 - 48 - 48
-        title_size = 14
-        while title_size < 40:
-            candidate = QFontMetrics(fira_mono(title_size + 1, QFont.Weight.Medium, -0.3))
-            if candidate.horizontalAdvance(title_label.text()) > content_width:
-                break
-            title_size += 1
+        title_size = fitting_pixel_size(title_label.text(), content_width, 14, 40, QFont.Weight.Medium, -0.3)
         title_label.setFont(fira_mono(title_size, QFont.Weight.Medium, -0.3))
         title_label.setStyleSheet("color: #F8FFE5;")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -660,7 +1760,7 @@ class LifeControlButtonApp(QMainWindow):
         self.time_edit.setFont(time_font)
         self.time_edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.time_edit.setStyleSheet(display_input_style)
-        self.time_edit.setFixedWidth(QFontMetrics(time_font).horizontalAdvance('23:00') + 28)
+        self.time_edit.setFixedWidth(TextMetrics.of(time_font).advance('23:00') + 28)
         self.time_edit.setDisplayFormat("HH:mm")
         self.time_edit.setWrapping(True)  # 23 wraps to 0, 59 to 0
         self.time_edit.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.NoButtons)
@@ -688,7 +1788,7 @@ class LifeControlButtonApp(QMainWindow):
         self.duration_spinbox.setFont(duration_font)
         self.duration_spinbox.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.duration_spinbox.setStyleSheet(display_input_style)
-        self.duration_spinbox.setFixedWidth(QFontMetrics(duration_font).horizontalAdvance('23 h 55 min') + 28)
+        self.duration_spinbox.setFixedWidth(TextMetrics.of(duration_font).advance('23 h 55 min') + 28)
         self.duration_spinbox.setRange(5, 1440)  # 5 minutes up to 24 hours
         self.duration_spinbox.setValue(60)  # Default one hour
         self.duration_spinbox.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.NoButtons)
@@ -745,8 +1845,9 @@ class LifeControlButtonApp(QMainWindow):
         # "Get Life Control" button, outlined
         self.control_button = QPushButton("GET LIFE CONTROL")
         self.control_button.setFont(fira_mono(14, QFont.Weight.DemiBold, 1.7))
-        self.control_button.setStyleSheet(BUTTON_STYLE_NORMAL)
-        self.control_button_glow = GlowAnimator(make_glow(self.control_button, *BUTTON_GLOW_BASE), curve=punch_curve())
+        self.control_button.setStyleSheet(BUTTON_STYLE)
+        self.set_button_mode('ready')
+        self.control_button_glow = GlowAnimator(make_glow(self.control_button, *BUTTON_GLOW_BASE), curve=punch_curve)
         self.control_button.clicked.connect(self.dispatch_shutdown)
         self.control_button.setDefault(True)
         card_layout.addWidget(self.control_button)
@@ -755,6 +1856,13 @@ class LifeControlButtonApp(QMainWindow):
         outer_layout.addWidget(self.card, alignment=Qt.AlignmentFlag.AlignCenter)
         central_widget.setLayout(outer_layout)
         self.setCentralWidget(central_widget)
+        # A style sheet's polish reverts the palettes of the widgets under it,
+        # and the card's re-polishes as it joins the window: polish the
+        # finished tree now, and only then colour its text
+        self.ensurePolished()
+        for label in (self.hour_label, self.colon_label, self.minute_label,
+                      self.duration_hour_label, self.duration_minute_label):
+            self.set_label_heat(label, GLOW_TEXT_BASE)
 
         # Dotted scanline texture drifting over the whole card
         self.scanline_overlay = ScanlineOverlay(self.card)
@@ -762,7 +1870,7 @@ class LifeControlButtonApp(QMainWindow):
         self.control_button.released.connect(self.scanline_overlay.end_blip)
 
         # Pulse the card glow like the design's emberpulse keyframes
-        self.pulse_animation = QVariantAnimation(self)
+        self.pulse_animation = FrameAnimation(self, max_fps=CARD_PULSE_FPS)
         self.pulse_animation.setStartValue(0.0)
         self.pulse_animation.setKeyValueAt(0.5, 1.0)
         self.pulse_animation.setEndValue(0.0)
@@ -772,6 +1880,10 @@ class LifeControlButtonApp(QMainWindow):
         self.pulse_animation.valueChanged.connect(self.update_card_glow)
         self.pulse_animation.start()
 
+        # Gives the theme up a piece at a time when frames cost too much
+        self.quality_governor = QualityGovernor(self)
+        self.quality_governor.level_changed.connect(self.apply_quality)
+
         self.update_input_visibility()
 
         # Keyboard navigation: Tab cycles through the controls, hidden inputs are skipped
@@ -784,22 +1896,15 @@ class LifeControlButtonApp(QMainWindow):
         self.time_edit.setFocus()
         self.time_edit.setSelectedSection(QTimeEdit.Section.HourSection)
 
-        # Left/right section jumps plus focus/click glow updates
-        self.time_edit.installEventFilter(self)
-        self.duration_spinbox.installEventFilter(self)
-        self.time_edit.lineEdit().installEventFilter(self)
-        self.duration_spinbox.lineEdit().installEventFilter(self)
-
         # Reactive glow triggers
         self.time_edit.timeChanged.connect(self.on_time_interaction)
-        self.duration_spinbox.textChanged.connect(lambda _: self.layout_duration_overlay())
-        self.duration_spinbox.valueChanged.connect(lambda _: self.refresh_display_glow(flare=True))
-        self.duration_spinbox.sectionSwitched.connect(lambda: self.refresh_display_glow(flare=True))
+        self.duration_spinbox.textChanged.connect(lambda _: self.on_duration_text())
+        self.duration_spinbox.valueChanged.connect(lambda _: self.refresh_duration_glow(flare=True))
+        self.duration_spinbox.sectionSwitched.connect(lambda: self.refresh_duration_glow(flare=True))
 
     def make_display_label(self, parent, font):
         label = QLabel('', parent)
         label.setFont(font)
-        label.setStyleSheet("color: #FB3640; background: transparent;")
         label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         return label
 
@@ -832,15 +1937,112 @@ class LifeControlButtonApp(QMainWindow):
         radio.setLayout(row_layout)
         return radio, mark, text, row_glow, mark_glow
 
+    def use_single_canvas(self):
+        """Paint the card through one CardCanvas rather than the widget tree"""
+        self.card_canvas = CardCanvas(self.centralWidget(), self.card, self.card_halo, self.scanline_overlay)
+
     def showEvent(self, event):
         super().showEvent(event)
         if not self.overlays_ready:
             self.overlays_ready = True
-            self.layout_time_overlay()
-            self.layout_duration_overlay()
+            self.request_overlay_layout()
             self.refresh_display_glow()
             self.scanline_overlay.setGeometry(self.card.rect())
             self.scanline_overlay.raise_()
+            self.card_halo.setGeometry(self.centralWidget().rect())
+            self.card_halo.lower()
+            if self.card_canvas is not None:
+                self.card_canvas.setGeometry(self.centralWidget().rect())
+                self.card_canvas.raise_()
+            # Expose events reach the native window, not the widget
+            self.windowHandle().installEventFilter(self)
+            self.watch_session_lock()
+            self.watch_cloaking()
+            self.pending_detector.start()
+        self.update_animation_suspension()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_animation_suspension()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.update_animation_suspension()
+
+    def watch_session_lock(self):
+        """Ask Windows for lock/unlock notices; a locked session keeps the
+        window shown and exposed, but nobody can see it"""
+        if sys.platform == 'win32':
+            NOTIFY_FOR_THIS_SESSION = 0
+            ctypes.WinDLL('wtsapi32').WTSRegisterSessionNotification(int(self.winId()), NOTIFY_FOR_THIS_SESSION)
+
+    def watch_cloaking(self):
+        """Ask Windows for cloak/uncloak notices on our window. A cloaked
+        window (on another virtual desktop, say) stays shown and exposed to
+        Qt, yet is not drawn. The hook is out of context: its callback runs
+        on this thread, from the event loop"""
+        if sys.platform != 'win32':
+            return
+        EVENT_OBJECT_CLOAKED, EVENT_OBJECT_UNCLOAKED, OBJID_WINDOW = 0x8017, 0x8018, 0
+        hook_procedure = ctypes.WINFUNCTYPE(None, ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD, ctypes.wintypes.HWND,
+                                            ctypes.wintypes.LONG, ctypes.wintypes.LONG, ctypes.wintypes.DWORD,
+                                            ctypes.wintypes.DWORD)
+
+        def on_cloak_change(hook, event, hwnd, object_id, child_id, thread, timestamp):
+            if hwnd == int(self.winId()) and object_id == OBJID_WINDOW:
+                self.update_animation_suspension()
+        self.cloak_hook_procedure = hook_procedure(on_cloak_change)  # Must outlive the hook
+        user32.SetWinEventHook.restype = ctypes.wintypes.HANDLE
+        user32.SetWinEventHook(EVENT_OBJECT_CLOAKED, EVENT_OBJECT_UNCLOAKED, None, self.cloak_hook_procedure,
+                               os.getpid(), 0, 0)
+
+    def is_cloaked(self):
+        """Whether DWM is keeping the window from being drawn. False where
+        there is no DWM window to ask (other platforms, offscreen)"""
+        if sys.platform != 'win32':
+            return False
+        DWMWA_CLOAKED = 14
+        cloaked = ctypes.wintypes.DWORD()
+        result = ctypes.WinDLL('dwmapi').DwmGetWindowAttribute(
+            ctypes.wintypes.HWND(int(self.winId())), DWMWA_CLOAKED, ctypes.byref(cloaked), ctypes.sizeof(cloaked))
+        return result == 0 and bool(cloaked.value)
+
+    def nativeEvent(self, event_type, message):
+        if sys.platform == 'win32' and event_type == b'windows_generic_MSG':
+            WM_WTSSESSION_CHANGE, WTS_SESSION_LOCK, WTS_SESSION_UNLOCK = 0x02B1, 0x7, 0x8
+            msg = ctypes.wintypes.MSG.from_address(int(message))
+            if msg.message == WM_WTSSESSION_CHANGE and msg.wParam in (WTS_SESSION_LOCK, WTS_SESSION_UNLOCK):
+                self.session_locked = msg.wParam == WTS_SESSION_LOCK
+                self.update_animation_suspension()
+        return super().nativeEvent(event_type, message)
+
+    def update_animation_suspension(self):
+        """Stop every continuous animation and the countdown tick while the
+        window cannot be seen (hidden, minimised, unexposed, cloaked or
+        behind a locked session), so an idle app left open for hours wakes
+        up not once; pick them all up in phase when it shows again. A window
+        merely covered by others keeps animating: Windows leaves it exposed
+        and sends no notice of it"""
+        window = self.windowHandle()
+        visible = self.isVisible() and not self.isMinimized() and not self.session_locked \
+            and window is not None and window.isExposed() and not self.is_cloaked()
+        scheduler = FrameScheduler.instance()
+        if visible:
+            self.quality_governor.start()
+        else:
+            self.quality_governor.stop()
+        if visible and scheduler.suspended_at is not None:
+            scheduler.resume()
+            if not self.exit_timer.isActive():
+                self.start_pulse()  # For a quality change made while out of sight
+            if self.shutdown_epoch:
+                self.countdown_timer.start(1000)
+                self.update_countdown()
+        elif not visible and scheduler.suspended_at is None:
+            scheduler.suspend()
+            if self.shutdown_epoch:
+                self.countdown_timer.stop()
 
     def eventFilter(self, obj, event):
         if event.type() in (QEvent.Type.KeyPress, QEvent.Type.KeyRelease) \
@@ -864,6 +2066,9 @@ class LifeControlButtonApp(QMainWindow):
                 if self.control_button.isEnabled():
                     self.dispatch_shutdown()
             return True
+        if obj is self.windowHandle() and event.type() == QEvent.Type.Expose:
+            self.update_animation_suspension()
+            return False
         if obj is self.time_edit and event.type() == QEvent.Type.KeyPress:
             # The line edit is read-only (caret suppression), so digit entry is
             # re-implemented here instead of the native editor handling it
@@ -883,11 +2088,11 @@ class LifeControlButtonApp(QMainWindow):
             if event.modifiers() == Qt.KeyboardModifier.NoModifier:
                 if event.key() == Qt.Key.Key_Right:
                     self.time_edit.setSelectedSection(QTimeEdit.Section.MinuteSection)
-                    self.refresh_display_glow(flare=True)
+                    self.refresh_time_glow(flare=True)
                     return True
                 if event.key() == Qt.Key.Key_Left:
                     self.time_edit.setSelectedSection(QTimeEdit.Section.HourSection)
-                    self.refresh_display_glow(flare=True)
+                    self.refresh_time_glow(flare=True)
                     return True
         if obj is self.time_edit and event.type() == QEvent.Type.FocusIn \
                 and event.reason() in (Qt.FocusReason.TabFocusReason, Qt.FocusReason.BacktabFocusReason):
@@ -901,61 +2106,110 @@ class LifeControlButtonApp(QMainWindow):
         if obj in (self.time_edit, self.duration_spinbox) \
                 and event.type() in (QEvent.Type.Move, QEvent.Type.Resize):
             # The inputs re-centre after mode switches; keep the overlays anchored
+            self.request_overlay_layout()
+        return super().eventFilter(obj, event)
+
+    def request_overlay_layout(self):
+        """Lay the overlays out once, just before the next frame is painted
+        (event), however many moves, resizes and edits asked for it"""
+        if self.overlays_ready and not self.overlay_layout_pending:
+            self.overlay_layout_pending = True
+            QTimer.singleShot(0, self.layout_overlays)  # In case no frame is due
+
+    def event(self, event):
+        if event.type() != QEvent.Type.UpdateRequest:
+            return super().event(event)
+        # A frame: what it costs to lay out, paint and flush is what the
+        # quality governor weighs. UI-thread CPU time, not wall time: at a
+        # busy logon other processes preempt us mid-frame, and that must not
+        # read as the theme being too costly. Windows books thread time in
+        # scheduler ticks, so single frames read 0 or a whole tick, but over
+        # a governor window the ticks add up to what the frames took
+        start = time.thread_time()
+        self.layout_overlays()
+        handled = super().event(event)
+        self.quality_governor.record((time.thread_time() - start) * 1000)
+        return handled
+
+    def layout_overlays(self):
+        """Place the active mode's overlay labels and hide the other mode's"""
+        if not self.overlay_layout_pending:
+            return
+        self.overlay_layout_pending = False
+        time_mode = self.radio_at_time.isChecked()
+        for label in (self.hour_label, self.colon_label, self.minute_label):
+            label.setVisible(time_mode)
+        if time_mode:
+            self.duration_hour_label.hide()
+            self.duration_minute_label.hide()
             self.layout_time_overlay()
+        else:
             self.layout_duration_overlay()
-        return super().eventFilter(obj, event)
 
     def layout_time_overlay(self):
         """Place the glowing hour/colon/minute layers over the invisible input"""
-        if not self.overlays_ready:
-            return
-        fm = QFontMetrics(self.time_edit.font())
+        metrics = TextMetrics.of(self.time_edit.font())
         text = self.time_edit.text()  # Always HH:mm
         origin = self.time_edit.mapTo(self.card, QPoint(0, 0))
-        x0 = origin.x() + (self.time_edit.width() - fm.horizontalAdvance(text)) // 2
-        y = origin.y() + (self.time_edit.height() - fm.height()) // 2
-        time_mode = self.radio_at_time.isChecked()
-        for label in (self.hour_label, self.colon_label, self.minute_label):
-            label.setVisible(time_mode)
+        x0 = origin.x() + (self.time_edit.width() - metrics.advance(text)) // 2
+        y = origin.y() + (self.time_edit.height() - metrics.height) // 2
         self.hour_label.setText(text[:2])
-        self.hour_label.setGeometry(x0, y, fm.horizontalAdvance(text[:2]) + 2, fm.height())
+        self.hour_label.setGeometry(x0, y, metrics.advance(text[:2]) + 2, metrics.height)
         self.colon_label.setText(':')
-        self.colon_label.setGeometry(x0 + fm.horizontalAdvance(text[:2]), y,
-                                     fm.horizontalAdvance(':') + 2, fm.height())
+        self.colon_label.setGeometry(x0 + metrics.advance(text[:2]), y,
+                                     metrics.advance(':') + 2, metrics.height)
         self.minute_label.setText(text[3:])
-        self.minute_label.setGeometry(x0 + fm.horizontalAdvance(text[:3]), y,
-                                      fm.horizontalAdvance(text[3:]) + 2, fm.height())
+        self.minute_label.setGeometry(x0 + metrics.advance(text[:3]), y,
+                                      metrics.advance(text[3:]) + 2, metrics.height)
 
     def layout_duration_overlay(self):
         """Place the glowing hour/minute layers over the invisible duration input"""
-        if not self.overlays_ready:
-            return
         sb = self.duration_spinbox
-        fm = QFontMetrics(sb.font())
+        metrics = TextMetrics.of(sb.font())
         text = sb.textFromValue(sb.value())
-        if ' h ' in text:
-            hour_text = text[:text.index(' h ') + 2]
-            minute_text = text[text.index(' h ') + 3:]
-        else:
-            hour_text, minute_text = '', text
+        hour_text, minute_text = sb.section_texts()
         origin = sb.mapTo(self.card, QPoint(0, 0))
-        x0 = origin.x() + (sb.width() - fm.horizontalAdvance(text)) // 2
-        y = origin.y() + (sb.height() - fm.height()) // 2
-        duration_mode = not self.radio_at_time.isChecked()
+        x0 = origin.x() + (sb.width() - metrics.advance(text)) // 2
+        y = origin.y() + (sb.height() - metrics.height) // 2
         if hour_text:
             self.duration_hour_label.setText(hour_text)
-            self.duration_hour_label.setGeometry(x0, y, fm.horizontalAdvance(hour_text) + 2, fm.height())
-            minute_x = x0 + fm.horizontalAdvance(text[:len(hour_text) + 1])
+            self.duration_hour_label.setGeometry(x0, y, metrics.advance(hour_text) + 2, metrics.height)
+            minute_x = x0 + metrics.advance(text[:len(hour_text) + 1])
         else:
             minute_x = x0
-        self.duration_hour_label.setVisible(duration_mode and bool(hour_text))
-        self.duration_minute_label.setVisible(duration_mode)
+        self.duration_hour_label.setVisible(bool(hour_text))
+        self.duration_minute_label.setVisible(True)
         self.duration_minute_label.setText(minute_text)
-        self.duration_minute_label.setGeometry(minute_x, y, fm.horizontalAdvance(minute_text) + 2, fm.height())
+        self.duration_minute_label.setGeometry(minute_x, y, metrics.advance(minute_text) + 2, metrics.height)
 
     def on_time_interaction(self):
-        self.layout_time_overlay()
-        self.refresh_display_glow(flare=True)
+        text = self.time_edit.text()  # Always HH:mm
+        if not self.retext_overlay(self.time_edit.font(), ((self.hour_label, text[:2]), (self.minute_label, text[3:]))):
+            self.request_overlay_layout()
+        self.refresh_time_glow(flare=True)
+
+    def on_duration_text(self):
+        sb = self.duration_spinbox
+        hour_text, minute_text = sb.section_texts()
+        if not self.retext_overlay(sb.font(), ((self.duration_hour_label, hour_text),
+                                               (self.duration_minute_label, minute_text))):
+            self.request_overlay_layout()
+
+    def retext_overlay(self, font, sections):
+        """Fast path for a keypress: every display glyph is one width, so a
+        section whose text keeps its length keeps its place, and only the
+        labels whose text changed need it set - no relayout, no waiting on
+        the next frame. False when the layout must be redone instead"""
+        if not self.overlays_ready or self.overlay_layout_pending \
+                or not TextMetrics.of(font).monospaced:
+            return False
+        for label, text in sections:
+            if label.isHidden() != (not text) or (text and len(label.text()) != len(text)):
+                return False
+        for label, text in sections:
+            if text and label.text() != text:
+                label.setText(text)
+        return True
 
     def apply_time_digit(self, digit):
         """Successive digits build up the active section's value, rolling on to
@@ -972,20 +2226,30 @@ class LifeControlButtonApp(QMainWindow):
             self.time_typed_value = None
             if hour_section:
                 self.time_edit.setSelectedSection(QTimeEdit.Section.MinuteSection)
-                self.refresh_display_glow(flare=True)
+                self.refresh_time_glow(flare=True)
         else:
             self.time_typed_value = candidate
 
+    def set_button_mode(self, mode):
+        """Switch the button between its BUTTON_STYLE states: a re-polish
+        against the already parsed sheet, no new style sheet"""
+        if self.control_button.property('mode') != mode:
+            self.control_button.setProperty('mode', mode)
+            self.control_button.style().unpolish(self.control_button)
+            self.control_button.style().polish(self.control_button)
+            self.control_button.update()
+
     def set_label_heat(self, label, colour):
-        label.setStyleSheet(f"color: {colour}; background: transparent;")
+        label.setPalette(text_palette(colour))
 
     def apply_section_glow(self, label, animator, is_active, focused, flare, base, selected, hot, flare_state):
+        """True if the section flared, for the caller to restore its text colour"""
         if is_active and focused:
             if flare:
                 animator.flare_to(flare_state, hot, FLARE_TRANSITION_MS)
                 # Flash the text near-white, then let a plain refresh restore it
                 self.set_label_heat(label, GLOW_TEXT_FLARE)
-                QTimer.singleShot(FLARE_TRANSITION_MS, lambda: self.refresh_display_glow(False))
+                return True
             else:
                 animator.transition_to(*hot, FOCUS_TRANSITION_MS)
                 self.set_label_heat(label, GLOW_TEXT_HOT)
@@ -998,73 +2262,96 @@ class LifeControlButtonApp(QMainWindow):
             # its glow immediately; slow fades are only for losing window focus
             animator.transition_to(*base, SECTION_FADE_MS if flare else FOCUS_TRANSITION_MS)
             self.set_label_heat(label, GLOW_TEXT_BASE)
+        return False
 
     def refresh_display_glow(self, flare=False):
         """The selected section always stands out; focus heats it, keypresses flare it"""
+        self.refresh_time_glow(flare)
+        self.refresh_duration_glow(flare)
+
+    def refresh_time_glow(self, flare=False):
+        """refresh_display_glow for the time sections alone, all a time keypress can change"""
         if not self.overlays_ready:
             return
         time_focused = self.time_edit.hasFocus()
         hour_active = self.time_edit.currentSection() == QTimeEdit.Section.HourSection
-        self.apply_section_glow(self.hour_label, self.hour_glow, hour_active, time_focused, flare,
-                                TIME_GLOW_BASE, TIME_GLOW_SELECTED, TIME_GLOW_HOT, TIME_GLOW_FLARE)
-        self.apply_section_glow(self.minute_label, self.minute_glow, not hour_active, time_focused, flare,
-                                TIME_GLOW_BASE, TIME_GLOW_SELECTED, TIME_GLOW_HOT, TIME_GLOW_FLARE)
-
+        flared = self.apply_section_glow(self.hour_label, self.hour_glow, hour_active, time_focused, flare,
+                                         TIME_GLOW_BASE, TIME_GLOW_SELECTED, TIME_GLOW_HOT, TIME_GLOW_FLARE)
+        flared |= self.apply_section_glow(self.minute_label, self.minute_glow, not hour_active, time_focused, flare,
+                                          TIME_GLOW_BASE, TIME_GLOW_SELECTED, TIME_GLOW_HOT, TIME_GLOW_FLARE)
+        if flared:
+            QTimer.singleShot(FLARE_TRANSITION_MS, self.refresh_time_glow)
+
+    def refresh_duration_glow(self, flare=False):
+        """refresh_display_glow for the duration sections alone"""
+        if not self.overlays_ready:
+            return
         sb = self.duration_spinbox
         duration_focused = sb.hasFocus()
         minutes_active = sb.minutes_section_active or sb.value() < 60
-        self.apply_section_glow(self.duration_hour_label, self.duration_hour_glow,
-                                not minutes_active, duration_focused, flare,
-                                DURATION_GLOW_BASE, DURATION_GLOW_SELECTED, DURATION_GLOW_HOT, DURATION_GLOW_FLARE)
-        self.apply_section_glow(self.duration_minute_label, self.duration_minute_glow,
-                                minutes_active, duration_focused, flare,
-                                DURATION_GLOW_BASE, DURATION_GLOW_SELECTED, DURATION_GLOW_HOT, DURATION_GLOW_FLARE)
+        flared = self.apply_section_glow(self.duration_hour_label, self.duration_hour_glow,
+                                         not minutes_active, duration_focused, flare, DURATION_GLOW_BASE,
+                                         DURATION_GLOW_SELECTED, DURATION_GLOW_HOT, DURATION_GLOW_FLARE)
+        flared |= self.apply_section_glow(self.duration_minute_label, self.duration_minute_glow,
+                                          minutes_active, duration_focused, flare, DURATION_GLOW_BASE,
+                                          DURATION_GLOW_SELECTED, DURATION_GLOW_HOT, DURATION_GLOW_FLARE)
+        if flared:
+            QTimer.singleShot(FLARE_TRANSITION_MS, self.refresh_duration_glow)
 
     def update_input_visibility(self):
         at_time = self.radio_at_time.isChecked()
         self.time_edit.setVisible(at_time)
         self.duration_spinbox.setVisible(not at_time)
         # Qt defers the relayout caused by setVisible to the next event-loop
-        # pass, so without forcing it here the overlays below would be placed
-        # against the input's stale (left-aligned) geometry and visibly jump
-        # to centre a frame later
+        # pass, and the overlay layout may run before it does; without forcing
+        # it here the overlays would be placed against the input's stale
+        # (left-aligned) geometry and visibly jump to centre a frame later
         self.display_container.layout().activate()
         self.mode_sub_label.setText("SHUTDOWN AT" if at_time else "SHUTDOWN IN")
         self.update_mode_visuals()
-        self.layout_time_overlay()
-        self.layout_duration_overlay()
+        self.request_overlay_layout()
         self.refresh_display_glow()
 
     def update_mode_visuals(self):
         for radio, mark, text, row_glow, mark_glow in self.mode_rows:
             checked = radio.isChecked()
             mark.setText("[x]" if checked else "[ ]")
-            mark.setStyleSheet("color: #FB3640;" if checked else "color: rgba(248, 255, 229, 35%);")
-            text.setStyleSheet("color: #F8FFE5;" if checked else "color: rgba(248, 255, 229, 45%);")
+            mark.setPalette(text_palette(MODE_MARK_CHECKED if checked else MODE_MARK_UNCHECKED))
+            text.setPalette(text_palette(MODE_TEXT_CHECKED if checked else MODE_TEXT_UNCHECKED))
             row_glow.setEnabled(checked)
             mark_glow.setEnabled(checked)
 
     def update_card_glow(self, phase):
         alpha = round(CARD_PULSE_ALPHA_MIN + phase * (CARD_PULSE_ALPHA_MAX - CARD_PULSE_ALPHA_MIN))
-        self.card_glow.setColor(QColor(251, 54, 64, alpha))
-
-    def execute_shutdown_command(self, seconds):
-        """Schedule a shutdown, return True if successful and show any error otherwise"""
-        try:
-            result = subprocess.run(['shutdown', '/s', '/t', str(seconds)],
-                                    creationflags=subprocess.CREATE_NO_WINDOW,
-                                    capture_output=True,
-                                    text=True)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to schedule shutdown: {str(e)}")
-            return False
-
-        if result.returncode != 0:
-            details = (result.stderr or result.stdout).strip() or f"shutdown exited with code {result.returncode}"
-            QMessageBox.critical(self, "Error", f"Failed to schedule shutdown:\n{details}")
-            return False
-        save_scheduled_epoch(time.time() + seconds)
-        return True
+        self.card_halo.setColor(QColor(251, 54, 64, alpha))
+
+    def start_pulse(self):
+        """The halo's emberpulse, carrying on in phase if it already runs, or
+        a steady halo at its mid-point when the quality governor has let the
+        pulse go"""
+        if self.quality_governor.level < QUALITY_STATIC_HALO:
+            if self.pulse_animation.state() != QAbstractAnimation.State.Running:
+                self.pulse_animation.start()
+        else:
+            self.pulse_animation.stop()
+            self.update_card_glow(0.5)
+
+    def apply_quality(self, level):
+        """Step the theme to a QUALITY_LEVELS level, down or back up"""
+        slowdown = SLOW_DRIFT_FACTOR if level >= QUALITY_SLOW_DRIFT else 1
+        self.scanline_overlay.set_drift(SCANLINE_DRIFT_MS * slowdown, level < QUALITY_NO_DRIFT)
+        GlowAnimator.baked = level >= QUALITY_BAKED_GLOWS
+        # The celebration holds the halo itself; out of sight, the pulse is
+        # picked up by update_animation_suspension() on the way back
+        if not self.exit_timer.isActive() and FrameScheduler.instance().suspended_at is None:
+            self.start_pulse()
+
+    def execute_shutdown_command(self, seconds, epoch):
+        """Schedule a shutdown, raising on failure, and note its epoch - the
+        one the press worked out, which a resident window counts down to.
+        Runs on the dispatcher's worker thread, so it must not touch any widget"""
+        self.shutdown_backend.schedule(seconds)
+        save_scheduled_epoch(epoch)
 
     def dispatch_shutdown(self):
         if self.radio_at_time.isChecked():
@@ -1074,29 +2361,57 @@ class LifeControlButtonApp(QMainWindow):
 
     def set_shutdown_time(self):
         target_time = self.time_edit.time()
-        now = QTime.currentTime()
-        seconds_until_shutdown = now.secsTo(target_time)
-
-        if seconds_until_shutdown <= 0:
-            seconds_until_shutdown += 86400  # Adjust for next day
-
-        if self.execute_shutdown_command(seconds_until_shutdown):
-            self.celebrate_and_close()
+        self.schedule_shutdown(seconds_until(target_time.hour(), target_time.minute()))
 
     def set_shutdown_after(self):
-        seconds = self.duration_spinbox.value() * 60
+        self.schedule_shutdown(self.duration_spinbox.value() * 60)
+
+    def on_pending_detected(self, epoch):
+        if self.held_press_seconds is not None:
+            self.release_held_press()
+        elif epoch and self.shutdown_epoch is None and self.control_button.isEnabled():
+            self.enter_countdown_mode(epoch)
+
+    def schedule_shutdown(self, seconds):
+        """Celebrate straight away while the command runs in the background;
+        a failure takes the celebration back (on_shutdown_dispatched)"""
+        if not self.pending_detector.answered():
+            # Pressed before the pending-shutdown check came back: hold the
+            # press for its answer, or for PENDING_DETECTION_WAIT_S if it hangs
+            if self.held_press_seconds is None:
+                self.press_hold_timer.start()
+            self.held_press_seconds = seconds
+            return
+        self.schedule_unless_pending(seconds)
 
-        if self.execute_shutdown_command(seconds):
-            self.celebrate_and_close()
+    def release_held_press(self):
+        self.press_hold_timer.stop()
+        seconds, self.held_press_seconds = self.held_press_seconds, None
+        self.schedule_unless_pending(seconds)
+
+    def schedule_unless_pending(self, seconds):
+        pending_epoch = self.pending_detector.epoch
+        if pending_epoch and pending_epoch > time.time() and self.shutdown_epoch is None:
+            self.enter_countdown_mode(pending_epoch)
+            return
+        self.celebrate_and_close()
+        self.dispatched_epoch = int(time.time() + seconds)  # Whole seconds, as the note keeps it
+        self.shutdown_dispatcher.dispatch(self.execute_shutdown_command, seconds, self.dispatched_epoch)
+
+    def on_shutdown_dispatched(self, error):
+        if error is not None:
+            self.restore_idle_visuals()
+            QMessageBox.critical(self, "Error", f"Failed to schedule shutdown:\n{error}")
+            return
+        self.shutdown_scheduled = True
+        self.close_once_scheduled()
 
     def celebrate_and_close(self):
-        """Flash the button, card and scanline texture; hold the moment before the app closes"""
+        """Flash the button, card and scanline texture; hold the moment before
+        the app closes, for as long as the shutdown takes to be scheduled"""
         self.control_button.setEnabled(False)
         self.control_button.setText("LIFE CONTROL REGAINED")
-        self.control_button.setStyleSheet(
-            "QPushButton {background-color: #FB3640; color: #160A0E; border: 2px solid #FB3640; border-radius: 5px; padding: 16px;}"
-            "QPushButton:disabled {background-color: #FB3640; color: #160A0E;}"
-        )
+        self.set_button_mode('regained')
         self.control_button_glow.flare_to(BUTTON_GLOW_FLASH, BUTTON_GLOW_HELD, EXIT_DELAY_MS)
 
         self.pulse_animation.stop()  # Freeze the emberpulse loop so the flare reads clearly
@@ -1104,7 +2419,43 @@ class LifeControlButtonApp(QMainWindow):
 
         self.scanline_overlay.surge(EXIT_DELAY_MS)
 
-        QTimer.singleShot(EXIT_DELAY_MS, self.close)
+        self.exit_timer.start()
+
+    def close_once_scheduled(self):
+        """Close when both the celebration has run its course and the shutdown is in"""
+        if self.shutdown_scheduled and not self.exit_timer.isActive():
+            self.close()
+
+    def closeEvent(self, event):
+        if not self.resident:
+            super().closeEvent(event)
+            return
+        # Stay on standby instead: hidden, every animation suspended (hideEvent)
+        event.ignore()
+        self.settle_for_standby()
+        self.hide()
+
+    def settle_for_standby(self):
+        """Leave the window as the next show should find it: counting down to
+        the shutdown just scheduled, rather than still celebrating it"""
+        if self.shutdown_scheduled:
+            self.shutdown_scheduled = False
+            self.restore_idle_visuals()
+            self.enter_countdown_mode(self.dispatched_epoch)
+
+    def restore_idle_visuals(self):
+        """Take the celebration back: the shutdown could not be scheduled"""
+        self.exit_timer.stop()
+        self.control_button.setEnabled(True)
+        self.control_button.setText("GET LIFE CONTROL")
+        self.set_button_mode('ready')
+        self.control_button_glow.transition_to(*BUTTON_GLOW_BASE, FOCUS_TRANSITION_MS)
+
+        self.card_glow_animator.animation.stop()
+        self.card_halo.setBlurRadius(CARD_PULSE_BLUR)
+        self.start_pulse()
+
+        self.scanline_overlay.calm()
 
     def enter_countdown_mode(self, epoch):
         """A shutdown is already pending: the button becomes a live countdown
@@ -1115,11 +2466,15 @@ class LifeControlButtonApp(QMainWindow):
         self.radio_at_time.setChecked(True)
         self.time_edit.setTime(QTime(scheduled.tm_hour, scheduled.tm_min))
         self.control_button.setEnabled(False)
-        self.control_button.setStyleSheet(BUTTON_STYLE_COUNTDOWN)
-
-        self.countdown_timer = QTimer(self)
-        self.countdown_timer.timeout.connect(self.update_countdown)
-        self.countdown_timer.start(1000)
+        self.set_button_mode('countdown')
+
+        if not hasattr(self, 'countdown_timer'):
+            self.countdown_timer = QTimer(self)
+            self.countdown_timer.timeout.connect(self.update_countdown)
+        # Out of sight (say a resident window on standby), the tick waits for
+        # update_animation_suspension() to start it on the way back
+        if FrameScheduler.instance().suspended_at is None:
+            self.countdown_timer.start(1000)
         self.update_countdown()
 
     def update_countdown(self):
@@ -1136,9 +2491,10 @@ class LifeControlButtonApp(QMainWindow):
         """The shutdown moment passed yet the machine is still up (cancelled outside
         the app), so clear the stale note and hand the button back"""
         self.countdown_timer.stop()
+        self.shutdown_epoch = None
         clear_scheduled_epoch()
         self.control_button.setEnabled(True)
-        self.control_button.setStyleSheet(BUTTON_STYLE_NORMAL)
+        self.set_button_mode('ready')
         self.control_button.setText("GET LIFE CONTROL")
 
     def claim_initial_focus(self, attempts=10):
@@ -1146,13 +2502,22 @@ class LifeControlButtonApp(QMainWindow):
         re-assert activation every half second for a few seconds after launch.
         Windows may still withhold focus (foreground lock) and only flash the
         taskbar entry - there is no polite way around that"""
-        if self.isActiveWindow():
-            return
+        if self.isActiveWindow() or not self.isVisible():
+            return  # Got it, or closed to resident standby meanwhile
         self.raise_()
         self.activateWindow()
         if attempts > 0:
             QTimer.singleShot(500, lambda: self.claim_initial_focus(attempts - 1))
 
+    def come_forward(self):
+        """A later launch asked for the window: bring it back up in front"""
+        if self.resident and not self.isVisible():
+            self.pending_detector.start()  # A shutdown may have been scheduled while on standby
+        if self.isMinimized():
+            self.showNormal()
+        self.show()
+        self.claim_initial_focus()
+
     def center_window_on_primary_monitor(self):
         # Get the primary screen (focused monitor)
         screen = QApplication.primaryScreen()
@@ -1173,6 +2538,276 @@ class LifeControlButtonApp(QMainWindow):
         self.move(frame_geometry.topLeft())
 
 
+def widget_names():
+    """Attribute names the main window keeps its widgets under"""
+    names = {}
+    for window in QApplication.topLevelWidgets():
+        for name, value in vars(window).items():
+            if isinstance(value, QWidget):
+                names[id(value)] = name
+    return names
+
+
+def widget_name(widget, names):
+    """The widget's own name, else its class under the nearest named
+    ancestor (e.g. card/QLabel)"""
+    if sip.isdeleted(widget):
+        return type(widget).__name__
+    name = names.get(id(widget)) or widget.objectName()
+    if name:
+        return name
+    parent = widget.parent()
+    while parent is not None and not (names.get(id(parent)) or parent.objectName()):
+        parent = parent.parent()
+    if parent is None:
+        return type(widget).__name__
+    return f"{widget_name(parent, names)}/{type(widget).__name__}"
+
+
+class FrameProfiler(QObject):
+    """Opt-in (--profile-frames) paint and frame timing for slow machines.
+    Timing wrappers go onto the hot paint and animation methods only when
+    installed, so an ordinary run calls the originals with no overhead.
+    Writes p50/p95/p99 histograms and per-widget repaint counts on quit"""
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.clock = QElapsedTimer()
+        self.clock.start()
+        self.samples = {}
+        self.repaints = {}
+        self.ticked_at = None
+        self.dropped_frames = 0
+        self.key_pressed_at = None
+
+    def now(self):
+        return self.clock.nsecsElapsed() / 1_000_000
+
+    def install(self, app):
+        """Instrument the classes; call before the window is built"""
+        self.wrap(ScanlineOverlay, 'paintEvent', 'scanline_paint_ms')
+        self.wrap(CardHalo, 'paintEvent', 'card_halo_paint_ms')
+        self.wrap(CardCanvas, 'paintEvent', 'card_canvas_paint_ms')
+        self.wrap(CachedGlowEffect, 'draw', 'glow_composite_ms')
+        self.wrap(GlowAnimator, 'apply_frame', 'glow_apply_frame_ms')
+        self.wrap(FrameScheduler, 'tick', 'animation_tick_ms', before=self.on_tick)
+        self.wrap(FrameScheduler, 'add', None, before=self.on_clock_start)
+        self.wrap(FrameScheduler, 'suspend', None, before=self.on_clock_start)
+        # The top-level window gets one UpdateRequest per composed frame
+        self.wrap(LifeControlButtonApp, 'event', 'frame_paint_ms',
+                  when=lambda event: event.type() == QEvent.Type.UpdateRequest, after=self.on_frame)
+        app.installEventFilter(self)
+        app.aboutToQuit.connect(self.write)
+
+    def wrap(self, cls, name, series, before=None, when=None, after=None):
+        original = getattr(cls, name)
+        profiler = self
+
+        @functools.wraps(original)
+        def timed(instance, *args):
+            if before:
+                before(instance, *args)
+            if series is None or (when and not when(*args)):
+                return original(instance, *args)
+            start = profiler.now()
+            try:
+                return original(instance, *args)
+            finally:
+                profiler.record(series, profiler.now() - start)
+                if after:
+                    after(instance, *args)
+        setattr(cls, name, timed)
+
+    def record(self, series, value):
+        self.samples.setdefault(series, []).append(value)
+
+    def on_tick(self, scheduler):
+        # A late tick is a frame the animations never got to show
+        now = self.now()
+        if self.ticked_at is not None:
+            interval = now - self.ticked_at
+            self.record('frame_interval_ms', interval)
+            if interval > FRAME_MS * 1.5:
+                self.dropped_frames += round(interval / FRAME_MS) - 1
+        self.ticked_at = now
+
+    def on_clock_start(self, scheduler, *args):
+        # The clock stops when nothing animates or the window is out of
+        # sight; the gap before it starts again is not a dropped frame
+        if not scheduler.timer.isActive():
+            self.ticked_at = None
+
+    def on_key(self, event):
+        # Timed from the first press not yet on screen; the filter sees a
+        # press again for every parent it propagates to
+        if self.key_pressed_at is None:
+            self.key_pressed_at = self.now()
+            if sys.platform == 'win32':
+                # Windows stamps input with the tick count when it was queued:
+                # how long the press waited before the app got to it
+                self.record('key_queue_ms', (kernel32.GetTickCount() - event.timestamp()) & 0xFFFFFFFF)
+
+    def on_frame(self, window, event):
+        # The window's UpdateRequest flushes the frame to the screen, so it
+        # ends the wait of every press that came before it
+        if self.key_pressed_at is not None:
+            self.record('key_to_paint_ms', self.now() - self.key_pressed_at)
+            self.key_pressed_at = None
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            self.repaints[obj] = self.repaints.get(obj, 0) + 1
+        elif event.type() == QEvent.Type.KeyPress and event.key() in LATENCY_KEYS:
+            self.on_key(event)
+        return False
+
+    def summary(self, values):
+        ordered = sorted(values)
+
+        def percentile(fraction):
+            return round(ordered[max(1, math.ceil(len(ordered) * fraction)) - 1], 3)
+
+        histogram, rest = {}, ordered
+        for bound in PROFILE_BUCKETS_MS:
+            histogram[f'<={bound}'] = sum(1 for value in rest if value <= bound)
+            rest = [value for value in rest if value > bound]
+        histogram[f'>{PROFILE_BUCKETS_MS[-1]}'] = len(rest)
+        return {'count': len(ordered), 'p50': percentile(0.5), 'p95': percentile(0.95),
+                'p99': percentile(0.99), 'max': round(ordered[-1], 3), 'histogram_ms': histogram}
+
+    def write(self):
+        names = widget_names()
+        repaints = {}
+        for widget, count in self.repaints.items():
+            name = widget_name(widget, names)
+            repaints[name] = repaints.get(name, 0) + count
+        report = {'duration_s': round(self.now() / 1000, 3),
+                  'dropped_frames': self.dropped_frames,
+                  'timings': {series: self.summary(values) for series, values in sorted(self.samples.items())},
+                  'repaints': dict(sorted(repaints.items(), key=lambda item: -item[1]))}
+        for window in QApplication.topLevelWidgets():
+            if isinstance(window, LifeControlButtonApp):
+                report['quality'] = window.quality_governor.report()
+        try:
+            with open(self.path, 'w', encoding='utf-8') as profile_file:
+                json.dump(report, profile_file, indent=2)
+        except OSError as error:
+            print(f"Could not write the frame profile to {self.path}: {error}", file=sys.stderr)
+
+
+class EventTracer:
+    """Opt-in (--trace) timeline of what the event loop spent its time on,
+    written as Chrome trace-event JSON (chrome://tracing, ui.perfetto.dev):
+    startup phases, every event delivered and to whom (paints per widget
+    among them), the window's event filter, glow refreshes and overlay
+    layout, each animation's ticks and the shutdown dispatch. Like
+    FrameProfiler, nothing is wrapped and the plain QApplication delivers
+    events unless the flag asks for it"""
+
+    def __init__(self, path):
+        self.path = path
+        self.events = []
+        self.names = {}
+        self.threads = {}
+
+    def now(self):
+        """Microseconds since launch, the trace's time unit"""
+        return (time.perf_counter() - LAUNCHED_AT) * 1_000_000
+
+    def complete(self, name, category, start, args=None):
+        thread = threading.current_thread()
+        self.threads.setdefault(thread.ident, thread.name)
+        event = {'name': name, 'cat': category, 'ph': 'X', 'ts': round(start, 1),
+                 'dur': round(self.now() - start, 1), 'pid': os.getpid(), 'tid': thread.ident}
+        if args:
+            event['args'] = args
+        self.events.append(event)  # Appends are atomic; the dispatch thread records too
+
+    @contextlib.contextmanager
+    def phase(self, name, start=None):
+        """A startup phase, from start (default now) to the end of the block"""
+        start = self.now() if start is None else start
+        try:
+            yield
+        finally:
+            self.complete(name, 'startup', start)
+
+    def name_of(self, obj):
+        return widget_name(obj, self.names)
+
+    def install(self):
+        """Instrument the classes; call before the window is built"""
+        self.wrap(LifeControlButtonApp, 'eventFilter', 'filter',
+                  lambda window, obj, event: (f"eventFilter {event_name(event)}", {'object': self.name_of(obj)}))
+        self.wrap(LifeControlButtonApp, 'refresh_display_glow', 'glow')
+        # Keypresses refresh their own input's glow directly, bypassing refresh_display_glow
+        self.wrap(LifeControlButtonApp, 'refresh_time_glow', 'glow')
+        self.wrap(LifeControlButtonApp, 'refresh_duration_glow', 'glow')
+        self.wrap(LifeControlButtonApp, 'layout_overlays', 'layout')
+        self.wrap(FrameAnimation, 'advance', 'animation',
+                  lambda animation, now: (f"tick {self.name_of(animation_owner(animation))}", None))
+        self.wrap(LifeControlButtonApp, 'schedule_shutdown', 'shutdown')
+        self.wrap(LifeControlButtonApp, 'apply_quality', 'quality',
+                  lambda window, level: (f"quality {QUALITY_LEVELS[level]}", {'level': level}))
+        self.wrap(ShutdownDispatcher, 'run', 'shutdown', lambda dispatcher, command, seconds, epoch:
+                  ("shutdown dispatch", {'seconds': seconds, 'epoch': epoch}))
+
+    def wrap(self, cls, name, category, describe=None):
+        original = getattr(cls, name)
+        tracer = self
+
+        @functools.wraps(original)
+        def traced(instance, *args, **kwargs):
+            label, args_shown = describe(instance, *args) if describe else (name, kwargs or None)
+            start = tracer.now()
+            try:
+                return original(instance, *args, **kwargs)
+            finally:
+                tracer.complete(label, category, start, args_shown)
+        setattr(cls, name, traced)
+
+    def write(self):
+        pid = os.getpid()
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': 'Life Control Button'}}]
+        metadata += [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': ident, 'args': {'name': name}}
+                     for ident, name in self.threads.items()]
+        try:
+            with open(self.path, 'w', encoding='utf-8') as trace_file:
+                json.dump({'traceEvents': metadata + self.events, 'displayTimeUnit': 'ms'}, trace_file)
+        except OSError as error:
+            print(f"Could not write the trace to {self.path}: {error}", file=sys.stderr)
+
+
+class TracingApplication(QApplication):
+    """Times every event delivered, into the tracer. Only ever built for
+    --trace, so an ordinary run never routes an event through Python"""
+
+    def __init__(self, argv, tracer):
+        super().__init__(argv)
+        self.tracer = tracer
+
+    def notify(self, receiver, event):
+        tracer = self.tracer
+        label, name = event_name(event), tracer.name_of(receiver)
+        start = tracer.now()
+        try:
+            return super().notify(receiver, event)
+        finally:
+            tracer.complete(label, 'event', start, {'receiver': name})
+
+
+def event_name(event):
+    kind = event.type()
+    return getattr(kind, 'name', f"QEvent {int(kind)}")
+
+
+def animation_owner(animation):
+    """What an animation moves: the widget under a glow effect, else its parent"""
+    owner = animation.parent()
+    return owner.parent() if isinstance(owner, QGraphicsEffect) else owner
+
+
 if __name__ == "__main__":
     # Self-registration flags: act on the registry and leave before any UI comes up
     if '--install-startup' in sys.argv[1:]:
@@ -1180,16 +2815,51 @@ if __name__ == "__main__":
     if '--uninstall-startup' in sys.argv[1:]:
         sys.exit(uninstall_startup())
 
-    app = QApplication(sys.argv)
+    tracer = None
+    trace_path = flag_value('--trace', TRACE_DEFAULT_PATH)
+    if trace_path:
+        tracer = EventTracer(trace_path)
+        tracer.complete('imports', 'startup', 0.0)  # Everything since launch
+        tracer.install()
+    phase = tracer.phase if tracer else lambda name: contextlib.nullcontext()
+    PREFLIGHT = StartupPreflight(tracer)
 
-    # Set application-wide icon
-    app.setWindowIcon(QIcon(resource_path('assets', 'icon.png')))
+    with phase('QApplication'):
+        app = TracingApplication(sys.argv, tracer) if tracer else QApplication(sys.argv)
 
-    load_bundled_fonts()
+    with phase('load_bundled_fonts'):
+        load_bundled_fonts()
 
-    main_window = LifeControlButtonApp()
+    # Set application-wide icon
+    app.setWindowIcon(app_icon())
+
+    profile_path = flag_value('--profile-frames', PROFILE_DEFAULT_PATH)
+    if profile_path:
+        FrameProfiler(profile_path, app).install(app)
+
+    with phase('build window'):
+        main_window = LifeControlButtonApp()
+    PREFLIGHT.prepare_scanlines(QColor(0, 0, 0, SCANLINE_DOT_ALPHA).rgba(), app.primaryScreen().devicePixelRatio(),
+                                main_window.card.width(), main_window.card.height())
+    if tracer:
+        tracer.names = widget_names()
+        app.aboutToQuit.connect(tracer.write)
+    if '--resident' in sys.argv[1:]:
+        main_window.resident = True
+        app.setQuitOnLastWindowClosed(False)
+    if '--single-canvas' in sys.argv[1:]:
+        main_window.use_single_canvas()
+    if SHUTDOWN_BACKEND_NAME:
+        main_window.shutdown_backend = default_shutdown_backend(SHUTDOWN_BACKEND_NAME)
     main_window.center_window_on_primary_monitor()
 
-    main_window.show()
+    if INSTANCE_LISTENER is not None:
+        instance_server = InstanceServer(INSTANCE_LISTENER, app)
+        instance_server.activation_requested.connect(main_window.come_forward)
+        app.aboutToQuit.connect(instance_server.close)
+        instance_server.start()
+
+    with phase('show'):
+        main_window.show()
     main_window.claim_initial_focus()
     sys.exit(app.exec())
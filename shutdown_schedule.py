@@ -0,0 +1,510 @@
+"""The shutdown schedule, kept free of PyQt6 like single_instance.py: the
+note remembering when the scheduled shutdown fires, the check for one still
+pending, and the backends that schedule it. The window uses all of it; so do
+the headless --schedule-at, --schedule-in and --status flags, which main.py
+hands over before importing Qt, so scripts can push a bedtime in the time it
+takes to start Python"""
+import atexit
+import ctypes
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from datetime import datetime
+
+SCHEDULE_STATE_VERSION = 1  # Bump when the note's fields change
+SCHEDULE_STATE_RENAME_ATTEMPTS = 5
+BOOT_EPOCH_TOLERANCE_S = 30  # The uptime-derived boot time wanders with clock adjustments
+
+if sys.platform == 'win32':
+    import ctypes.wintypes
+
+    kernel32 = ctypes.WinDLL('kernel32')
+
+
+def schedule_state_path():
+    """File remembering when the scheduled shutdown will fire. Windows offers no
+    way to query a pending `shutdown /s /t`, so the app keeps its own note"""
+    base_dir = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    return os.path.join(base_dir, 'LifeControlButton', 'scheduled_shutdown.txt')
+
+
+def encode_schedule_state(epoch, noted_at):
+    state = {'version': SCHEDULE_STATE_VERSION, 'epoch': int(epoch), 'noted_at': noted_at}
+    body = json.dumps(state, sort_keys=True)
+    return json.dumps({**state, 'checksum': zlib.crc32(body.encode('ascii'))}, sort_keys=True)
+
+
+def decode_schedule_state(text, modified_at):
+    """(epoch, noted_at) from the state file's text; ValueError if it is not
+    a whole, intact note. A bare integer is the pre-versioning format, noted
+    when the file was last written"""
+    text = text.strip()
+    if text.isdigit():
+        return int(text), modified_at
+    try:
+        state = json.loads(text)
+        checksum = state.pop('checksum')
+        epoch, noted_at = int(state['epoch']), float(state['noted_at'])
+    except (TypeError, KeyError, AttributeError, json.JSONDecodeError) as error:
+        raise ValueError(f"unreadable schedule state: {error}") from error
+    if state.get('version') != SCHEDULE_STATE_VERSION:
+        raise ValueError(f"unknown schedule state version {state.get('version')!r}")
+    if checksum != zlib.crc32(json.dumps(state, sort_keys=True).encode('ascii')):
+        raise ValueError("schedule state checksum mismatch")
+    return epoch, noted_at
+
+
+def write_file_atomically(path, text):
+    """Write to a temporary sibling, flush it to disk, then rename it over the
+    target: readers see the old note or the new one, never half of either.
+    The rename is retried briefly, as antivirus scanners hold fresh files open"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f'.{os.path.basename(path)}-')
+    try:
+        with os.fdopen(descriptor, 'w', encoding='ascii') as temp_file:
+            temp_file.write(text)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        for attempt in range(SCHEDULE_STATE_RENAME_ATTEMPTS):
+            try:
+                os.replace(temp_path, path)
+                return
+            except PermissionError:
+                if attempt == SCHEDULE_STATE_RENAME_ATTEMPTS - 1:
+                    raise
+                time.sleep(0.05)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+class ScheduleStateStore:
+    """The scheduled-shutdown note. Reads are synchronous (once, at launch);
+    saves and clears are handed to a background writer so a slow or busy
+    disk never stalls the press feedback. Only the latest request matters,
+    so one queued behind a write in progress replaces any older one"""
+
+    def __init__(self, path_function):
+        self.path_function = path_function
+        self.condition = threading.Condition()
+        self.pending = None  # ('save', text) or ('clear',), awaiting the writer
+        self.busy = False
+        self.writer = None
+
+    def load(self):
+        """(epoch, noted_at) of the note on disk, or None if there is none or
+        it is damaged; a damaged note is removed"""
+        self.flush()
+        path = self.path_function()
+        try:
+            with open(path, encoding='ascii') as state_file:
+                text = state_file.read()
+            return decode_schedule_state(text, os.path.getmtime(path))
+        except OSError:
+            return None
+        except (UnicodeDecodeError, ValueError):
+            self.clear()
+            return None
+
+    def save(self, epoch):
+        self.submit(('save', encode_schedule_state(epoch, time.time())))
+
+    def clear(self):
+        self.submit(('clear',))
+
+    def submit(self, request):
+        with self.condition:
+            self.pending = request
+            if self.writer is None:
+                self.writer = threading.Thread(target=self.run, name='schedule-state-writer', daemon=True)
+                self.writer.start()
+            self.condition.notify_all()
+
+    def flush(self, timeout=5.0):
+        """Wait until every requested write has reached the disk"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.pending is None and not self.busy, timeout)
+
+    def run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending is not None)
+                request, self.pending, self.busy = self.pending, None, True
+            try:
+                self.perform(request)
+            finally:
+                with self.condition:
+                    self.busy = False
+                    self.condition.notify_all()
+
+    def perform(self, request):
+        """Best effort only: a failed write must never get in the way of the shutdown"""
+        try:
+            if request[0] == 'save':
+                write_file_atomically(self.path_function(), request[1])
+            else:
+                os.remove(self.path_function())
+        except OSError:
+            pass
+
+
+SCHEDULE_STATE = ScheduleStateStore(schedule_state_path)
+atexit.register(SCHEDULE_STATE.flush)  # The app quits straight after a press
+
+
+def save_scheduled_epoch(epoch):
+    SCHEDULE_STATE.save(epoch)
+
+
+def clear_scheduled_epoch():
+    SCHEDULE_STATE.clear()
+
+
+def last_boot_epoch():
+    """When the current session booted, from the uptime tick counter"""
+    if sys.platform != 'win32':
+        # The boot clock keeps counting through suspend, as the tick count does
+        uptime = time.clock_gettime(time.CLOCK_BOOTTIME) if hasattr(time, 'CLOCK_BOOTTIME') else time.monotonic()
+        return time.time() - uptime
+    kernel32.GetTickCount64.restype = ctypes.c_uint64
+    return time.time() - kernel32.GetTickCount64() / 1000
+
+
+def last_shutdown_epoch():
+    """When the machine last shut down cleanly, from the registry. Catches
+    fast-startup shutdowns, whose hibernated kernel keeps the uptime counter
+    running across the power-off. Elsewhere a shutdown ends the uptime
+    clock too, so the boot time alone tells sessions apart"""
+    if sys.platform != 'win32':
+        return 0.0
+    import winreg
+    try:
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
+                            r'SYSTEM\CurrentControlSet\Control\Windows') as windows_key:
+            filetime = int.from_bytes(winreg.QueryValueEx(windows_key, 'ShutdownTime')[0], 'little')
+    except OSError:
+        return 0.0
+    return filetime / 10_000_000 - 11_644_473_600  # 100 ns ticks since 1601 to Unix epoch
+
+
+def logon_session_id():
+    """The logon session's id (its LUID), new at every logon. Fast startup
+    keeps the uptime counter running across a power-off, so the boot time
+    alone cannot tell one session from the next"""
+    if sys.platform != 'win32':
+        return None
+    advapi32 = ctypes.WinDLL('advapi32')
+    advapi32.OpenProcessToken.argtypes = [ctypes.wintypes.HANDLE, ctypes.wintypes.DWORD,
+                                          ctypes.POINTER(ctypes.wintypes.HANDLE)]
+    kernel32.GetCurrentProcess.restype = ctypes.wintypes.HANDLE
+    kernel32.CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+    token = ctypes.wintypes.HANDLE()
+    if not advapi32.OpenProcessToken(kernel32.GetCurrentProcess(), TOKEN_QUERY, ctypes.byref(token)):
+        return None
+    try:
+        # TOKEN_STATISTICS: TokenId, then AuthenticationId - the logon session
+        statistics = (ctypes.c_uint32 * 14)()
+        returned = ctypes.wintypes.DWORD()
+        if not advapi32.GetTokenInformation(token, TOKEN_STATISTICS_CLASS, statistics,
+                                            ctypes.sizeof(statistics), ctypes.byref(returned)):
+            return None
+    finally:
+        kernel32.CloseHandle(token)
+    return statistics[3] << 32 | statistics[2]
+
+
+def boot_session_path():
+    return os.path.join(os.path.dirname(schedule_state_path()), 'boot_session.json')
+
+
+def session_epochs():
+    """(boot, last shutdown) epochs for this logon session. The shutdown time
+    is a registry read, slow at a busy logon, and cannot change before the
+    next shutdown, so it is remembered for the rest of the session"""
+    boot = last_boot_epoch()
+    session = logon_session_id()
+    if session is None:
+        return boot, last_shutdown_epoch()
+    try:
+        with open(boot_session_path(), encoding='ascii') as session_file:
+            cached = json.load(session_file)
+        # Logon ids restart from scratch after a full reboot, the boot time does not
+        if cached['session'] == session and abs(cached['boot'] - boot) < BOOT_EPOCH_TOLERANCE_S:
+            return boot, float(cached['shutdown'])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    shutdown = last_shutdown_epoch()
+    try:
+        write_file_atomically(boot_session_path(),
+                              json.dumps({'session': session, 'boot': boot, 'shutdown': shutdown}))
+    except OSError:
+        pass
+    return boot, shutdown
+
+
+def load_pending_epoch():
+    """The remembered shutdown moment, if it is still ahead of us; stale or
+    unreadable state is cleared and reported as no pending shutdown. A pending
+    `shutdown /s /t` dies with the session, so a note older than the last boot
+    or shutdown is stale even when its moment has not yet passed"""
+    state = SCHEDULE_STATE.load()
+    if state is None:
+        return None
+    epoch, noted_at = state
+    if epoch <= time.time() or noted_at < max(session_epochs()):
+        clear_scheduled_epoch()
+        return None
+    return epoch
+
+
+class ShutdownError(Exception):
+    """The shutdown could not be scheduled; the message is shown to the user"""
+
+
+SE_SHUTDOWN_NAME = 'SeShutdownPrivilege'
+TOKEN_ADJUST_PRIVILEGES, TOKEN_QUERY, SE_PRIVILEGE_ENABLED = 0x20, 0x8, 0x2
+TOKEN_STATISTICS_CLASS = 10
+# `shutdown /s /t N` with N > 0 implies /f, so match it: close other apps
+# without waiting on them, power off, and log the reason as planned
+SHUTDOWN_FORCE_OTHERS, SHUTDOWN_FORCE_SELF, SHUTDOWN_POWEROFF = 0x1, 0x2, 0x8
+SHTDN_REASON_FLAG_PLANNED = 0x80000000
+
+
+class ShutdownBackend:
+    """How a shutdown gets scheduled: schedule() raises ShutdownError when
+    Windows refuses, abort() cancels a pending one"""
+    name = None
+
+    def schedule(self, seconds):
+        raise NotImplementedError
+
+    def abort(self):
+        raise NotImplementedError
+
+
+class LUID(ctypes.Structure):
+    _fields_ = [('LowPart', ctypes.c_uint32), ('HighPart', ctypes.c_int32)]
+
+
+class LUID_AND_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [('Luid', LUID), ('Attributes', ctypes.c_uint32)]
+
+
+class TOKEN_PRIVILEGES(ctypes.Structure):
+    _fields_ = [('PrivilegeCount', ctypes.c_uint32), ('Privileges', LUID_AND_ATTRIBUTES * 1)]
+
+
+class InitiateShutdownBackend(ShutdownBackend):
+    """Calls InitiateShutdownW in-process: no shutdown.exe to create, start
+    up and have scanned on every press"""
+    name = 'api'
+
+    @staticmethod
+    def available():
+        return sys.platform == 'win32' and hasattr(ctypes.WinDLL('advapi32'), 'InitiateShutdownW')
+
+    def __init__(self):
+        from ctypes import wintypes
+        self.kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        self.kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        self.kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        self.advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+        self.advapi32.OpenProcessToken.argtypes = [wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE)]
+        self.advapi32.LookupPrivilegeValueW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.POINTER(LUID)]
+        self.advapi32.AdjustTokenPrivileges.argtypes = [wintypes.HANDLE, wintypes.BOOL, ctypes.POINTER(TOKEN_PRIVILEGES),
+                                                        wintypes.DWORD, ctypes.c_void_p, ctypes.c_void_p]
+        self.advapi32.InitiateShutdownW.argtypes = [wintypes.LPWSTR, wintypes.LPWSTR, wintypes.DWORD,
+                                                    wintypes.DWORD, wintypes.DWORD]
+        self.advapi32.InitiateShutdownW.restype = wintypes.DWORD
+        self.advapi32.AbortSystemShutdownW.argtypes = [wintypes.LPWSTR]
+        self.privilege_enabled = False
+
+    def raise_last_error(self):
+        error = ctypes.get_last_error()
+        raise ShutdownError(f"{ctypes.FormatError(error).strip()}({error})")
+
+    def enable_shutdown_privilege(self):
+        """Processes hold the shutdown privilege disabled; shutdown.exe
+        switches it on for itself, so this has to as well"""
+        if self.privilege_enabled:
+            return
+        token = ctypes.wintypes.HANDLE()
+        if not self.advapi32.OpenProcessToken(self.kernel32.GetCurrentProcess(),
+                                              TOKEN_ADJUST_PRIVILEGES | TOKEN_QUERY, ctypes.byref(token)):
+            self.raise_last_error()
+        try:
+            privileges = TOKEN_PRIVILEGES(PrivilegeCount=1)
+            privileges.Privileges[0].Attributes = SE_PRIVILEGE_ENABLED
+            if not self.advapi32.LookupPrivilegeValueW(None, SE_SHUTDOWN_NAME, ctypes.byref(privileges.Privileges[0].Luid)):
+                self.raise_last_error()
+            # Succeeds even when the privilege is not held; only the last error tells
+            ctypes.set_last_error(0)
+            self.advapi32.AdjustTokenPrivileges(token, False, ctypes.byref(privileges), 0, None, None)
+            if ctypes.get_last_error():
+                self.raise_last_error()
+        finally:
+            self.kernel32.CloseHandle(token)
+        self.privilege_enabled = True
+
+    def schedule(self, seconds):
+        self.enable_shutdown_privilege()
+        error = self.advapi32.InitiateShutdownW(
+            None, None, int(seconds),
+            SHUTDOWN_FORCE_OTHERS | SHUTDOWN_FORCE_SELF | SHUTDOWN_POWEROFF,
+            SHTDN_REASON_FLAG_PLANNED)
+        if error:
+            raise ShutdownError(f"{ctypes.FormatError(error).strip()}({error})")
+
+    def abort(self):
+        self.enable_shutdown_privilege()
+        if not self.advapi32.AbortSystemShutdownW(None):
+            self.raise_last_error()
+
+
+class ShutdownCommandBackend(ShutdownBackend):
+    """Runs `shutdown /s /t N`, as the app always used to"""
+    name = 'command'
+
+    def run(self, *arguments):
+        result = subprocess.run(['shutdown', *arguments],
+                                creationflags=subprocess.CREATE_NO_WINDOW,
+                                capture_output=True,
+                                text=True)
+        if result.returncode != 0:
+            raise ShutdownError((result.stderr or result.stdout).strip()
+                                or f"shutdown exited with code {result.returncode}")
+
+    def schedule(self, seconds):
+        self.run('/s', '/t', str(seconds))
+
+    def abort(self):
+        self.run('/a')
+
+
+class RecordingBackend(ShutdownBackend):
+    """Schedules nothing, only records the calls: for tests, benchmarks and
+    platforms without a Windows shutdown. Can be made slow or failing"""
+    name = 'record'
+
+    def __init__(self, delay=0.0, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = []
+
+    def schedule(self, seconds):
+        time.sleep(self.delay)
+        self.calls.append(('schedule', seconds))
+        if self.error:
+            raise ShutdownError(self.error)
+
+    def abort(self):
+        self.calls.append(('abort',))
+
+
+SHUTDOWN_BACKENDS = {backend.name: backend
+                     for backend in (InitiateShutdownBackend, ShutdownCommandBackend, RecordingBackend)}
+
+
+def default_shutdown_backend(name=None):
+    """The named backend, else the in-process API where Windows has it, else
+    the shutdown command; elsewhere nothing can be scheduled, so record"""
+    if name:
+        return SHUTDOWN_BACKENDS[name]()
+    if sys.platform != 'win32':
+        return RecordingBackend()
+    if InitiateShutdownBackend.available():
+        return InitiateShutdownBackend()
+    return ShutdownCommandBackend()
+
+
+def flag_value(name, default):
+    """A --name or --name=value command-line flag: None if absent, default if bare"""
+    for argument in sys.argv[1:]:
+        if argument == name:
+            return default
+        if argument.startswith(name + '='):
+            return argument[len(name) + 1:]
+    return None
+
+
+def shutdown_backend_flag():
+    """The --shutdown-backend=NAME flag's name, or None; ValueError if no
+    backend goes by it"""
+    name = flag_value('--shutdown-backend', None)
+    if name is not None and name not in SHUTDOWN_BACKENDS:
+        raise ValueError(f"no shutdown backend {name or '(empty)'}, only {', '.join(SHUTDOWN_BACKENDS)}")
+    return name
+
+
+def invalid_arguments(error):
+    """Reports a malformed flag; returns the exit code for it"""
+    print(f"Invalid arguments: {error}", file=sys.stderr)
+    return 2
+
+
+def seconds_until(hour, minute, now=None):
+    """Seconds from now to the next hour:minute on the clock: tomorrow's, once
+    today's has come"""
+    now = now or datetime.now()
+    seconds = (hour * 60 + minute) * 60 - (now.hour * 3600 + now.minute * 60 + now.second)
+    if seconds <= 0:
+        seconds += 86400  # Adjust for next day
+    return seconds
+
+
+def parse_clock_time(text):
+    """(hour, minute) from HH:MM, 24-hour; ValueError otherwise"""
+    hour, minute = (int(part) for part in text.split(':'))
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"no such time of day: {text}")
+    return hour, minute
+
+
+def print_status(epoch):
+    """The pending shutdown as JSON on stdout: its epoch and the seconds left,
+    both null when there is none"""
+    seconds_left = max(0, round(epoch - time.time())) if epoch else None
+    print(json.dumps({'epoch': epoch, 'seconds_left': seconds_left}))
+
+
+def run_headless():
+    """--status, --schedule-at=HH:MM or --schedule-in=MINUTES (with an optional
+    --shutdown-backend=NAME), as the window would do them. Prints the pending
+    shutdown and returns the exit code: 1 when it could not be scheduled or
+    one was already pending (no cancel here either), 2 on a malformed flag"""
+    at, after = flag_value('--schedule-at', ''), flag_value('--schedule-in', '')
+    try:
+        if at is not None and after is not None:
+            raise ValueError("--schedule-at and --schedule-in are alternatives")
+        if at is not None:
+            seconds = seconds_until(*parse_clock_time(at))
+        elif after is not None:
+            seconds = int(after) * 60
+            if seconds <= 0:
+                raise ValueError(f"--schedule-in takes a positive number of minutes, not {after}")
+        backend = default_shutdown_backend(shutdown_backend_flag())
+    except ValueError as error:
+        return invalid_arguments(error)
+
+    pending_epoch = load_pending_epoch()
+    if at is None and after is None:
+        print_status(pending_epoch)
+        return 0
+    if pending_epoch:
+        print_status(pending_epoch)
+        print("A shutdown is already scheduled", file=sys.stderr)
+        return 1
+    try:
+        backend.schedule(seconds)
+    except ShutdownError as error:
+        print(f"Failed to schedule shutdown:\n{error}", file=sys.stderr)
+        return 1
+    epoch = int(time.time() + seconds)
+    save_scheduled_epoch(epoch)
+    print_status(epoch)
+    return 0
@@ -0,0 +1,163 @@
+"""Single-instance handoff, kept free of PyQt6 (and of every import main.py
+only needs for the UI) so a second launch finds the running window, asks it
+to come forward and leaves within milliseconds. Windows talks over a named
+pipe through _winapi; elsewhere a Unix socket stands in for the pipe, so the
+handoff can be exercised on Linux. QtNetwork is pruned from the build, so
+QLocalServer is not an option"""
+import os
+import sys
+
+ACTIVATE_MESSAGE = b'activate'
+MESSAGE_MAX_BYTES = 64
+CLAIM_ATTEMPTS = 3
+PIPE_BUSY_WAIT_MS = 200
+ERROR_PIPE_BUSY = 231
+ERROR_NO_DATA = 232
+ERROR_PIPE_CONNECTED = 535
+ASFW_ANY = -1
+
+HANDED_OFF = object()  # claim() result: the running instance took over, exit
+
+
+def instance_address():
+    """Per user, so each account on the machine gets its own instance"""
+    if sys.platform == 'win32':
+        return rf"\\.\pipe\LifeControlButton-{os.environ.get('USERNAME', 'user')}"
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or '/tmp'
+    return os.path.join(runtime_dir, f'lifecontrolbutton-{os.getuid()}.sock')
+
+
+class PipeListener:
+    """The running instance's end of the named pipe. The first pipe instance
+    is created with FILE_FLAG_FIRST_PIPE_INSTANCE, so of two launches racing
+    each other only one can claim the name"""
+
+    def __init__(self, address):
+        import _winapi
+        self.winapi = _winapi
+        self.address = address
+        self.handle = self.create_pipe(first=True)
+
+    def create_pipe(self, first=False):
+        winapi = self.winapi
+        return winapi.CreateNamedPipe(
+            self.address,
+            winapi.PIPE_ACCESS_INBOUND | (winapi.FILE_FLAG_FIRST_PIPE_INSTANCE if first else 0),
+            winapi.PIPE_TYPE_MESSAGE | winapi.PIPE_READMODE_MESSAGE | winapi.PIPE_WAIT,
+            winapi.PIPE_UNLIMITED_INSTANCES, 0, MESSAGE_MAX_BYTES, winapi.NMPWAIT_WAIT_FOREVER, winapi.NULL)
+
+    def accept(self):
+        """Block until a later launch connects, and return what it sent"""
+        handle = self.handle
+        try:
+            self.winapi.ConnectNamedPipe(handle, False)
+        except OSError as error:
+            # Connected (or even hung up again) before we started waiting
+            if error.winerror not in (ERROR_PIPE_CONNECTED, ERROR_NO_DATA):
+                raise
+        # Queue up the next pipe instance before letting go of this one: with
+        # no instance left listening, a launch in the gap would think it is first
+        self.handle = self.create_pipe()
+        try:
+            message, _ = self.winapi.ReadFile(handle, MESSAGE_MAX_BYTES)
+            return message
+        except OSError:
+            return b''  # The launch hung up before its message arrived
+        finally:
+            self.winapi.CloseHandle(handle)
+
+    def close(self):
+        self.winapi.CloseHandle(self.handle)
+
+
+class SocketListener:
+    """The Unix socket stand-in for the pipe. A socket file left behind by a
+    crashed instance refuses connections, and is taken over. So does a live
+    one between its bind and listen, so setting up holds a lock file: a
+    refused socket seen under the lock is a dead one"""
+
+    def __init__(self, address):
+        import fcntl
+        import socket
+        self.address = address
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        with open(address + '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)  # Released as it closes, or if we die
+            try:
+                self.socket.bind(address)
+            except OSError:
+                if forward_to_running_instance(b'', address):
+                    self.socket.close()
+                    raise  # Live: another launch claimed it first
+                os.unlink(address)
+                self.socket.bind(address)
+            self.socket.listen()
+
+    def accept(self):
+        """Block until a later launch connects, and return what it sent"""
+        connection, _ = self.socket.accept()
+        with connection:
+            try:
+                return connection.recv(MESSAGE_MAX_BYTES)
+            except OSError:
+                return b''  # The launch hung up before its message arrived
+
+    def close(self):
+        self.socket.close()
+        try:
+            os.unlink(self.address)
+        except OSError:
+            pass
+
+
+def forward_to_running_instance(message=ACTIVATE_MESSAGE, address=None):
+    """Hand the message to the running instance; False when there is none"""
+    address = address or instance_address()
+    if sys.platform != 'win32':
+        import socket
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            try:
+                client.connect(address)
+            except OSError:
+                return False
+            client.sendall(message)
+        return True
+
+    # Windows hands the foreground to whoever the user just launched; pass
+    # that on, or the running window could only flash its taskbar entry
+    import ctypes
+    import _winapi
+    ctypes.windll.user32.AllowSetForegroundWindow(ASFW_ANY)
+    for _ in range(CLAIM_ATTEMPTS):
+        try:
+            pipe = _winapi.CreateFile(address, _winapi.GENERIC_WRITE, 0, _winapi.NULL,
+                                      _winapi.OPEN_EXISTING, 0, _winapi.NULL)
+        except OSError as error:
+            if error.winerror != ERROR_PIPE_BUSY:
+                return False  # No instance running
+            try:
+                _winapi.WaitNamedPipe(address, PIPE_BUSY_WAIT_MS)  # Between pipe instances
+            except OSError:
+                return False
+            continue
+        try:
+            _winapi.WriteFile(pipe, message)
+        finally:
+            _winapi.CloseHandle(pipe)
+        return True
+    return False
+
+
+def claim():
+    """HANDED_OFF once the running instance has been asked to come forward.
+    Otherwise this process is the instance: its listener, or None if the
+    channel could not be set up (the app then runs unguarded, as it used to)"""
+    address = instance_address()
+    for _ in range(CLAIM_ATTEMPTS):
+        if forward_to_running_instance(ACTIVATE_MESSAGE, address):
+            return HANDED_OFF
+        try:
+            return PipeListener(address) if sys.platform == 'win32' else SocketListener(address)
+        except OSError:
+            continue  # Lost a race with a launch starting alongside; hand off to it
+    return None
@@ -13,9 +13,8 @@ from PyQt6.QtGui import QIcon
 import main as m
 
 
-def fake_execute_shutdown_command(seconds):
+def fake_execute_shutdown_command(seconds, epoch):
     print(f"[TEST MODE] Would have run: shutdown /s /t {seconds}  -- not actually run")
-    return True
 
 
 if __name__ == "__main__":